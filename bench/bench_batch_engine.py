@@ -0,0 +1,85 @@
+#  Python Standard Libraries
+import argparse
+import math
+import time
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+import tmns.geo.coordinate as crd
+from tmns.math.integrators import get_integrator
+from tmns.sim.engine import Batch_Engine
+from tmns.sim.motion import Straight_Model
+
+
+def build_models( count, integrator, seed = 1 ):
+    '''
+    Demo-scenario missiles with scattered launch sites, headings and start times.
+    '''
+    rng = np.random.default_rng( seed )
+
+    models = []
+    for _ in range( count ):
+        models.append( Straight_Model( position_geog = np.array( [ -104.844892 + rng.uniform( -2, 2 ),
+                                                                   39.545218 + rng.uniform( -2, 2 ),
+                                                                   1806.0 ] ),
+                                       mass_kg = 900,
+                                       radius_m = 0.25,
+                                       thrust_kN = 107873.15,
+                                       air_mass_density = 1.2,
+                                       drag_coefficient = 0.05,
+                                       pitch_rad = math.radians( rng.uniform( 45, 80 ) ),
+                                       yaw_rad = math.radians( rng.uniform( -180, 180 ) ),
+                                       start_time_offset_sec = float( rng.integers( 0, 10 ) ),
+                                       burn_time_sec = 60,
+                                       integrator = get_integrator( integrator ) ) )
+    return models
+
+
+def run_objects( models, t_max, t_step ):
+
+    start = time.perf_counter()
+    for _ in range( int( round( t_max / t_step ) ) ):
+        for model in models:
+            if not model.is_finished():
+                model.update( t_step )
+    return time.perf_counter() - start
+
+
+def run_batch( models, t_max, t_step ):
+
+    start  = time.perf_counter()
+    engine = Batch_Engine( models )
+    for _ in range( int( round( t_max / t_step ) ) ):
+        engine.update( t_step )
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Per-object motion models versus the batched engine.' )
+    parser.add_argument( '-n', '--counts', type = int, nargs = '+', default = [ 10, 100, 1000, 10000 ] )
+    parser.add_argument( '-t', '--t-max', type = float, default = 60.0 )
+    parser.add_argument( '-s', '--step', type = float, default = 1.0 )
+    parser.add_argument( '-i', '--integrator', default = 'rk4' )
+    parser.add_argument( '--max-object-count', type = int, default = 1000,
+                         help = 'Skip the object engine above this many missiles.' )
+    args = parser.parse_args()
+
+    crd.set_backend( crd.BACKEND_NUMPY )
+
+    print( f'{"missiles":>10}{"object [s]":>12}{"batch [s]":>12}{"speedup":>10}' )
+    for count in args.counts:
+
+        batch = run_batch( build_models( count, args.integrator ), args.t_max, args.step )
+
+        if count <= args.max_object_count:
+            objects = run_objects( build_models( count, args.integrator ), args.t_max, args.step )
+            print( f'{count:>10d}{objects:>12.3f}{batch:>12.3f}{objects / batch:>10.1f}' )
+        else:
+            print( f'{count:>10d}{"-":>12}{batch:>12.3f}{"-":>10}' )
+
+
+if __name__ == '__main__':
+    main()
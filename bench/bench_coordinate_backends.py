@@ -0,0 +1,54 @@
+#  Python Standard Libraries
+import argparse
+import time
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+import tmns.geo.coordinate as crd
+
+
+def rate( func, count ):
+
+    start = time.perf_counter()
+    for _ in range( count ):
+        func()
+    return count / ( time.perf_counter() - start )
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Compare the pyproj and numpy coordinate backends.' )
+    parser.add_argument( '-n', '--count', type = int, default = 20000, help = 'Single-point calls per backend.' )
+    parser.add_argument( '-b', '--batch', type = int, default = 100000, help = 'Points per batch call.' )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng( 0 )
+
+    point_lla = np.array( [[-104.844892], [39.545218], [1806.0]], dtype = np.float64 )
+    point_ecf = crd.geographic_to_ecf( point_lla )
+
+    batch_lla = np.column_stack( [ rng.uniform( -180, 180, args.batch ),
+                                   rng.uniform( -90, 90, args.batch ),
+                                   rng.uniform( -500, 2.0e6, args.batch ) ] )
+    batch_ecf = crd.geographic_to_ecf_many( batch_lla )
+    out       = np.empty_like( batch_lla )
+
+    print( f'{"operation":<28}{"backend":<10}{"rate":>18}' )
+    for backend in ( crd.BACKEND_PYPROJ, crd.BACKEND_NUMPY ):
+
+        fwd = rate( lambda: crd.geographic_to_ecf( point_lla, backend = backend ), args.count )
+        inv = rate( lambda: crd.ecf_to_geographic( point_ecf, backend = backend ), args.count )
+
+        fwd_many = rate( lambda: crd.geographic_to_ecf_many( batch_lla, out = out, backend = backend ), 10 ) * args.batch
+        inv_many = rate( lambda: crd.ecf_to_geographic_many( batch_ecf, out = out, backend = backend ), 10 ) * args.batch
+
+        print( f'{"geographic_to_ecf":<28}{backend:<10}{fwd:>12.0f} call/s' )
+        print( f'{"ecf_to_geographic":<28}{backend:<10}{inv:>12.0f} call/s' )
+        print( f'{"geographic_to_ecf_many":<28}{backend:<10}{fwd_many:>12.0f} pts/s' )
+        print( f'{"ecf_to_geographic_many":<28}{backend:<10}{inv_many:>12.0f} pts/s' )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#  Python Standard Libraries
+import argparse
+import math
+import time
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+import tmns.geo.coordinate as crd
+from tmns.math.integrators import get_integrator
+from tmns.sim.motion import Straight_Model
+
+
+def build_model( integrator ):
+    '''
+    Demo-scenario missile launching at t=0.
+    '''
+    return Straight_Model( position_geog = np.array( [-104.844892, 39.545218, 1806.0] ),
+                           mass_kg = 900,
+                           radius_m = 0.25,
+                           thrust_kN = 107873.15,
+                           air_mass_density = 1.2,
+                           drag_coefficient = 0.05,
+                           pitch_rad = math.radians( 60 ),
+                           yaw_rad = math.radians( -45 ),
+                           start_time_offset_sec = 0,
+                           burn_time_sec = 60,
+                           integrator = integrator )
+
+
+def run( integrator, t_max, t_step ):
+    '''
+    Propagate to t_max and return final ECF position, wall time and derivative evaluations.
+    '''
+    model = build_model( integrator )
+
+    #  Count right-hand-side evaluations
+    evals = [0]
+    derivative = model.derivative
+    def counted( t, y ):
+        evals[0] += 1
+        return derivative( t, y )
+    model.derivative = counted
+
+    start = time.perf_counter()
+    steps = int( round( t_max / t_step ) )
+    for _ in range( steps ):
+        model.update( t_step )
+    elapsed = time.perf_counter() - start
+
+    return model.P_cur.reshape(3), elapsed, evals[0]
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Accuracy and cost of the motion-model integrators.' )
+    parser.add_argument( '-t', '--t-max', type = float, default = 120.0 )
+    parser.add_argument( '-r', '--ref-step', type = float, default = 0.01, help = 'RK4 step of the reference trajectory.' )
+    args = parser.parse_args()
+
+    crd.set_backend( crd.BACKEND_NUMPY )
+
+    reference, ref_time, _ = run( get_integrator( 'rk4' ), args.t_max, args.ref_step )
+    print( f'reference: rk4 dt={args.ref_step}s ({ref_time:.2f} s wall)\n' )
+
+    print( f'{"integrator":<12}{"dt [s]":>8}{"rhs evals":>12}{"wall [s]":>10}{"error [m]":>14}' )
+    cases = [ ( 'euler', 0.05 ), ( 'euler', 0.5 ),
+              ( 'rk4',   0.5 ),  ( 'rk4',   2.0 ), ( 'rk4', 5.0 ), ( 'rk4', 10.0 ),
+              ( 'rk45',  5.0 ),  ( 'rk45', 10.0 ), ( 'rk45', 30.0 ) ]
+
+    for name, t_step in cases:
+        final, elapsed, evals = run( get_integrator( name ), args.t_max, t_step )
+        error = np.linalg.norm( final - reference )
+        print( f'{name:<12}{t_step:>8.2f}{evals:>12d}{elapsed:>10.3f}{error:>14.3f}' )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#  Python Standard Libraries
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+import tmns.io.kml as kml
+
+
+def build_document( points, missiles ):
+    '''
+    A document of per-sample placemarks and one gx:Track per missile, `points` samples in total.
+    '''
+    rng = np.random.default_rng( 1 )
+
+    writer = kml.Writer()
+    per_missile = points // missiles
+
+    for midx in range( missiles ):
+        times = np.arange( per_missile, dtype = np.float64 ) * 0.1
+        geog  = np.column_stack( [ rng.uniform( -105, -104, per_missile ),
+                                   rng.uniform( 39, 40, per_missile ),
+                                   rng.uniform( 0, 1e5, per_missile ) ] )
+
+        folder = kml.Folder( f'Missile: {midx}' )
+        folder.append_node( kml.Placemark( name = f'Track: {midx}',
+                                           geometry = kml.Gx_Track( unix_times = times,
+                                                                    points     = geog,
+                                                                    alt_mode   = kml.Altitude_Mode.ABSOLUTE ) ) )
+
+        #  Half of the samples again as individual placemarks, the deeply nested case
+        for row in range( 0, per_missile, 2 ):
+            folder.append_node( kml.Placemark( name = f'Time: {times[row]}',
+                                               geometry = kml.Point( lon  = geog[row,0],
+                                                                     lat  = geog[row,1],
+                                                                     elev = geog[row,2] ) ) )
+        writer.add_node( folder )
+    return writer
+
+
+def write_string( writer, path ):
+
+    with open( path, 'w' ) as fout:
+        fout.write( writer.to_string() )
+
+
+def write_stream( writer, path ):
+    writer.write( path )
+
+
+def measure( label, func, writer, path ):
+
+    start = time.perf_counter()
+    func( writer, path )
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func( writer, path )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size = os.path.getsize( path )
+    print( f'{label:>12}: {elapsed:8.2f} s, peak {peak / 2**20:8.1f} MiB, file {size / 2**20:8.1f} MiB' )
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Compare building the KML string against streaming it to a file' )
+    parser.add_argument( '--points',   type = int, default = 1000000 )
+    parser.add_argument( '--missiles', type = int, default = 10 )
+    args = parser.parse_args()
+
+    writer = build_document( args.points, args.missiles )
+    print( f'{args.points} points across {args.missiles} missiles' )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join( tmp, 'bench.kml' )
+        measure( 'to_string', write_string, writer, path )
+        measure( 'streaming', write_stream, writer, path )
+
+
+if __name__ == '__main__':
+    main()
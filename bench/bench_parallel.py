@@ -0,0 +1,99 @@
+#  Python Standard Libraries
+import argparse
+import configparser
+import filecmp
+import logging
+import os
+import tempfile
+import time
+import types
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.parallel import run_parallel_simulation
+from tmns.app.trackgen.sim      import run_simulation
+from tmns.sim.missile           import Missile
+
+
+def write_scenario( path, count, integrator, seed = 1 ):
+    '''
+    Demo configuration with `count` missiles scattered in position, heading and launch time.
+    '''
+    Options.generate_config( path )
+
+    cfg_args = configparser.ConfigParser()
+    cfg_args.read( path )
+
+    cfg_args['general']['number_missiles']      = str( count )
+    cfg_args['general']['simulation_time_secs'] = '1500'
+    cfg_args['general']['step_time_ms']         = '1000'
+
+    template = dict( cfg_args['missile_1'] )
+    template['integrator'] = integrator
+
+    rng = np.random.default_rng( seed )
+    for idx in range( count ):
+        section = dict( template )
+        section['id']                        = str( idx + 1 )
+        section['launch_position_longitude'] = str( -104.844892 + rng.uniform( -2, 2 ) )
+        section['launch_yaw_degrees']        = str( rng.uniform( -180, 180 ) )
+        section['start_time_offset_sec']     = str( float( rng.integers( 0, 600 ) ) )
+        cfg_args[f'missile_{idx+1}'] = section
+
+    with open( path, 'w' ) as fout:
+        cfg_args.write( fout )
+
+
+def load_options( path, output_base ):
+
+    cfg_args = Options.parse_config_file( path )
+    cfg_args['general']['output_base'] = output_base
+    return types.SimpleNamespace( cmd_args = types.SimpleNamespace( config_path = path ),
+                                  cfg_args = cfg_args )
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Scaling of trackgen across worker processes.' )
+    parser.add_argument( '-n', '--missiles', type = int, default = 64 )
+    parser.add_argument( '-w', '--max-workers', type = int, default = os.cpu_count() )
+    parser.add_argument( '-i', '--integrator', default = 'rk4' )
+    args = parser.parse_args()
+
+    logger = logging.getLogger( 'bench' )
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        config_path = os.path.join( tmp, 'scenario.cfg' )
+        write_scenario( config_path, args.missiles, args.integrator )
+
+        #  Serial reference, output paths carry their own extension
+        options = load_options( config_path, os.path.join( tmp, 'serial.kml' ) )
+        start   = time.perf_counter()
+        run_simulation( options, Missile.load_configs( options.cfg_args ), logger )
+        serial  = time.perf_counter() - start
+
+        print( f'{args.missiles} missiles, serial: {serial:.2f} s\n' )
+        print( f'{"workers":>8}{"wall [s]":>10}{"speedup":>10}{"identical":>11}' )
+
+        workers = 1
+        while workers <= args.max_workers:
+
+            output_base = os.path.join( tmp, f'workers_{workers}.kml' )
+            options = load_options( config_path, output_base )
+
+            start   = time.perf_counter()
+            run_parallel_simulation( options, workers, logger )
+            elapsed = time.perf_counter() - start
+
+            identical = filecmp.cmp( os.path.join( tmp, 'serial.kml' ), output_base, shallow = False )
+            print( f'{workers:>8d}{elapsed:>10.2f}{serial / elapsed:>10.2f}{str( identical ):>11}' )
+
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
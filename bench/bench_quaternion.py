@@ -0,0 +1,65 @@
+#  Python Standard Libraries
+import argparse
+import math
+import time
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.math.rotations import ( Axis,
+                                  Compact_Quaternion,
+                                  euler_angles_to_rotation_matrix,
+                                  Quaternion )
+
+
+def rate( quat_type, angles ):
+    '''
+    Build a quaternion from Euler angles and convert it to a rotation matrix, per sample.
+    '''
+    start = time.perf_counter()
+    for pitch, roll, yaw in angles:
+        q = quat_type.from_euler_angles( Axis.Y, pitch,
+                                         Axis.X, roll,
+                                         Axis.Z, yaw )
+        q.to_rotation_matrix()
+    return len( angles ) / ( time.perf_counter() - start )
+
+
+def matrix_rate( angles ):
+    '''
+    Build the rotation matrix straight from Euler angles, per sample.
+    '''
+    start = time.perf_counter()
+    for pitch, roll, yaw in angles:
+        euler_angles_to_rotation_matrix( Axis.Y, pitch,
+                                         Axis.X, roll,
+                                         Axis.Z, yaw )
+    return len( angles ) / ( time.perf_counter() - start )
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Benchmark scalar quaternion implementations.' )
+    parser.add_argument( '-n', '--count', type = int, default = 50000 )
+    args = parser.parse_args()
+
+    rng    = np.random.default_rng( 0 )
+    angles = rng.uniform( -math.pi, math.pi, size = (args.count, 3) ).tolist()
+
+    base    = rate( Quaternion, angles )
+    compact = rate( Compact_Quaternion, angles )
+    matrix  = matrix_rate( angles )
+
+    print( 'from_euler_angles + to_rotation_matrix' )
+    print( f'  Quaternion:         {base:12.0f} ops/sec' )
+    print( f'  Compact_Quaternion: {compact:12.0f} ops/sec' )
+    print( f'  speedup:            {compact / base:12.1f}x' )
+
+    print( 'euler_angles_to_rotation_matrix, single angles' )
+    print( f'  rotation matrices:  {matrix:12.0f} ops/sec' )
+    print( f'  speedup:            {matrix / base:12.1f}x' )
+
+
+if __name__ == '__main__':
+    main()
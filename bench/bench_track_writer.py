@@ -0,0 +1,76 @@
+#  Python Standard Libraries
+import argparse
+from collections import namedtuple
+import time
+import tracemalloc
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.app.trackgen.writer import Track_Writer
+
+#  The previous storage: a dict of samples keyed by time for each missile
+Missile_Entry = namedtuple( 'Missile_Entry', [ 'position', 'position_ecf' ] )
+
+
+def fill_dicts( times, ecf, missiles ):
+
+    tracks = {}
+    for midx in range( missiles ):
+        for unix_time, row in zip( times.tolist(), ecf ):
+            tracks.setdefault( midx, {} )[unix_time] = Missile_Entry( None, row.copy() )
+    return tracks
+
+
+def fill_entries( times, ecf, missiles ):
+
+    writer = Track_Writer( 'bench' )
+    for midx in range( missiles ):
+        for unix_time, row in zip( times.tolist(), ecf ):
+            writer.add_missile_entry( midx = midx, unix_time = unix_time, position_ecf = row )
+    return writer
+
+
+def fill_blocks( times, ecf, missiles ):
+
+    writer = Track_Writer( 'bench' )
+    for midx in range( missiles ):
+        writer.add_missile_block( midx = midx, unix_times = times, position_ecf = ecf )
+    return writer
+
+
+def measure( label, func, *args ):
+
+    #  Timed apart from the allocation tracing, which slows small allocations down
+    start = time.perf_counter()
+    func( *args )
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = func( *args )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print( f'{label:>24}: {elapsed:8.3f} s, peak {peak / 2**20:8.1f} MiB' )
+    return result
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Compare Track_Writer storage layouts' )
+    parser.add_argument( '--missiles', type = int, default = 100 )
+    parser.add_argument( '--samples',  type = int, default = 10000 )
+    args = parser.parse_args()
+
+    times = np.arange( args.samples, dtype = np.float64 ) * 0.5
+    ecf   = np.random.default_rng( 1 ).normal( size = (args.samples,3) ) * 6.4e6
+
+    print( f'{args.missiles} missiles x {args.samples} samples' )
+    measure( 'dict of entries', fill_dicts, times, ecf, args.missiles )
+    measure( 'columns, per sample', fill_entries, times, ecf, args.missiles )
+    measure( 'columns, per block', fill_blocks, times, ecf, args.missiles )
+
+
+if __name__ == '__main__':
+    main()
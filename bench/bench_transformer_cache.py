@@ -0,0 +1,55 @@
+#  Python Standard Libraries
+import argparse
+import time
+
+#  Pyproj
+from pyproj import Transformer
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+import tmns.geo.coordinate as crd
+
+
+def geographic_to_ecf_uncached( coord ):
+    '''
+    Baseline: build the PROJ pipeline on every call (pre-registry behavior).
+    '''
+    coord = coord.flatten()
+    transformer = Transformer.from_crs( crd.WGS84_GEOGRAPHIC,
+                                        crd.WGS84_GEOCENTRIC,
+                                        always_xy = True )
+    x, y, z = transformer.transform( coord[0], coord[1], coord[2] )
+    return np.array( [[x],[y],[z]], dtype = np.float64 )
+
+
+def calls_per_sec( func, coord, count ):
+
+    start = time.perf_counter()
+    for _ in range( count ):
+        func( coord )
+    return count / ( time.perf_counter() - start )
+
+
+def main():
+
+    parser = argparse.ArgumentParser( description = 'Benchmark cached vs uncached pyproj transformers.' )
+    parser.add_argument( '-n', '--count', type = int, default = 2000 )
+    args = parser.parse_args()
+
+    coord = np.array( [[-104.844892], [39.545218], [1806.0]], dtype = np.float64 )
+
+    #  Warm the registry so the first construction is not timed
+    crd.geographic_to_ecf( coord )
+
+    before = calls_per_sec( geographic_to_ecf_uncached, coord, args.count )
+    after  = calls_per_sec( crd.geographic_to_ecf, coord, args.count )
+
+    print( f'geographic_to_ecf (uncached): {before:12.1f} calls/sec' )
+    print( f'geographic_to_ecf (cached):   {after:12.1f} calls/sec' )
+    print( f'speedup:                      {after / before:12.1f}x' )
+
+
+if __name__ == '__main__':
+    main()
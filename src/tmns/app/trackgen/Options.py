@@ -51,6 +51,13 @@ class Options:
                              required = False,
                              help = 'Generate config-file at -c path.' )
 
+        #  Parallel workers
+        parser.add_argument( '-w', '--workers',
+                             dest = 'workers',
+                             default = 1,
+                             type = int,
+                             help = 'Number of worker processes to split the missiles across.' )
+
         #  Verbose logging
         parser.add_argument( '-v', '--verbose',
                              dest = 'log_level',
@@ -94,6 +101,18 @@ class Options:
             fout.write( '\n' )
             fout.write( '#  Base path (no extension) for output files\n' )
             fout.write( 'output_base=demo.01\n' )
+            fout.write( '#  Comma-separated output formats (kml, kmz, csv, npy or parquet).  csv is written each tick,\n' )
+            fout.write( '#  the others a missile at a time as it impacts, so memory follows the missiles in flight\n' )
+            fout.write( 'output_formats=kml\n' )
+            fout.write( '#  KML layout of each missile (track, line or points) and seconds between labelled samples (0 none)\n' )
+            fout.write( 'kml_geometry=track\n' )
+            fout.write( 'kml_label_interval_sec=0\n' )
+            fout.write( '#  Image file for labelled and event placemarks, bundled into KMZ (empty for none)\n' )
+            fout.write( 'kml_icon=\n' )
+            fout.write( '#  KMZ deflate level (0 fastest to 9 smallest)\n' )
+            fout.write( 'kmz_compress_level=6\n' )
+            fout.write( '#  Simulation ticks allowed to wait on each output writer\n' )
+            fout.write( 'pipeline_queue_size=8\n' )
             fout.write( '#  Number of missile events\n' )
             fout.write( 'number_missiles=1\n' )
             fout.write( '\n' )
@@ -101,6 +120,14 @@ class Options:
             fout.write( 'start_time_unix=0\n' )
             fout.write( 'simulation_time_secs=500\n' )
             fout.write( 'step_time_ms=500\n' )
+            fout.write( '#  Output samples per second, interpolated between steps (0 samples every step)\n' )
+            fout.write( '#  The cubic between step states adds under 1 mm at 500 ms steps and grows with the step^4 (about 0.5 m at 5 s)\n' )
+            fout.write( 'output_rate_hz=0\n' )
+            fout.write( '\n' )
+            fout.write( '#  Coordinate conversion backend (pyproj or numpy)\n' )
+            fout.write( 'coordinate_backend=pyproj\n' )
+            fout.write( '#  Missile engine (object, or batch to step all missiles together)\n' )
+            fout.write( 'engine=object\n' )
             fout.write( '\n' )
 
             #  Write missile event
@@ -124,6 +151,15 @@ class Options:
             fout.write( 'missile_thrust_kN=107873.15\n' )
             fout.write( 'missile_drag_coefficient=0.05\n' )
             fout.write( 'air_mass_density=1.2\n' )
+            fout.write( '#  Atmosphere model for drag (constant uses air_mass_density, or us1976)\n' )
+            fout.write( 'atmosphere_model=constant\n' )
+            fout.write( '#  Gravity model (constant, point_mass or j2)\n' )
+            fout.write( 'gravity_model=constant\n' )
+            fout.write( '#  Thrust direction (local_frame, launch_frame, velocity_aligned or gravity_turn)\n' )
+            fout.write( 'thrust_direction=local_frame\n' )
+            fout.write( 'gravity_turn_start_sec=5\n' )
+            fout.write( '#  Kepler coast after burnout above this air density (us1976 and point_mass only, 0 disables)\n' )
+            fout.write( 'coast_density_kg_m3=0\n' )
             fout.write( '\n' )
             fout.write( '# Launch Characteristics\n' )
             fout.write( 'launch_pitch_degrees=60\n' )
@@ -131,3 +167,8 @@ class Options:
             fout.write( 'start_time_offset_sec=10\n' )
             fout.write( 'burn_time_sec=60\n' )
             fout.write( '\n' )
+            fout.write( '#  Numerical integrator (euler, rk4 or rk45)\n' )
+            fout.write( 'integrator=euler\n' )
+            fout.write( 'integrator_rtol=1e-6\n' )
+            fout.write( 'integrator_atol=1e-3\n' )
+            fout.write( '\n' )
@@ -4,7 +4,9 @@ import logging
 
 #  Project Libraries
 from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.parallel import run_parallel_simulation
 from tmns.app.trackgen.sim      import run_simulation
+from tmns.geo.coordinate        import ( BACKEND_PYPROJ, set_backend )
 from tmns.sim.missile import Missile
 
 def main():
@@ -14,6 +16,16 @@ def main():
 
     logger = logging.getLogger( 'trackgen' )
 
+    #  Select the coordinate conversion backend
+    set_backend( options.cfg_args.get( 'general', 'coordinate_backend', fallback = BACKEND_PYPROJ ) )
+
+    #  Split the missiles across worker processes, which load their own
+    if options.cmd_args.workers > 1:
+        run_parallel_simulation( options,
+                                 options.cmd_args.workers,
+                                 logger )
+        return
+
     #  Load missile profiles
     missiles = Missile.load_configs( options.cfg_args )
 
@@ -0,0 +1,177 @@
+#  Python Standard Libraries
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import configparser
+from itertools import repeat
+import logging
+
+#  Project Libraries
+from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.pipeline import get_sinks
+from tmns.app.trackgen.sim      import ( record_events,
+                                         simulate_ticks )
+from tmns.app.trackgen.track_buffer import ( max_track_samples,
+                                             Shared_Track_Buffer,
+                                             Track_Buffer_Spec,
+                                             Track_Buffer_Writer )
+from tmns.geo.coordinate        import ( BACKEND_PYPROJ,
+                                         clear_transformer_cache,
+                                         set_backend )
+from tmns.sim.missile           import Missile
+
+#  One missile's result from a worker.  Track arrays travel through shared
+#  memory and are filled in by the parent as views of the buffer.  The finish
+#  tick is the simulation tick the missile impacted in, or None.
+Shard_Track = namedtuple( 'Shard_Track', [ 'index',
+                                           'id',
+                                           'launch_time',
+                                           'unix_times',
+                                           'position_ecf',
+                                           'events',
+                                           'finish_tick' ] )
+
+
+def shard_indices( num_missiles: int, workers: int ):
+    '''
+    Deal missile indices round-robin so staggered launches spread across workers.
+    '''
+    return [ list( range( worker, num_missiles, workers ) ) for worker in range( workers ) ]
+
+
+def init_worker( backend: str ):
+    '''
+    Give each worker its own coordinate caches rather than ones inherited from the parent.
+    '''
+    clear_transformer_cache()
+    set_backend( backend )
+
+
+def config_sections( cfg_args: configparser.ConfigParser ):
+    '''
+    The parsed configuration as plain section dictionaries, which pickle to the
+    workers along with any settings changed after the file was read.
+    '''
+    return { section: dict( cfg_args.items( section, raw = True ) ) for section in cfg_args.sections() }
+
+
+def simulate_shard( sections: dict, indices, buffer_spec: Track_Buffer_Spec ):
+    '''
+    Rebuild the configuration and simulate a subset of the missiles, appending
+    each tick's samples straight to the shared buffer rows of their indices.
+    '''
+    cfg_args = configparser.ConfigParser()
+    cfg_args.read_dict( sections )
+    missiles = Missile.load_configs( cfg_args, indices = indices )
+
+    buffer = Shared_Track_Buffer.attach( buffer_spec )
+    writer = Track_Buffer_Writer( buffer, { missile.id: index for index, missile in zip( indices, missiles ) } )
+
+    finish_ticks = {}
+    for batch in simulate_ticks( cfg_args, missiles, logging.getLogger( 'trackgen' ) ):
+        batch.write_to( writer )
+        for midx in batch.finished:
+            finish_ticks[midx] = batch.tick
+
+    buffer.close()
+
+    return [ Shard_Track( index,
+                          missile.id,
+                          missile.launch_time(),
+                          None,
+                          None,
+                          list( missile.events() ),
+                          finish_ticks.get( missile.id ) )
+             for index, missile in zip( indices, missiles ) ]
+
+
+def merge_tracks( writer, tracks ):
+    '''
+    Add worker tracks to a writer or sink in the order a serial run would have created them.
+
+    A serial run adds a missile on its first sample, visiting missiles in launch order.
+    '''
+    ordered = sorted( ( track for track in tracks if track.unix_times.shape[0] > 0 ),
+                      key = lambda track: ( track.unix_times[0], track.launch_time, track.index ) )
+
+    for track in ordered:
+        writer.add_missile_block( midx = track.id,
+                                  unix_times = track.unix_times,
+                                  position_ecf = track.position_ecf )
+
+
+def write_tracks( sinks,
+                  buffer:          Shared_Track_Buffer,
+                  tracks,
+                  start_time_unix: float ):
+    '''
+    Hand each worker track to the sinks as views of its buffer row, in the
+    order a serial run would have, and close the sinks.  The views are
+    released on return.
+
+    Missiles that impacted are finished by tick, in launch order within a tick,
+    each with its phase events.  The tracks still in flight follow, then their
+    events in configuration order.  Events were logged by the workers.
+    '''
+    merged = [ track._replace( unix_times   = buffer.track( track.index )[0],
+                               position_ecf = buffer.track( track.index )[1] )
+               for track in tracks ]
+
+    finished = sorted( ( track for track in merged if track.finish_tick is not None ),
+                       key = lambda track: ( track.finish_tick, track.launch_time, track.index ) )
+    for track in finished:
+        for sink in sinks:
+            if track.unix_times.shape[0] > 0:
+                sink.add_missile_block( midx = track.id,
+                                        unix_times = track.unix_times,
+                                        position_ecf = track.position_ecf )
+        record_events( sinks, [ ( track.id, track.events ) ], start_time_unix, None )
+        for sink in sinks:
+            sink.finish_missile( track.id )
+
+    in_flight = [ track for track in merged if track.finish_tick is None ]
+    for sink in sinks:
+        merge_tracks( sink, in_flight )
+
+    in_flight.sort( key = lambda track: track.index )
+    record_events( sinks,
+                   [ ( track.id, track.events ) for track in in_flight ],
+                   start_time_unix,
+                   None )
+
+    #  Finish writing to disk
+    for sink in sinks:
+        sink.close()
+
+
+def run_parallel_simulation( config:  Options,
+                             workers: int,
+                             logger:  logging.Logger ):
+    '''
+    Simulate the missiles across a process pool and write the merged output.
+    '''
+    logger.info( f'Starting Simulation with {workers} workers' )
+
+    cfg_args = config.cfg_args
+    shards   = shard_indices( cfg_args.getint( 'general', 'number_missiles' ), workers )
+    backend  = cfg_args.get( 'general', 'coordinate_backend', fallback = BACKEND_PYPROJ )
+
+    #  Workers write their tracks straight into shared memory
+    buffer = Shared_Track_Buffer.create( cfg_args.getint( 'general', 'number_missiles' ),
+                                         max_track_samples( cfg_args ) )
+    try:
+        with ProcessPoolExecutor( max_workers = workers,
+                                  initializer = init_worker,
+                                  initargs = ( backend, ) ) as pool:
+            tracks = [ track for shard in pool.map( simulate_shard,
+                                                    repeat( config_sections( cfg_args ) ),
+                                                    shards,
+                                                    repeat( buffer.spec() ) )
+                             for track in shard ]
+
+        #  Sinks refer to views of the buffer until they are closed
+        write_tracks( get_sinks( cfg_args ),
+                      buffer,
+                      tracks,
+                      cfg_args.getfloat( 'general', 'start_time_unix' ) )
+    finally:
+        buffer.close()
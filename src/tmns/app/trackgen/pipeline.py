@@ -0,0 +1,281 @@
+#  Python Standard Libraries
+import asyncio
+from pathlib import Path
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.app.trackgen.writer import ( KML_TRACK,
+                                        OUTPUT_KML,
+                                        OUTPUT_KMZ,
+                                        OUTPUT_NPY,
+                                        OUTPUT_PARQUET,
+                                        Track_Writer )
+from tmns.geo.coordinate      import ecf_to_geographic_many
+
+#  Streamed output format, alongside the formats written by `Track_Writer`
+OUTPUT_CSV = 'csv'
+
+#  Formats written by `Track_Writer`, a missile at a time as each track finishes
+WRITER_FORMATS = [ OUTPUT_KML, OUTPUT_KMZ, OUTPUT_NPY, OUTPUT_PARQUET ]
+
+
+class Sample_Batch:
+    '''
+    Track samples produced by one simulation tick, kept in the order they were added,
+    along with the phase events and finished tracks of missiles that impacted.
+
+    Accepts the same `add_missile_entry` and `add_missile_event` calls as a
+    `Track_Writer`, so the simulation loop can fill either one.
+    '''
+
+    def __init__( self, tick: int = None ):
+
+        self.tick          = tick
+        self.midx          = []
+        self.unix_times    = []
+        self.positions_ecf = []
+
+        #  (midx, name, unix_time, position_ecf) records, and ids of finished tracks
+        self.events   = []
+        self.finished = []
+
+    def __len__( self ):
+        return len( self.midx )
+
+    def add_missile_entry( self,
+                           midx: str,
+                           unix_time: float,
+                           position = None,
+                           position_ecf = None ):
+
+        if position_ecf is None:
+            raise Exception( 'Sample batches only hold ECF positions' )
+
+        self.midx.append( midx )
+        self.unix_times.append( unix_time )
+        self.positions_ecf.append( position_ecf )
+
+    def add_missile_event( self,
+                           midx: str,
+                           name: str,
+                           unix_time: float,
+                           position_ecf ):
+
+        self.events.append( ( midx, name, unix_time, position_ecf ) )
+
+    def finish_missile( self, midx: str ):
+        '''
+        Mark a missile's track as complete once its samples and events are added.
+        '''
+        self.finished.append( midx )
+
+    def positions( self ):
+        '''
+        Return the samples' ECF positions as an (N,3) array.
+        '''
+        return np.array( self.positions_ecf, dtype = np.float64 ).reshape( -1, 3 )
+
+    def write_to( self, writer ):
+        '''
+        Add the samples to a writer as one block per missile, keeping the
+        order missiles first appear in.
+        '''
+        rows = {}
+        for row, midx in enumerate( self.midx ):
+            rows.setdefault( midx, [] ).append( row )
+
+        unix_times = np.asarray( self.unix_times, dtype = np.float64 )
+        positions  = self.positions()
+        for midx, index in rows.items():
+            writer.add_missile_block( midx = midx,
+                                      unix_times = unix_times[index],
+                                      position_ecf = positions[index] )
+
+
+class Track_Sink:
+    '''
+    Destination for the simulation output.
+
+    Samples arrive as per-tick batches from a serial run, or as whole tracks
+    from a parallel one.  Whole tracks may be views of a shared buffer, which
+    stay valid until the sink is closed.  A missile's phase events arrive once
+    its track is complete, followed by `finish_missile` if it impacted.
+    '''
+
+    def write_batch( self, batch: Sample_Batch ):
+        raise NotImplementedError()
+
+    def add_missile_block( self, midx: str, unix_times, position_ecf ):
+        raise NotImplementedError()
+
+    def add_missile_event( self, midx: str, name: str, unix_time: float, position_ecf ):
+        raise NotImplementedError()
+
+    def finish_missile( self, midx: str ):
+        pass
+
+    def close( self ):
+        pass
+
+
+class Writer_Sink( Track_Sink ):
+    '''
+    Write each of a `Track_Writer`'s formats a missile at a time.
+
+    Tracks are held until the missile impacts, then written to every format
+    and released, so memory follows the missiles in flight rather than the
+    whole run.  Missiles still in flight are written on close.
+    '''
+
+    def __init__( self, output_base: str, formats = ( OUTPUT_KML, ), **writer_options ):
+        self.writer  = Track_Writer( output_base, **writer_options )
+        self.formats = list( formats )
+        self.writer.open_streams( self.formats )
+
+    def write_batch( self, batch: Sample_Batch ):
+
+        batch.write_to( self.writer )
+        for event in batch.events:
+            self.writer.add_missile_event( *event )
+        for midx in batch.finished:
+            self.writer.finish_missile( midx )
+
+    def add_missile_block( self, midx: str, unix_times, position_ecf ):
+        self.writer.add_missile_view( midx = midx,
+                                      unix_times = unix_times,
+                                      position_ecf = position_ecf )
+
+    def add_missile_event( self, midx: str, name: str, unix_time: float, position_ecf ):
+        self.writer.add_missile_event( midx = midx,
+                                       name = name,
+                                       unix_time = unix_time,
+                                       position_ecf = position_ecf )
+
+    def finish_missile( self, midx: str ):
+        self.writer.finish_missile( midx )
+
+    def close( self ):
+        self.writer.write_all( self.formats )
+
+
+class CSV_Sink( Track_Sink ):
+    '''
+    Stream samples to `<output_base>.csv` as they arrive, and phase events to
+    `<output_base>.events.csv`.
+
+    Rows follow the order samples were produced: by tick for a serial run, and
+    grouped by missile for a parallel one.
+    '''
+
+    HEADER = 'unix_time,missile_id,lon,lat,alt,x_ecf,y_ecf,z_ecf\n'
+
+    def __init__( self, output_base: str ):
+
+        base = Path( output_base ).with_suffix( '' )
+
+        self.fout = open( base.with_suffix( '.csv' ), 'w' )
+        self.fout.write( self.HEADER )
+
+        self.events_out = open( base.with_suffix( '.events.csv' ), 'w' )
+        self.events_out.write( 'unix_time,missile_id,event,lon,lat,alt\n' )
+
+    def write_rows( self, midx, unix_times, position_ecf ):
+        '''
+        Convert ECF samples to geographic in one batch and append them.
+        '''
+        if len( unix_times ) == 0:
+            return
+        positions = ecf_to_geographic_many( position_ecf )
+
+        self.fout.writelines( f'{t:.6f},{m},{lla[0]:.9f},{lla[1]:.9f},{lla[2]:.3f},{p[0]:.3f},{p[1]:.3f},{p[2]:.3f}\n'
+                              for t, m, lla, p in zip( unix_times, midx, positions, position_ecf ) )
+
+    def write_batch( self, batch: Sample_Batch ):
+
+        self.write_rows( batch.midx, batch.unix_times, batch.positions() )
+        for event in batch.events:
+            self.add_missile_event( *event )
+
+    def add_missile_block( self, midx: str, unix_times, position_ecf ):
+
+        position_ecf = np.asarray( position_ecf, dtype = np.float64 ).reshape( -1, 3 )
+        self.write_rows( [ midx ] * len( unix_times ), unix_times, position_ecf )
+
+    def add_missile_event( self, midx: str, name: str, unix_time: float, position_ecf ):
+
+        lla = ecf_to_geographic_many( position_ecf )[0]
+        self.events_out.write( f'{unix_time:.6f},{midx},{name},{lla[0]:.9f},{lla[1]:.9f},{lla[2]:.3f}\n' )
+
+    def close( self ):
+        self.fout.close()
+        self.events_out.close()
+
+
+def get_sinks( cfg_args ):
+    '''
+    Build the sinks for the comma-separated `output_formats` setting.
+    '''
+    output_base = cfg_args.get( 'general', 'output_base' )
+    formats     = cfg_args.get( 'general', 'output_formats', fallback = OUTPUT_KML )
+
+    names = [ name.strip() for name in formats.split( ',' ) if name.strip() ]
+    for name in names:
+        if name not in WRITER_FORMATS + [ OUTPUT_CSV ]:
+            raise Exception( f'Unsupported output format: {name}' )
+
+    #  Track formats share one copy of the tracks in flight
+    sinks = []
+    written = [ name for name in names if name in WRITER_FORMATS ]
+    if written:
+        sinks.append( Writer_Sink( output_base,
+                                   written,
+                                   kml_geometry = cfg_args.get( 'general', 'kml_geometry', fallback = KML_TRACK ),
+                                   kml_label_interval_sec = cfg_args.getfloat( 'general', 'kml_label_interval_sec', fallback = 0 ),
+                                   kml_icon = cfg_args.get( 'general', 'kml_icon', fallback = '' ) or None,
+                                   kmz_compress_level = cfg_args.getint( 'general', 'kmz_compress_level', fallback = 6 ) ) )
+    if OUTPUT_CSV in names:
+        sinks.append( CSV_Sink( output_base ) )
+    return sinks
+
+
+async def produce( ticks, queues ):
+    '''
+    Advance the simulation one tick at a time off the event loop, handing each
+    batch to every queue.  A full queue suspends the simulation until its
+    writer catches up.
+    '''
+    while True:
+        batch = await asyncio.to_thread( next, ticks, None )
+        if batch is None:
+            break
+        for queue in queues:
+            await queue.put( batch )
+
+    for queue in queues:
+        await queue.put( None )
+
+
+async def consume( queue: asyncio.Queue, sink: Track_Sink ):
+    '''
+    Write batches from the queue until the end-of-run marker arrives.
+    '''
+    while True:
+        batch = await queue.get()
+        if batch is None:
+            break
+        await asyncio.to_thread( sink.write_batch, batch )
+
+
+async def run_pipeline( ticks, sinks, queue_size: int = 8 ):
+    '''
+    Stream the batches of `ticks` to every sink, with at most `queue_size`
+    batches waiting on each.
+    '''
+    queues = [ asyncio.Queue( maxsize = queue_size ) for _ in sinks ]
+
+    async with asyncio.TaskGroup() as group:
+        group.create_task( produce( ticks, queues ) )
+        for queue, sink in zip( queues, sinks ):
+            group.create_task( consume( queue, sink ) )
@@ -1,53 +1,235 @@
 
 
 #  Python Standard Libraries
+import asyncio
 import logging
+import math
+
+#  Numerical Python
+import numpy as np
 
 #  Project Libraries
 from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.pipeline import ( get_sinks,
+                                         run_pipeline,
+                                         Sample_Batch )
 from tmns.app.trackgen.writer   import Track_Writer
+from tmns.math.interpolation    import hermite
 from tmns.sim.missile           import Missile
+from tmns.sim.scheduler         import Scheduler
 
 
-def run_simulation( config:   Options,
+def sample_times( t_start: float, t_end: float, rate_hz: float ):
+    '''
+    Output times on the global `rate_hz` grid in [t_start, t_end).
+    '''
+    k_start = math.ceil( t_start * rate_hz - 1e-9 )
+    k_end   = math.ceil( t_end * rate_hz - 1e-9 )
+
+    return np.arange( k_start, k_end, dtype = np.float64 ) / rate_hz
+
+
+def write_samples( writer:          Track_Writer,
+                   missile:         Missile,
+                   start:           dict,
+                   t_start:         float,
+                   t_end:           float,
+                   times,
+                   start_time_unix: float ):
+    '''
+    Write a missile's output samples inside one step, interpolated with a cubic
+    Hermite from its states at either end of the step.  Samples on a Kepler
+    coast are propagated exactly.
+    '''
+    end = missile.info()
+
+    #  The step ends early at impact, and starts late at launch
+    if not missile.is_active():
+        t_end = missile.events()[-1].time
+        times = times[ times < t_end ]
+    t_launch = max( t_start, missile.launch_time() )
+
+    positions = np.empty( (times.shape[0],3), dtype = np.float64 )
+
+    #  Before launch the missile sits on the pad
+    on_pad = times < t_launch
+    positions[on_pad] = start['position_ecf']
+
+    #  Phase events inside the step split it, so no cubic spans a thrust cutoff
+    knots = [ ( t_launch, start['position_ecf'], start['velocity_ecf'] ) ]
+    for event in missile.events():
+        if t_launch < event.time < t_end and event.velocity_ecf is not None:
+            knots.append( ( event.time, event.position_ecf, event.velocity_ecf ) )
+    knots.append( ( t_end, end['position_ecf'], end['velocity_ecf'] ) )
+
+    for ( t0, p0, v0 ), ( t1, p1, v1 ) in zip( knots[:-1], knots[1:] ):
+        span = (times >= t0) & (times < t1)
+        if span.any():
+            positions[span], _ = hermite( t0, p0, v0, t1, p1, v1, times[span] )
+
+    #  Samples on the coast conic come from its closed form, in one call
+    model = missile.motion_model
+    if getattr( model, 'coast_epoch', None ) is not None:
+        coast = (times >= max( model.coast_epoch[0], t_launch )) & (times < min( model.coast_exit_time, t_end ))
+        if coast.any():
+            positions[coast], _ = model.coast_states( times[coast] )
+
+    for t, position in zip( times, positions ):
+        writer.add_missile_entry( midx = missile.id,
+                                  unix_time = start_time_unix + t,
+                                  position_ecf = position )
+
+
+def simulate_ticks( cfg_args,
                     missiles: list[Missile],
                     logger:   logging.Logger ):
+    '''
+    Run the missiles through the simulation clock, yielding the track samples of
+    each tick as a `Sample_Batch`.  Ticks without samples are skipped.
 
-    logger.info( 'Starting Simulation' )
+    A missile's phase events come in the batch of the tick it impacts, which
+    also marks its track finished.  Events of missiles still in flight when the
+    clock runs out come in a last batch.
+    '''
+    # Capture the start time
+    t_max  = cfg_args.getfloat( 'general', 'simulation_time_secs' )
+    t_step = cfg_args.getfloat( 'general', 'step_time_ms' ) / 1000.0
 
-    #  Create output track-writer
-    writer = Track_Writer( config.cfg_args.get('general','output_base' ))
+    start_time_unix = cfg_args.getfloat( 'general', 'start_time_unix' )
 
-    # Capture the start time
-    t_cur  = 0
-    t_max  = config.cfg_args.getfloat( 'general', 'simulation_time_secs' )
-    t_step = config.cfg_args.getfloat( 'general', 'step_time_ms' ) / 1000.0
+    #  Output samples are taken every step, or at a fixed rate interpolated between steps
+    output_rate = cfg_args.getfloat( 'general', 'output_rate_hz', fallback = 0 )
 
-    start_time_unix = config.cfg_args.getfloat( 'general', 'start_time_unix' )
+    #  Only missiles between launch and impact are visited
+    scheduler = Scheduler( missiles )
+    finished  = set()
 
     # Start iteration
     iterations = 0
-    while t_cur < t_max:
+    while not scheduler.is_done():
+
+        #  With nothing in flight, jump to the tick whose step holds the next launch
+        if not scheduler.live:
+            iterations = max( iterations, math.ceil( scheduler.next_launch_time() / t_step ) - 1 )
+
+        t_cur = iterations * t_step
+        if t_cur >= t_max:
+            break
 
         logger.debug( f'Start of iteration: {iterations}' )
 
-        #  Iterate over each missile
-        for missile in missiles:
-            
-            #  Get the information about the vehicle
-            info = missile.info()
-            
-            logger.debug( f'Missile:{info['id']}\n', info )
-            writer.add_missile_entry( midx = info['id'],
-                                      unix_time = start_time_unix + t_cur,
-                                      position = info['position'] )
+        scheduler.activate( t_cur, t_cur + t_step )
+
+        batch = Sample_Batch( tick = iterations )
+
+        #  Output sample times falling inside this step
+        times = None
+        if output_rate > 0:
+            times = sample_times( t_cur, min( (iterations + 1) * t_step, t_max ), output_rate )
+
+        #  Record every missile's state before stepping, since a batched
+        #  engine advances all missiles on the first update
+        states = {}
+        if times is None or times.size > 0:
+            for missile in scheduler.live:
+
+                #  Get the information about the vehicle
+                info = missile.info()
+
+                logger.debug( f'Missile:{info["id"]}\n{info}' )
+                if times is None:
+                    batch.add_missile_entry( midx = info['id'],
+                                             unix_time = start_time_unix + t_cur,
+                                             position_ecf = info['position_ecf'] )
+                else:
+                    states[missile.id] = info
+
+        for missile in scheduler.live:
             
             #  update the next time step
             missile.update( t_delta = t_step )
 
-        #  Increment time step
-        t_cur += t_step
+        for missile in scheduler.live:
+            if missile.id in states:
+                write_samples( batch,
+                               missile,
+                               states[missile.id],
+                               t_cur,
+                               (iterations + 1) * t_step,
+                               times,
+                               start_time_unix )
+
+        #  End each finished track exactly at its impact point
+        for missile in scheduler.retire():
+            impact = missile.events()[-1]
+            batch.add_missile_entry( midx = missile.id,
+                                     unix_time = start_time_unix + impact.time,
+                                     position_ecf = impact.position_ecf )
+
+            record_events( [ batch ], [ ( missile.id, missile.events() ) ], start_time_unix, logger )
+            batch.finish_missile( missile.id )
+            finished.add( missile.id )
+
         iterations += 1
 
-    #  Write everything to disk
-    writer.write_all()
\ No newline at end of file
+        if len( batch ) > 0 or batch.finished:
+            yield batch
+
+    #  Phase events of missiles that never impacted
+    batch = Sample_Batch( tick = iterations )
+    record_events( [ batch ],
+                   [ ( missile.id, missile.events() ) for missile in missiles if missile.id not in finished ],
+                   start_time_unix,
+                   logger )
+    if batch.events:
+        yield batch
+
+
+def step_missiles( cfg_args,
+                   missiles: list[Missile],
+                   writer:   Track_Writer,
+                   logger:   logging.Logger ):
+    '''
+    Run the missiles through the simulation clock, adding their track samples to `writer`.
+    '''
+    for batch in simulate_ticks( cfg_args, missiles, logger ):
+        batch.write_to( writer )
+
+
+def record_events( sinks,
+                   missile_events,
+                   start_time_unix: float,
+                   logger:          logging.Logger ):
+    '''
+    Log the phase events of each (missile id, events) pair and add them to every sink.
+    Events already logged where they were simulated are passed without a `logger`.
+    '''
+    for midx, events in missile_events:
+        for event in events:
+            if logger is not None:
+                logger.info( f'Missile {midx}: {event.name} at t={event.time:.3f} s' )
+            for sink in sinks:
+                sink.add_missile_event( midx = midx,
+                                        name = event.name,
+                                        unix_time = start_time_unix + event.time,
+                                        position_ecf = event.position_ecf )
+
+
+def run_simulation( config:   Options,
+                    missiles: list[Missile],
+                    logger:   logging.Logger ):
+
+    logger.info( 'Starting Simulation' )
+
+    #  Create the output sinks
+    sinks = get_sinks( config.cfg_args )
+
+    #  Stream each tick to the sinks while the next one is simulated
+    ticks = simulate_ticks( config.cfg_args, missiles, logger )
+    asyncio.run( run_pipeline( ticks,
+                               sinks,
+                               config.cfg_args.getint( 'general', 'pipeline_queue_size', fallback = 8 ) ) )
+
+    #  Finish writing to disk
+    for sink in sinks:
+        sink.close()
@@ -0,0 +1,147 @@
+#  Python Standard Libraries
+from collections import namedtuple
+import math
+from multiprocessing import shared_memory
+
+#  Numerical Python
+import numpy as np
+
+#  Picklable description used by worker processes to attach to a buffer
+Track_Buffer_Spec = namedtuple( 'Track_Buffer_Spec', [ 'name', 'num_missiles', 'num_samples' ] )
+
+
+def max_track_samples( cfg_args ):
+    '''
+    Upper bound on the samples one missile can add to its track, including the impact sample.
+    '''
+    t_max  = cfg_args.getfloat( 'general', 'simulation_time_secs' )
+    t_step = cfg_args.getfloat( 'general', 'step_time_ms' ) / 1000.0
+    rate   = cfg_args.getfloat( 'general', 'output_rate_hz', fallback = 0 )
+
+    if rate > 0:
+        return math.ceil( t_max * rate ) + 2
+    return math.ceil( t_max / t_step ) + 2
+
+
+class Shared_Track_Buffer:
+    '''
+    Preallocated (missiles x samples x fields) float64 tracks in shared memory.
+
+    Workers write each missile's track into its own row, and the parent reads
+    the rows back as NumPy views without any copy through pickling.  The block
+    starts with an int64 sample count per missile.
+    '''
+
+    FIELDS = [ 'unix_time', 'x_ecf', 'y_ecf', 'z_ecf' ]
+
+    def __init__( self, shm, num_missiles: int, num_samples: int, owner: bool ):
+
+        self.shm          = shm
+        self.num_missiles = num_missiles
+        self.num_samples  = num_samples
+        self.owner        = owner
+
+        self.counts = np.ndarray( (num_missiles,), dtype = np.int64, buffer = shm.buf )
+        self.data   = np.ndarray( (num_missiles, num_samples, len( self.FIELDS )),
+                                  dtype = np.float64,
+                                  buffer = shm.buf,
+                                  offset = self.counts.nbytes )
+
+    @staticmethod
+    def nbytes( num_missiles: int, num_samples: int ):
+        return 8 * num_missiles * (1 + num_samples * len( Shared_Track_Buffer.FIELDS ))
+
+    @staticmethod
+    def create( num_missiles: int, num_samples: int ):
+        '''
+        Allocate a new zeroed buffer owned by the calling process.
+        '''
+        shm = shared_memory.SharedMemory( create = True,
+                                          size = max( 1, Shared_Track_Buffer.nbytes( num_missiles, num_samples ) ) )
+
+        buffer = Shared_Track_Buffer( shm, num_missiles, num_samples, owner = True )
+        buffer.counts[:] = 0
+        return buffer
+
+    @staticmethod
+    def attach( spec: Track_Buffer_Spec ):
+        '''
+        Map a buffer created by another process.
+        '''
+        return Shared_Track_Buffer( shared_memory.SharedMemory( name = spec.name ),
+                                    spec.num_missiles,
+                                    spec.num_samples,
+                                    owner = False )
+
+    def spec( self ):
+        return Track_Buffer_Spec( self.shm.name, self.num_missiles, self.num_samples )
+
+    def write_track( self, index: int, unix_times, position_ecf ):
+        '''
+        Store one missile's (N,) times and (N,3) ECF positions in its row.
+        '''
+        count = len( unix_times )
+        if count > self.num_samples:
+            raise Exception( f'Track of {count} samples exceeds the buffer capacity of {self.num_samples}' )
+
+        self.data[index,:count,0]  = unix_times
+        self.data[index,:count,1:] = position_ecf
+        self.counts[index]         = count
+
+    def append( self, index: int, unix_times, position_ecf ):
+        '''
+        Append (N,) times and (N,3) ECF positions to a row as they are produced.
+        A sample at the time of the last one replaces it, as in `Track_Writer`.
+        '''
+        unix_times = np.asarray( unix_times, dtype = np.float64 ).reshape( -1 )
+        if unix_times.shape[0] == 0:
+            return
+
+        start = int( self.counts[index] )
+        if start > 0 and self.data[index,start-1,0] == unix_times[0]:
+            start -= 1
+
+        end = start + unix_times.shape[0]
+        if end > self.num_samples:
+            raise Exception( f'Track of {end} samples exceeds the buffer capacity of {self.num_samples}' )
+
+        self.data[index,start:end,0]  = unix_times
+        self.data[index,start:end,1:] = np.asarray( position_ecf, dtype = np.float64 ).reshape( -1, 3 )
+        self.counts[index]            = end
+
+    def track( self, index: int ):
+        '''
+        Views of one missile's times and ECF positions.
+        '''
+        count = self.counts[index]
+        return self.data[index,:count,0], self.data[index,:count,1:]
+
+    def close( self ):
+        '''
+        Release the mapping, and free the block if this process created it.
+        Views returned by `track` must not be used afterwards.
+        '''
+        del self.counts
+        del self.data
+
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class Track_Buffer_Writer:
+    '''
+    Writer for a worker's missiles that appends each block of samples straight
+    to the missile's buffer row.  Accepts the `add_missile_block` calls of a
+    `Sample_Batch`, so simulation ticks can be written to it directly.
+    '''
+
+    def __init__( self, buffer: Shared_Track_Buffer, rows: dict ):
+
+        self.buffer = buffer
+
+        #  Buffer row of each missile id
+        self.rows = rows
+
+    def add_missile_block( self, midx: str, unix_times, position_ecf ):
+        self.buffer.append( self.rows[midx], unix_times, position_ecf )
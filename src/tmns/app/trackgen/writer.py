@@ -1,62 +1,502 @@
-
 #  Python Standard Libraries
 from collections import namedtuple
+import math
+import os
 from pathlib import Path
 
+#  Numerical Python
+import numpy as np
+
 #  Project Libraries
+from tmns.geo.coordinate import ecf_to_geographic_many
 import tmns.io.kml as kml
+import tmns.io.tracks as tracks_io
+
+#  Output formats of a run
+OUTPUT_KML     = 'kml'
+OUTPUT_KMZ     = 'kmz'
+OUTPUT_NPY     = 'npy'
+OUTPUT_PARQUET = 'parquet'
+
+#  KML layouts of a missile's samples
+KML_TRACK  = 'track'
+KML_LINE   = 'line'
+KML_POINTS = 'points'
+
+Missile_Event = namedtuple( 'Missile_Event', [ 'name', 'unix_time', 'position_ecf' ] )
+
+
+class Track_Columns:
+    '''
+    One missile's samples as columns of growable NumPy arrays.
+
+    Times are always kept, while geographic [lon, lat, elev] positions, ECF
+    positions and velocities are only allocated once a sample provides them.
+    Values a sample did not provide are NaN, and missing geographic positions
+    are converted from ECF in one batch when first requested.  Capacity
+    doubles as the track grows, and accessors return views that a later
+    append may invalidate.
+    '''
+
+    def __init__( self, capacity: int = 64 ):
+
+        self.count     = 0
+        self.last_time = None
+        self.columns   = { 'unix_time': np.empty( (capacity,), dtype = np.float64 ) }
+
+    @staticmethod
+    def wrap( unix_times, position_ecf ):
+        '''
+        Columns over existing (N,) times and (N,3) ECF positions, without copying.
+        The arrays are only copied if the track later grows.
+        '''
+        track = Track_Columns( capacity = 0 )
+        track.columns   = { 'unix_time': unix_times, 'position_ecf': position_ecf }
+        track.count     = unix_times.shape[0]
+        track.last_time = float( unix_times[-1] ) if track.count > 0 else None
+        return track
+
+    def __len__( self ):
+        return self.count
+
+    def capacity( self ):
+        return self.columns['unix_time'].shape[0]
+
+    def reserve( self, count: int ):
+        '''
+        Grow every column geometrically until it holds `count` samples.
+        '''
+        capacity = self.capacity()
+        if count <= capacity:
+            return
+        capacity = max( capacity, 1 )
+        while capacity < count:
+            capacity *= 2
+
+        for name, column in self.columns.items():
+            grown = np.empty( (capacity,) + column.shape[1:], dtype = np.float64 )
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def column( self, name: str ):
+        '''
+        Return a column by name, allocating it NaN-filled on first use.
+        '''
+        if name not in self.columns:
+            self.columns[name] = np.full( (self.capacity(),3), np.nan, dtype = np.float64 )
+        return self.columns[name]
+
+    def append( self,
+                unix_times,
+                position     = None,
+                position_ecf = None,
+                velocity_ecf = None ):
+        '''
+        Append (N,) times with (N,3) geographic or ECF positions, and optionally (N,3) ECF velocities.
+        A sample at the time of the last one replaces it.
+        '''
+        unix_times = np.asarray( unix_times, dtype = np.float64 ).reshape( -1 )
+        size       = unix_times.shape[0]
+
+        if size == 0:
+            return
+
+        start = self.count
+        if unix_times[0] == self.last_time:
+            start -= 1
+
+        self.reserve( start + size )
+        end = start + size
+
+        self.columns['unix_time'][start:end] = unix_times
+
+        #  Every column is written so rows replaced or reused never keep stale values
+        values = { 'position':     position,
+                   'position_ecf': position_ecf,
+                   'velocity_ecf': velocity_ecf }
+        for name, value in values.items():
+            if value is not None:
+                self.column( name )[start:end] = np.asarray( value, dtype = np.float64 ).reshape( -1, 3 )
+            elif name in self.columns:
+                self.columns[name][start:end] = np.nan
+
+        self.count     = end
+        self.last_time = float( unix_times[-1] )
+
+    def append_sample( self,
+                       unix_time:    float,
+                       position     = None,
+                       position_ecf = None,
+                       velocity_ecf = None ):
+        '''
+        Append a single sample without the array conversions of `append`.
+        '''
+        row = self.count
+        if unix_time == self.last_time:
+            row -= 1
+        if row == self.capacity():
+            self.reserve( row + 1 )
+
+        self.columns['unix_time'][row] = unix_time
+        for name, value in ( ( 'position',     position ),
+                             ( 'position_ecf', position_ecf ),
+                             ( 'velocity_ecf', velocity_ecf ) ):
+            if value is not None:
+                self.column( name )[row] = value
+            elif name in self.columns:
+                self.columns[name][row] = np.nan
+
+        self.count     = row + 1
+        self.last_time = unix_time
+
+    def unix_times( self ):
+        return self.columns['unix_time'][:self.count]
+
+    def positions( self ):
+        '''
+        Geographic positions, converting any samples only given in ECF.
+        '''
+        positions = self.column( 'position' )[:self.count]
+
+        missing = np.isnan( positions[:,0] )
+        if missing.any():
+            positions[missing] = ecf_to_geographic_many( self.column( 'position_ecf' )[:self.count][missing] )
+        return positions
+
+    def positions_ecf( self ):
+        return self.column( 'position_ecf' )[:self.count]
+
+    def velocities_ecf( self ):
+        return self.column( 'velocity_ecf' )[:self.count]
 
-Missile_Entry = namedtuple( 'Missile_Entry', [ 'position' ] )
 
 class Track_Writer:
 
-    def __init__(self, output_base: str ):
+    def __init__( self,
+                  output_base:            str,
+                  kml_geometry:           str   = KML_TRACK,
+                  kml_label_interval_sec: float = 0,
+                  kml_icon:               str   = None,
+                  kmz_compress_level:     int   = 6 ):
         self.output_base = output_base
 
+        #  KML layout of each missile's samples, and spacing of labelled sample placemarks
+        self.kml_geometry           = kml_geometry
+        self.kml_label_interval_sec = kml_label_interval_sec
+
+        #  Optional image for labelled and event placemarks, bundled into KMZ archives
+        self.kml_icon           = kml_icon
+        self.kmz_compress_level = kmz_compress_level
+
         self.missiles = {}
+        self.events   = {}
+
+        #  Open (format, stream) pairs written a missile at a time, see `open_streams`
+        self.streams = []
+
+    def track( self, midx: str ):
+        '''
+        Return a missile's columns, creating them on its first sample.
+        '''
+        track = self.missiles.get( midx )
+        if track is None:
+            track = self.missiles[midx] = Track_Columns()
+        return track
 
     def add_missile_entry( self,
                            midx: str,
                            unix_time: float,
-                           position ):
-        
-        if not midx in self.missiles.keys():
-            self.missiles[midx] = {}
-        
-        self.missiles[midx][unix_time] = Missile_Entry( position )
-        
+                           position = None,
+                           position_ecf = None,
+                           velocity_ecf = None ):
+        '''
+        Add a sample in either geographic [lon, lat, elev] or ECF [x, y, z].
+        ECF samples are converted to geographic in one batch per missile when written.
+        '''
+        if position is None and position_ecf is None:
+            raise Exception( 'Either position or position_ecf must be provided' )
+
+        self.track( midx ).append_sample( unix_time, position, position_ecf, velocity_ecf )
+
+    def add_missile_block( self,
+                           midx: str,
+                           unix_times,
+                           position = None,
+                           position_ecf = None,
+                           velocity_ecf = None ):
+        '''
+        Add a whole track at once from (N,) times and (N,3) geographic or ECF positions.
+        The arrays are copied into the writer's columns.
+        '''
+        if position is None and position_ecf is None:
+            raise Exception( 'Either position or position_ecf must be provided' )
+
+        self.track( midx ).append( unix_times, position, position_ecf, velocity_ecf )
 
+    def add_missile_view( self,
+                          midx: str,
+                          unix_times,
+                          position_ecf ):
+        '''
+        Add a whole track by reference to (N,) times and (N,3) ECF positions, such
+        as views of a shared buffer.  Nothing is copied, so the arrays must stay
+        valid until the writer has been written.
+        '''
+        if midx in self.missiles:
+            self.add_missile_block( midx, unix_times, position_ecf = position_ecf )
+        else:
+            self.missiles[midx] = Track_Columns.wrap( unix_times, position_ecf )
 
-    def write_all(self):
+    def missile_block( self, midx: str ):
+        '''
+        Return views of a missile's track as (N,) times and (N,3) ECF positions.
+        '''
+        track = self.missiles[midx]
 
-        self.write_kml()
+        position_ecf = track.positions_ecf()
+        if np.isnan( position_ecf[:,0] ).any():
+            raise Exception( f'Missile {midx} has samples without ECF positions' )
+
+        return track.unix_times(), position_ecf
+
+    def add_missile_event( self,
+                           midx: str,
+                           name: str,
+                           unix_time: float,
+                           position_ecf ):
+        '''
+        Record a phase event such as launch, burnout or impact.
+        '''
+        self.events.setdefault( midx, [] ).append( Missile_Event( name, unix_time, position_ecf ) )
+
+    def missile_positions( self, midx ):
+        '''
+        Return the geographic positions for a missile as an (N,3) array ordered like its times.
+        '''
+        return self.missiles[midx].positions()
+
+
+    def missile_track( self, midx: str ):
+        '''
+        Return a missile's samples as a `Track` of views.
+        '''
+        track = self.missiles[midx]
+        return tracks_io.Track( midx, track.unix_times(), track.positions(), track.positions_ecf() )
+
+    def tracks( self ):
+        '''
+        Yield each missile's samples as a `Track` of views, in insertion order.
+        '''
+        for midx in self.missiles.keys():
+            yield self.missile_track( midx )
+
+    def missile_event_records( self, midx: str ):
+        return [ ( event.name, event.unix_time, event.position_ecf ) for event in self.events.get( midx, [] ) ]
+
+    def open_streams( self, formats = ( OUTPUT_KML, ) ):
+        '''
+        Open every output so each missile is written by `finish_missile` once its
+        track is complete, and then released.  `write_all` writes the missiles
+        still held and closes the outputs.
+        '''
+        for name in formats:
+            if name == OUTPUT_KML:
+                stream = kml.Stream_Writer( self.output_base,
+                                            kml.Folder( 'missiles' ),
+                                            nodes = self.kml_style_nodes( self.kml_icon ) )
+            elif name == OUTPUT_KMZ:
+                icon_href, files = self.kmz_files()
+                stream = kml.Stream_Writer( self.output_base,
+                                            kml.Folder( 'missiles' ),
+                                            nodes = self.kml_style_nodes( icon_href ),
+                                            kmz = True,
+                                            compresslevel = self.kmz_compress_level,
+                                            files = files )
+            elif name == OUTPUT_NPY:
+                stream = tracks_io.Npy_Track_Stream( str( Path( self.output_base ).with_suffix( '.tracks' ) ) )
+            elif name == OUTPUT_PARQUET:
+                stream = tracks_io.Parquet_Track_Stream( str( Path( self.output_base ).with_suffix( '.parquet' ) ) )
+            else:
+                raise Exception( f'Unsupported output format: {name}' )
+            self.streams.append( ( name, stream ) )
+
+    def finish_missile( self, midx: str ):
+        '''
+        Write a missile to the open outputs and drop its samples and events.
+        Missiles with events but no samples are dropped, as when writing the whole run.
+        '''
+        if midx in self.missiles:
+
+            for name, stream in self.streams:
+                if name in ( OUTPUT_KML, OUTPUT_KMZ ):
+                    stream.add_node( self.kml_missile_folder( midx, self.kml_style_url() ) )
+                elif name == OUTPUT_NPY:
+                    stream.write_track( self.missile_track( midx ), self.missile_event_records( midx ) )
+                else:
+                    stream.write_track( self.missile_track( midx ) )
+
+            del self.missiles[midx]
+
+        self.events.pop( midx, None )
+
+    def write_all( self, formats = ( OUTPUT_KML, ) ):
+        '''
+        Write every format.  Outputs opened by `open_streams` are finished with
+        the missiles still held, in insertion order, and closed.
+        '''
+        if self.streams:
+            for midx in list( self.missiles.keys() ):
+                self.finish_missile( midx )
+            for name, stream in self.streams:
+                stream.close()
+            formats = [ name for name in formats if name not in dict( self.streams ) ]
+            self.streams = []
+
+        for name in formats:
+            if name == OUTPUT_KML:
+                self.write_kml()
+            elif name == OUTPUT_KMZ:
+                self.write_kmz()
+            elif name == OUTPUT_NPY:
+                self.write_npy()
+            elif name == OUTPUT_PARQUET:
+                self.write_parquet()
+            else:
+                raise Exception( f'Unsupported output format: {name}' )
+
+    def write_npy( self ):
+        '''
+        Write memory-mappable arrays to the `<output_base>.tracks` directory.
+        '''
+        tracks_io.write_npy_tracks( str( Path( self.output_base ).with_suffix( '.tracks' ) ),
+                                    self.tracks(),
+                                    { midx: self.missile_event_records( midx ) for midx in self.events.keys() } )
+
+    def write_parquet( self ):
+        '''
+        Write a Parquet dataset partitioned by missile to `<output_base>.parquet`.
+        '''
+        tracks_io.write_parquet_tracks( str( Path( self.output_base ).with_suffix( '.parquet' ) ),
+                                        self.tracks() )
     
-    def write_kml(self):
+    def kml_sample_nodes( self, midx, style_url = None ):
+        '''
+        Build the KML nodes for a missile's samples: one track or line placemark,
+        with sparse labelled points, or a placemark per sample.
+        '''
+        times     = self.missiles[midx].unix_times()
+        positions = self.missile_positions( midx )
+
+        if self.kml_geometry == KML_POINTS:
+            return [ kml.Placemark( f'Time: {unix_time}',
+                                    geometry = kml.Point( lon      = position[0],
+                                                          lat      = position[1],
+                                                          elev     = position[2],
+                                                          alt_mode = kml.Altitude_Mode.ABSOLUTE ) )
+                     for unix_time, position in zip( times.tolist(), positions ) ]
+
+        if self.kml_geometry == KML_TRACK:
+            geometry = kml.Gx_Track( unix_times = times,
+                                     points     = positions,
+                                     alt_mode   = kml.Altitude_Mode.ABSOLUTE )
+        elif self.kml_geometry == KML_LINE:
+            geometry = kml.Line_String( points   = positions,
+                                        alt_mode = kml.Altitude_Mode.ABSOLUTE )
+        else:
+            raise Exception( f'Unsupported KML geometry: {self.kml_geometry}' )
+
+        nodes = [ kml.Placemark( name = f'Track: {midx}', geometry = geometry ) ]
+
+        #  Label the first sample at or after each multiple of the interval
+        if self.kml_label_interval_sec > 0 and times.shape[0] > 0:
+            marks = np.arange( math.ceil( times[0] / self.kml_label_interval_sec ),
+                               math.floor( times[-1] / self.kml_label_interval_sec ) + 1 ) * self.kml_label_interval_sec
+            for row in np.unique( np.searchsorted( times, marks ) ).tolist():
+                nodes.append( kml.Placemark( name     = f'Time: {times[row]}',
+                                             styleUrl = style_url,
+                                             geometry = kml.Point( lon      = positions[row,0],
+                                                                   lat      = positions[row,1],
+                                                                   elev     = positions[row,2],
+                                                                   alt_mode = kml.Altitude_Mode.ABSOLUTE ) ) )
+        return nodes
+
+    def kml_style_url( self ):
+        return '#missile' if self.kml_icon is not None else None
+
+    def kml_style_nodes( self, icon_href = None ):
+        '''
+        Shared style for labelled and event placemarks, when an icon is given.
+        '''
+        if icon_href is None:
+            return []
+        return [ kml.Style( id = 'missile', icon_style = kml.Icon_Style( icon = icon_href ) ) ]
+
+    def kml_missile_folder( self, midx, style_url = None ):
+        '''
+        Build a missile's folder of sample nodes and phase event placemarks.
+        '''
+        missile_folder = kml.Folder( f'Missile: {midx}' )
+
+        for node in self.kml_sample_nodes( midx, style_url ):
+            missile_folder.append_node( node )
+
+        #  Phase events
+        for event in self.events.get( midx, [] ):
 
+            position = ecf_to_geographic_many( event.position_ecf )[0]
+            coord = kml.Point( lon      = position[0],
+                               lat      = position[1],
+                               elev     = position[2],
+                               alt_mode = kml.Altitude_Mode.ABSOLUTE )
+
+            point = kml.Placemark( name     = f'{event.name}: {event.unix_time}',
+                                   styleUrl = style_url,
+                                   geometry = coord )
+            missile_folder.append_node( point )
+
+        return missile_folder
+
+    def kml_document( self, icon_href = None ):
+        '''
+        Build the KML document, styling labelled and event placemarks with
+        `icon_href` when one is given.
+        '''
         #  Create KML writer
         writer = kml.Writer()
 
+        for node in self.kml_style_nodes( icon_href ):
+            writer.add_node( node )
+        style_url = '#missile' if icon_href is not None else None
+
         #  Append all launch nodes
         missiles_dir = kml.Folder( 'missiles' )
 
         for midx in self.missiles.keys():
-            
-            missile_folder = kml.Folder( f'Missile: {midx}' )
+            missiles_dir.append_node( self.kml_missile_folder( midx, style_url ) )
 
-            for unix_time in self.missiles[midx].keys():
+        writer.add_node( missiles_dir )
 
-                coord = kml.Point( lon      = self.missiles[midx][unix_time].position[0],
-                                   lat      = self.missiles[midx][unix_time].position[1],
-                                   elev     = self.missiles[midx][unix_time].position[2],
-                                   alt_mode = kml.Altitude_Mode.ABSOLUTE )
-                
-                point = kml.Placemark( f'Time: {unix_time}',
-                                       geometry = coord )
-                missile_folder.append_node( point )
+        return writer
 
-            missiles_dir.append_node( missile_folder )
-                
+    def write_kml(self):
 
-        writer.add_node( missiles_dir )
+        self.kml_document( self.kml_icon ).write( self.output_base )
+
+    def write_kmz(self):
+        '''
+        Write the KML document compressed into `<output_base>.kmz`, with the icon bundled.
+        '''
+        icon_href, files = self.kmz_files()
+
+        self.kml_document( icon_href ).write_kmz( self.output_base,
+                                                  compresslevel = self.kmz_compress_level,
+                                                  files = files )
 
-        writer.write( self.output_base )
\ No newline at end of file
+    def kmz_files( self ):
+        '''
+        Return the icon's path inside a KMZ archive and the files to bundle.
+        '''
+        if self.kml_icon is None:
+            return None, {}
+        icon_href = 'files/' + os.path.basename( self.kml_icon )
+        return icon_href, { icon_href: self.kml_icon }
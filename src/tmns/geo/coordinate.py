@@ -1,35 +1,117 @@
 
 #  Python Standard Libraries
+from collections import namedtuple
+import functools
 import logging
+import threading
 
 #  Pyproj
 from pyproj import CRS
 from pyproj import Transformer
-from pyproj.aoi import AreaOfInterest
-from pyproj.database import query_utm_crs_info
 
 #  Numerical Python
 import numpy as np
 
+#  Project Libraries
+from tmns.geo import wgs84
+
+#  WGS84 Coordinate Reference Systems
+WGS84_GEOGRAPHIC = { 'proj':  'latlong',
+                     'ellps': 'WGS84',
+                     'datum': 'WGS84' }
+
+WGS84_GEOCENTRIC = { 'proj':  'geocent',
+                     'ellps': 'WGS84',
+                     'datum': 'WGS84' }
+
+#  UTM zone description
+UTM_Zone = namedtuple( 'UTM_Zone', [ 'zone', 'north', 'epsg' ] )
+
+#  Process-wide transformer registry.  Transformers are thread-safe in pyproj>=3.1,
+#  so the lock only guards construction and insertion.
+_transformer_cache = {}
+_transformer_lock  = threading.Lock()
+
+
+def _crs_key( crs ):
+    '''
+    Build a hashable registry key from a CRS definition.
+    '''
+    if isinstance( crs, dict ):
+        return tuple( sorted( crs.items() ) )
+    return crs
+
+
+def get_transformer( crs_from, crs_to, **options ):
+    '''
+    Return a cached `Transformer` for the CRS pair and `Transformer.from_crs` options.
+    The pipeline is only constructed the first time a given key is requested.
+    '''
+    key = ( _crs_key( crs_from ),
+            _crs_key( crs_to ),
+            tuple( sorted( options.items() ) ) )
+
+    transformer = _transformer_cache.get( key )
+    if transformer is None:
+        with _transformer_lock:
+            transformer = _transformer_cache.get( key )
+            if transformer is None:
+                transformer = Transformer.from_crs( crs_from, crs_to, **options )
+                _transformer_cache[key] = transformer
+
+    return transformer
+
+
+def clear_transformer_cache():
+    '''
+    Drop all cached transformers (e.g. after forking a worker process).
+    '''
+    with _transformer_lock:
+        _transformer_cache.clear()
+
+
+#  Conversion backends.  `pyproj` runs the full PROJ pipeline, `numpy` uses the
+#  closed-form WGS84 equations in `tmns.geo.wgs84`.
+BACKEND_PYPROJ = 'pyproj'
+BACKEND_NUMPY  = 'numpy'
+
+_backend = BACKEND_PYPROJ
+
+
+def set_backend( backend: str ):
+    '''
+    Select the default backend used by the geographic/ECF conversions.
+    '''
+    global _backend
+
+    if not backend in ( BACKEND_PYPROJ, BACKEND_NUMPY ):
+        raise Exception( f'Unsupported coordinate backend: {backend}' )
+    _backend = backend
+
+
+def get_backend():
+    return _backend
+
 
 def geographic_to_ecf( coord = None,
                        lat = None,
                        lon = None,
-                       elev = None ):
+                       elev = None,
+                       backend = None ):
 
     if coord is None:
         coord = np.array( [lon, lat, elev], dtype = np.float64 )
 
     #  Force array to be a single array
-    coord = coord.flatten()
-
-    transformer = Transformer.from_crs( { 'proj':  'latlong', 
-                                          'ellps': 'WGS84',
-                                          'datum': 'WGS84' },
-                                        { 'proj':  'geocent', 
-                                          'ellps': 'WGS84',
-                                          'datum': 'WGS84' },
-                                        always_xy = True )
+    coord = np.asarray( coord, dtype = np.float64 ).flatten()
+
+    if (backend or _backend) == BACKEND_NUMPY:
+        x, y, z = wgs84.geodetic_to_ecf_point( coord[0], coord[1], coord[2] )
+        return np.array( [[x],[y],[z]], dtype = np.float64 )
+
+    transformer = get_transformer( WGS84_GEOGRAPHIC,
+                                   WGS84_GEOCENTRIC,
+                                   always_xy = True )
     
     x, y, z = transformer.transform( coord[0], coord[1], coord[2] )
 
@@ -38,50 +120,134 @@ def geographic_to_ecf( coord = None,
 def ecf_to_geographic( coord = None,
                        x = None,
                        y = None,
-                       z = None ):
+                       z = None,
+                       backend = None ):
     
     if coord is None:
-        coord = [x, y, z]
+        coord = np.array( [x, y, z], dtype = np.float64 )
     
     # force single dimension array
-    coord = coord.flatten()
-
-    transformer = Transformer.from_crs( { 'proj':  'geocent', 
-                                          'ellps': 'WGS84',
-                                          'datum': 'WGS84' },
-                                        { 'proj':  'latlong', 
-                                          'ellps': 'WGS84',
-                                          'datum': 'WGS84' } )
+    coord = np.asarray( coord, dtype = np.float64 ).flatten()
+
+    if (backend or _backend) == BACKEND_NUMPY:
+        lon, lat, elev = wgs84.ecf_to_geodetic_point( coord[0], coord[1], coord[2] )
+        return np.array( [[lon],[lat],[elev]], dtype = np.float64 )
+
+    transformer = get_transformer( WGS84_GEOCENTRIC,
+                                   WGS84_GEOGRAPHIC )
     
     x, y, z = transformer.transform( coord[0], coord[1], coord[2], radians = False )
 
     return np.array( [[x],[y],[z]], dtype = np.float64 )
 
+def geographic_to_ecf_many( lonlatalt, out = None, backend = None ):
+    '''
+    Convert an (N,3) array of [lon, lat, elev] rows to an (N,3) array of ECF [x, y, z].
+    The whole array is passed through the transformer in one call.
+    '''
+    if (backend or _backend) == BACKEND_NUMPY:
+        return wgs84.geodetic_to_ecf( lonlatalt, out = out )
+
+    lonlatalt = np.asarray( lonlatalt, dtype = np.float64 ).reshape( -1, 3 )
+
+    if out is None:
+        out = np.empty( lonlatalt.shape, dtype = np.float64 )
+
+    transformer = get_transformer( WGS84_GEOGRAPHIC,
+                                   WGS84_GEOCENTRIC,
+                                   always_xy = True )
+
+    out[:,0], out[:,1], out[:,2] = transformer.transform( lonlatalt[:,0],
+                                                          lonlatalt[:,1],
+                                                          lonlatalt[:,2] )
+    return out
+
+def ecf_to_geographic_many( xyz, out = None, backend = None ):
+    '''
+    Convert an (N,3) array of ECF [x, y, z] rows to an (N,3) array of [lon, lat, elev].
+    The whole array is passed through the transformer in one call.
+    '''
+    if (backend or _backend) == BACKEND_NUMPY:
+        return wgs84.ecf_to_geodetic( xyz, out = out )
+
+    xyz = np.asarray( xyz, dtype = np.float64 ).reshape( -1, 3 )
+
+    if out is None:
+        out = np.empty( xyz.shape, dtype = np.float64 )
+
+    transformer = get_transformer( WGS84_GEOCENTRIC,
+                                   WGS84_GEOGRAPHIC )
+
+    out[:,0], out[:,1], out[:,2] = transformer.transform( xyz[:,0],
+                                                          xyz[:,1],
+                                                          xyz[:,2],
+                                                          radians = False )
+    return out
+
 def get_ecf_forward_vector( point1_lla, forward_axis_lla ):
 
-    #  Convert lla to ECF
-    point1_ecf = geographic_to_ecf( point1_lla.reshape(3) )
+    #  Build both points and convert them in one pass
+    points_lla = np.empty( (2,3), dtype = np.float64 )
+    points_lla[0] = point1_lla.reshape(3)
+    points_lla[1] = points_lla[0] + forward_axis_lla.reshape(3)
+
+    points_ecf = geographic_to_ecf_many( points_lla )
+
+    return (points_ecf[1] - points_ecf[0]).reshape((3,1))
+
+
+def utm_grid_zones( lla_coords ):
+    '''
+    Vectorized UTM zone lookup for an (N,2) or (N,3) array of [lon, lat, ...] rows.
+    Zones are computed arithmetically, including the Norway and Svalbard exceptions.
 
-    #  Create 2nd point
-    point2_lla = point1_lla.reshape(3) + forward_axis_lla.reshape(3)
-    point2_ecf = geographic_to_ecf( point2_lla.reshape(3) )
+    Returns arrays of zone numbers, northern-hemisphere flags and EPSG codes.
+    '''
+    lla_coords = np.atleast_2d( np.asarray( lla_coords, dtype = np.float64 ) )
 
-    return (point2_ecf - point1_ecf).reshape((3,1))
+    lon = (lla_coords[:,0] + 180.0) % 360.0 - 180.0
+    lat = lla_coords[:,1]
 
+    #  Standard 6-degree zones
+    zones = np.floor( (lon + 180.0) / 6.0 ).astype( np.int64 ) + 1
+
+    #  Norway: zone 32 is widened to 3E-12E between 56N and 64N
+    norway = (lat >= 56.0) & (lat < 64.0) & (lon >= 3.0) & (lon < 12.0)
+    zones[norway] = 32
+
+    #  Svalbard: only odd zones 31, 33, 35 and 37 are used between 72N and 84N
+    svalbard = (lat >= 72.0) & (lat < 84.0) & (lon >= 0.0) & (lon < 42.0)
+    zones[svalbard] = np.select( [ lon[svalbard] < 9.0,
+                                   lon[svalbard] < 21.0,
+                                   lon[svalbard] < 33.0 ],
+                                 [ 31, 33, 35 ],
+                                 default = 37 )
+
+    north = lat >= 0.0
+    epsg  = np.where( north, 32600, 32700 ) + zones
+
+    return zones, north, epsg
 
 def utm_grid_zone( lla_coord ):
-    
-    lla_coord = lla_coord.flatten()
-    print( list( lla_coord ) )
-    utm_crs_list = query_utm_crs_info(
-          datum_name       = "WGS 84",
-          area_of_interest = AreaOfInterest(
-              west_lon_degree  = lla_coord[0],
-              south_lat_degree = lla_coord[1],
-              east_lon_degree  = lla_coord[0],
-              north_lat_degree = lla_coord[1],
-          ),
-    )
-    print( 'AAAAAA: ', utm_crs_list )
-    utm_crs = CRS.from_epsg(utm_crs_list[0].code)
-    print( f'VALUE: ', utm_crs )
+    '''
+    Return the UTM zone containing a single [lon, lat, ...] coordinate.
+    '''
+    zones, north, epsg = utm_grid_zones( np.asarray( lla_coord ).reshape( 1, -1 ) )
+
+    return UTM_Zone( int( zones[0] ), bool( north[0] ), int( epsg[0] ) )
+
+@functools.lru_cache( maxsize = 128 )
+def utm_crs( epsg: int ):
+    '''
+    Cached `CRS` for a UTM EPSG code.
+    '''
+    return CRS.from_epsg( epsg )
+
+@functools.lru_cache( maxsize = 128 )
+def utm_transformer( epsg: int ):
+    '''
+    Cached geographic -> UTM `Transformer` for a UTM EPSG code.
+    '''
+    return get_transformer( WGS84_GEOGRAPHIC,
+                            utm_crs( epsg ),
+                            always_xy = True )
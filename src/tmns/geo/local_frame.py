@@ -0,0 +1,121 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Local tangent frames (East-North-Up and North-East-Down) on the WGS84 ellipsoid.
+
+Matrices map ECF vectors into the local frame, i.e. `v_enu = M @ v_ecf`.  The
+transpose maps local vectors back into ECF.  Site latitudes are geodetic.
+'''
+
+#  Python Standard Libraries
+from collections import namedtuple
+import functools
+import math
+
+#  Numerical Python
+import numpy as np
+
+#  Cached frame for a fixed site
+Site_Frame = namedtuple( 'Site_Frame', [ 'ecf_to_enu', 'ecf_to_ned' ] )
+
+
+def ecf_to_enu_matrix( lon_deg: float, lat_deg: float ):
+    '''
+    Rotation from ECF into the ENU frame at a single site.  Rows are east, north and up.
+    '''
+    lon = math.radians( lon_deg )
+    lat = math.radians( lat_deg )
+
+    sin_lon = math.sin( lon )
+    cos_lon = math.cos( lon )
+    sin_lat = math.sin( lat )
+    cos_lat = math.cos( lat )
+
+    return np.array( [ [ -sin_lon,            cos_lon,           0.0     ],
+                       [ -sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat ],
+                       [  cos_lat * cos_lon,  cos_lat * sin_lon, sin_lat ] ],
+                     dtype = np.float64 )
+
+
+def ecf_to_ned_matrix( lon_deg: float, lat_deg: float ):
+    '''
+    Rotation from ECF into the NED frame at a single site.  Rows are north, east and down.
+    '''
+    M = ecf_to_enu_matrix( lon_deg, lat_deg )
+
+    return np.array( [ M[1], M[0], -M[2] ], dtype = np.float64 )
+
+
+def ecf_to_enu_matrices( lon_deg, lat_deg ):
+    '''
+    Batch form of `ecf_to_enu_matrix` over N sites.  Returns an (N,3,3) array.
+    '''
+    lon = np.radians( np.atleast_1d( np.asarray( lon_deg, dtype = np.float64 ) ) )
+    lat = np.radians( np.atleast_1d( np.asarray( lat_deg, dtype = np.float64 ) ) )
+
+    sin_lon = np.sin( lon )
+    cos_lon = np.cos( lon )
+    sin_lat = np.sin( lat )
+    cos_lat = np.cos( lat )
+
+    M = np.empty( (lon.shape[0],3,3), dtype = np.float64 )
+
+    M[:,0,0] = -sin_lon
+    M[:,0,1] =  cos_lon
+    M[:,0,2] =  0.0
+
+    M[:,1,0] = -sin_lat * cos_lon
+    M[:,1,1] = -sin_lat * sin_lon
+    M[:,1,2] =  cos_lat
+
+    M[:,2,0] =  cos_lat * cos_lon
+    M[:,2,1] =  cos_lat * sin_lon
+    M[:,2,2] =  sin_lat
+
+    return M
+
+
+def ecf_to_ned_matrices( lon_deg, lat_deg ):
+    '''
+    Batch form of `ecf_to_ned_matrix` over N sites.  Returns an (N,3,3) array.
+    '''
+    M = ecf_to_enu_matrices( lon_deg, lat_deg )
+
+    return np.stack( [ M[:,1], M[:,0], -M[:,2] ], axis = 1 )
+
+
+def up_vectors( lon_deg, lat_deg ):
+    '''
+    Ellipsoid normal (local up) in ECF for N sites.  Returns an (N,3) array.
+    '''
+    lon = np.radians( np.atleast_1d( np.asarray( lon_deg, dtype = np.float64 ) ) )
+    lat = np.radians( np.atleast_1d( np.asarray( lat_deg, dtype = np.float64 ) ) )
+
+    cos_lat = np.cos( lat )
+
+    return np.column_stack( [ cos_lat * np.cos( lon ),
+                              cos_lat * np.sin( lon ),
+                              np.sin( lat ) ] )
+
+
+@functools.lru_cache( maxsize = 1024 )
+def site_frame( lon_deg: float, lat_deg: float ):
+    '''
+    Cached ENU/NED rotations for a fixed site such as a launch position.
+    The returned matrices are read-only since they are shared between callers.
+    '''
+    ecf_to_enu = ecf_to_enu_matrix( lon_deg, lat_deg )
+    ecf_to_ned = ecf_to_ned_matrix( lon_deg, lat_deg )
+
+    ecf_to_enu.flags.writeable = False
+    ecf_to_ned.flags.writeable = False
+
+    return Site_Frame( ecf_to_enu, ecf_to_ned )
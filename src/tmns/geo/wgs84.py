@@ -0,0 +1,152 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Closed-form WGS84 geodetic <-> ECF conversions in pure NumPy.
+
+All functions operate on (N,3) arrays of rows and are used as the `numpy` backend
+of `tmns.geo.coordinate`.
+'''
+
+#  Python Standard Libraries
+import math
+
+#  Numerical Python
+import numpy as np
+
+#  WGS84 Ellipsoid Parameters
+A      = 6378137.0
+F      = 1.0 / 298.257223563
+B      = A * (1.0 - F)
+E2     = F * (2.0 - F)
+EP2    = (A * A - B * B) / (B * B)
+E4     = E2 * E2
+A2     = A * A
+B2     = B * B
+A2_B2  = A2 - B2
+
+
+def geodetic_to_ecf( lonlatalt, out = None ):
+    '''
+    Convert (N,3) [lon_deg, lat_deg, elev_m] rows to (N,3) ECF [x, y, z] rows.
+    '''
+    lonlatalt = np.asarray( lonlatalt, dtype = np.float64 ).reshape( -1, 3 )
+
+    if out is None:
+        out = np.empty( lonlatalt.shape, dtype = np.float64 )
+
+    lon = np.radians( lonlatalt[:,0] )
+    lat = np.radians( lonlatalt[:,1] )
+    alt = lonlatalt[:,2]
+
+    sin_lat = np.sin( lat )
+    cos_lat = np.cos( lat )
+
+    #  Prime vertical radius of curvature
+    N = A / np.sqrt( 1.0 - E2 * sin_lat * sin_lat )
+
+    out[:,0] = (N + alt) * cos_lat * np.cos( lon )
+    out[:,1] = (N + alt) * cos_lat * np.sin( lon )
+    out[:,2] = (N * (1.0 - E2) + alt) * sin_lat
+
+    return out
+
+
+def ecf_to_geodetic( xyz, out = None ):
+    '''
+    Convert (N,3) ECF [x, y, z] rows to (N,3) [lon_deg, lat_deg, elev_m] rows.
+
+    Uses the closed-form solution of Zhu (1993) / Heikkinen (1982), which needs
+    no iteration and is accurate to well below a millimetre for points outside
+    the inner few hundred kilometres of the Earth's core.
+    '''
+    xyz = np.asarray( xyz, dtype = np.float64 ).reshape( -1, 3 )
+
+    if out is None:
+        out = np.empty( xyz.shape, dtype = np.float64 )
+
+    X = xyz[:,0]
+    Y = xyz[:,1]
+    Z = xyz[:,2]
+
+    Z2 = Z * Z
+    p2 = X * X + Y * Y
+    p  = np.sqrt( p2 )
+
+    F54 = 54.0 * B2 * Z2
+    G   = p2 + (1.0 - E2) * Z2 - E2 * A2_B2
+    c   = E4 * F54 * p2 / (G * G * G)
+    s   = np.cbrt( 1.0 + c + np.sqrt( c * c + 2.0 * c ) )
+    k   = s + 1.0 + 1.0 / s
+    P   = F54 / (3.0 * k * k * G * G)
+    Q   = np.sqrt( 1.0 + 2.0 * E4 * P )
+
+    #  The radicand collapses to zero on the polar axis, where rounding can make it negative
+    r0 = -(P * E2 * p) / (1.0 + Q) + np.sqrt( np.maximum( 0.5 * A2 * (1.0 + 1.0 / Q)
+                                                          - P * (1.0 - E2) * Z2 / (Q * (1.0 + Q))
+                                                          - 0.5 * P * p2, 0.0 ) )
+
+    dp = p - E2 * r0
+    U  = np.sqrt( dp * dp + Z2 )
+    V  = np.sqrt( dp * dp + (1.0 - E2) * Z2 )
+    z0 = B2 * Z / (A * V)
+
+    out[:,0] = np.degrees( np.arctan2( Y, X ) )
+    out[:,1] = np.degrees( np.arctan2( Z + EP2 * z0, p ) )
+    out[:,2] = U * (1.0 - B2 / (A * V))
+
+    return out
+
+
+def geodetic_to_ecf_point( lon_deg: float, lat_deg: float, alt_m: float ):
+    '''
+    Scalar form of `geodetic_to_ecf`.  Avoids NumPy call overhead for single points.
+    '''
+    lon = math.radians( lon_deg )
+    lat = math.radians( lat_deg )
+
+    sin_lat = math.sin( lat )
+    cos_lat = math.cos( lat )
+
+    N = A / math.sqrt( 1.0 - E2 * sin_lat * sin_lat )
+
+    return ( (N + alt_m) * cos_lat * math.cos( lon ),
+             (N + alt_m) * cos_lat * math.sin( lon ),
+             (N * (1.0 - E2) + alt_m) * sin_lat )
+
+
+def ecf_to_geodetic_point( x: float, y: float, z: float ):
+    '''
+    Scalar form of `ecf_to_geodetic`.  Avoids NumPy call overhead for single points.
+    '''
+    Z2 = z * z
+    p2 = x * x + y * y
+    p  = math.sqrt( p2 )
+
+    F54 = 54.0 * B2 * Z2
+    G   = p2 + (1.0 - E2) * Z2 - E2 * A2_B2
+    c   = E4 * F54 * p2 / (G * G * G)
+    s   = math.cbrt( 1.0 + c + math.sqrt( c * c + 2.0 * c ) )
+    k   = s + 1.0 + 1.0 / s
+    P   = F54 / (3.0 * k * k * G * G)
+    Q   = math.sqrt( 1.0 + 2.0 * E4 * P )
+
+    r0 = -(P * E2 * p) / (1.0 + Q) + math.sqrt( max( 0.5 * A2 * (1.0 + 1.0 / Q)
+                                                     - P * (1.0 - E2) * Z2 / (Q * (1.0 + Q))
+                                                     - 0.5 * P * p2, 0.0 ) )
+
+    dp = p - E2 * r0
+    U  = math.sqrt( dp * dp + Z2 )
+    V  = math.sqrt( dp * dp + (1.0 - E2) * Z2 )
+    z0 = B2 * z / (A * V)
+
+    return ( math.degrees( math.atan2( y, x ) ),
+             math.degrees( math.atan2( z + EP2 * z0, p ) ),
+             U * (1.0 - B2 / (A * V)) )
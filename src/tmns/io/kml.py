@@ -10,8 +10,14 @@
 #
 
 # Python Libraries
+import contextlib
+import io
 import logging
 import os
+import zipfile
+
+#  Numerical Python
+import numpy as np
 
 
 class Color_Mode:
@@ -82,26 +88,51 @@ class Object:
     def get_kml_content(self, offset = 0):
         return ''
 
-    def as_kml( self, offset = 0 ):
+    def write_kml_content( self, fout, offset = 0 ):
+        '''
+        Stream the node's content to a text file.  Nodes with children or many
+        samples override this, and the rest write their `get_kml_content`.
+        '''
+        fout.write( self.get_kml_content( offset ) )
+
+    def kml_content_string( self, offset = 0 ):
+        '''
+        Collect the streamed content, for nodes whose `get_kml_content` is built from `write_kml_content`.
+        '''
+        buffer = io.StringIO()
+        self.write_kml_content( buffer, offset )
+        return buffer.getvalue()
+
+    def write_kml_open( self, fout, offset = 0 ):
 
         #  Create offset str
         gap = ' ' * offset
 
-        #  Create KML Node
-        output = ''
-        output += gap + '<' + self.kml_name
-
+        #  Open the KML Node
         if self.id is not None:
-            output += ' id="' + self.id + '"'
-        output += '>\n'
+            fout.write( gap + '<' + self.kml_name + ' id="' + self.id + '">\n' )
+        else:
+            fout.write( gap + '<' + self.kml_name + '>\n' )
 
-        #  Add the content
-        output += self.get_kml_content( offset + 2 )
+    def write_kml_close( self, fout, offset = 0 ):
 
         #  Close the KML Node
-        output += gap + '</' + self.kml_name + '>\n'
+        fout.write( ' ' * offset + '</' + self.kml_name + '>\n' )
 
-        return output
+    def write_kml( self, fout, offset = 0 ):
+
+        self.write_kml_open( fout, offset )
+
+        #  Add the content
+        self.write_kml_content( fout, offset + 2 )
+
+        self.write_kml_close( fout, offset )
+
+    def as_kml( self, offset = 0 ):
+
+        buffer = io.StringIO()
+        self.write_kml( buffer, offset )
+        return buffer.getvalue()
 
     def __str__(self, offset = 0):
 
@@ -259,7 +290,7 @@ class Icon_Style( Color_Style ):
                   scale      = None,
                   heading    = None,
                   icon       = None,
-                  kml_name   = 'PolyStyle' ):
+                  kml_name   = 'IconStyle' ):
 
         #  Build Parent
         Color_Style.__init__( self, 
@@ -284,8 +315,18 @@ class Icon_Style( Color_Style ):
         #  Add Parent stuff
         output += Color_Style.get_kml_content(self, offset)
 
-        #  Add the
+        #  Add the scale and heading
+        if self.scale is not None:
+            output += gap + '<scale>' + str(self.scale) + '</scale>\n'
+
+        if self.heading is not None:
+            output += gap + '<heading>' + str(self.heading) + '</heading>\n'
 
+        #  Add the icon image, a URL or a path inside a KMZ archive
+        if self.icon is not None:
+            output += gap + '<Icon>\n'
+            output += gap + '  <href>' + self.icon + '</href>\n'
+            output += gap + '</Icon>\n'
 
         #  Return result
         return output
@@ -319,10 +360,11 @@ class Label_Style(Color_Style):
         output = ''
 
         #  Add Parent stuff
-        output += Color_Style.Get_KML_Content(self, offset)
-
-        #  Add the
+        output += Color_Style.get_kml_content(self, offset)
 
+        #  Add the scale
+        if self.scale is not None:
+            output += gap + '<scale>' + str(self.scale) + '</scale>\n'
 
         #  Return result
         return output
@@ -347,34 +389,17 @@ class Style( Style_Selector ):
 
 
     def get_kml_content( self, offset = 0 ):
+        return self.kml_content_string( offset )
 
-        #  Create gap string
-        gap = ' ' * offset
-
-        #  Create output
-        output = ''
+    def write_kml_content( self, fout, offset = 0 ):
 
         #  add parent stuff
-        output += Style_Selector.get_kml_content(self, offset)
-
-        #  Add Line Style
-        if self.line_style is not None:
-            output += self.line_style.as_kml( offset=offset)
-
-        #  Add PolyStyle
-        if self.poly_style is not None:
-            output += self.poly_style.as_kml( offset=offset)
-
-        #  Add Label Style
-        if self.label_style is not None:
-            output += self.label_style.as_kml(offset=offset)
+        fout.write( Style_Selector.get_kml_content( self, offset ) )
 
-        #  Add Icon Style
-        if self.icon_style is not None:
-            output += self.icon_style.as_kml(offset=offset)
-
-
-        return output
+        #  Add Line, Poly, Label and Icon Styles
+        for sub_style in [ self.line_style, self.poly_style, self.label_style, self.icon_style ]:
+            if sub_style is not None:
+                sub_style.write_kml( fout, offset = offset )
 
 
 class Feature( Object ):
@@ -529,22 +554,24 @@ class Container( Feature ):
 
 
     def get_kml_content( self, offset = 0 ):
+        return self.kml_content_string( offset )
 
-        #  Create gap
-        gap = ' ' * offset
-
-        #  Create output
-        output = ''
+    def write_kml_content( self, fout, offset = 0 ):
 
         #  Add parent material
-        output += Feature.get_kml_content( self, offset = offset )
+        fout.write( Feature.get_kml_content( self, offset = offset ) )
 
         #  Iterate over internal features
         for feature in self.features:
-            output += feature.as_kml( offset + 2 )
+            feature.write_kml( fout, offset + 2 )
 
-        #  Return output
-        return output
+    def write_kml_head( self, fout, offset = 0 ):
+        '''
+        Write the opening tag, the container's own fields and its features so far,
+        leaving it open for more features written at `offset + 4`.
+        '''
+        self.write_kml_open( fout, offset )
+        self.write_kml_content( fout, offset + 2 )
 
 
     def __str__(self, offset = 0):
@@ -638,22 +665,16 @@ class Placemark( Feature ):
 
 
     def get_kml_content( self, offset = 0 ):
+        return self.kml_content_string( offset )
 
-        #  Create gap
-        gap = ' ' * offset
-
-        #  Create output
-        output = ''
+    def write_kml_content( self, fout, offset = 0 ):
 
         #  Add parent material
-        output += Feature.get_kml_content(self, offset=offset)
+        fout.write( Feature.get_kml_content( self, offset = offset ) )
 
         #  Add Geometry
         if self.geometry is not None:
-            output += self.geometry.as_kml( offset )
-
-        # Return output
-        return output
+            self.geometry.write_kml( fout, offset )
 
 
 class Point( Geometry ):
@@ -698,7 +719,7 @@ class Point( Geometry ):
 
         #  Add the altitude mode
         if self.alt_mode is not None:
-            output += gap + '<altitudeMode>' + str(self.alt_mode) + '</altitudeMode>\n'
+            output += gap + '<altitudeMode>' + Altitude_Mode.to_string(self.alt_mode) + '</altitudeMode>\n'
 
         #  Add coordinates
         output += gap + '<coordinates>\n'
@@ -712,22 +733,139 @@ class Point( Geometry ):
         return output
 
 
+#  Samples formatted at a time when streaming long geometries
+WRITE_CHUNK_SIZE = 4096
+
+#  File buffer used when streaming a document to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def format_coordinates( points, separator = ',' ):
+    '''
+    Format a list of `Point` or an (N,3) array of [lon, lat, elev] rows as
+    coordinate tuple strings.  Array rows are rounded to about a centimeter.
+    '''
+    if len( points ) > 0 and isinstance( points[0], Point ):
+        return [ p.as_kml_simple().replace( ',', separator ) for p in points ]
+
+    return [ f'{lon:.7f}{separator}{lat:.7f}{separator}{elev:.2f}'
+             for lon, lat, elev in np.asarray( points, dtype = np.float64 ).reshape( -1, 3 ).tolist() ]
+
+
+def format_when( unix_times ):
+    '''
+    Format unix times as KML `when` timestamps with millisecond precision.
+    '''
+    millis = np.round( np.asarray( unix_times, dtype = np.float64 ) * 1000.0 ).astype( np.int64 )
+    return [ when + 'Z' for when in np.datetime_as_string( millis.astype( 'datetime64[ms]' ), unit = 'ms' ).tolist() ]
+
+
 class Line_String( Geometry ):
 
     def __init__( self,
-                  id       = None,
-                  points   = None,
-                  kml_name = 'LineString' ):
+                  id         = None,
+                  points     = None,
+                  alt_mode   = None,
+                  extrude    = None,
+                  tessellate = None,
+                  kml_name   = 'LineString' ):
 
         #  Build parent
         Geometry.__init__( self, id = id, kml_name = kml_name )
 
-        #  Set points
+        #  Set points, either `Point` nodes or an (N,3) array of [lon, lat, elev]
         if points is None:
             self.points = []
         else:
             self.points = points
 
+        self.alt_mode   = alt_mode
+        self.extrude    = extrude
+        self.tessellate = tessellate
+
+
+    def get_kml_content( self, offset = 0 ):
+        return self.kml_content_string( offset )
+
+    def write_kml_content( self, fout, offset = 0 ):
+
+        #  Create gap
+        gap = ' ' * offset
+
+        #  Add Parent Stuff
+        fout.write( Geometry.get_kml_content( self, offset = offset ) )
+
+        if self.extrude is not None:
+            fout.write( gap + '<extrude>' + ( '1' if self.extrude else '0' ) + '</extrude>\n' )
+
+        if self.tessellate is not None:
+            fout.write( gap + '<tessellate>' + ( '1' if self.tessellate else '0' ) + '</tessellate>\n' )
+
+        #  Add the altitude mode
+        if self.alt_mode is not None:
+            fout.write( gap + '<altitudeMode>' + Altitude_Mode.to_string( self.alt_mode ) + '</altitudeMode>\n' )
+
+        #  Add coordinates as one whitespace-separated list, formatted in chunks
+        fout.write( gap + '<coordinates>\n' + gap + ' ' )
+        for start in range( 0, len( self.points ), WRITE_CHUNK_SIZE ):
+            if start > 0:
+                fout.write( ' ' )
+            fout.write( ' '.join( format_coordinates( self.points[start:start+WRITE_CHUNK_SIZE] ) ) )
+        fout.write( '\n' + gap + '</coordinates>\n' )
+
+
+class Gx_Track( Geometry ):
+    '''
+    Time-tagged path from the Google `gx` extension, drawn as a line that can
+    be played back with the time slider.  All `when` elements precede the
+    matching `gx:coord` elements.
+    '''
+
+    def __init__( self,
+                  id         = None,
+                  unix_times = None,
+                  points     = None,
+                  alt_mode   = None,
+                  kml_name   = 'gx:Track' ):
+
+        #  Build parent
+        Geometry.__init__( self, id = id, kml_name = kml_name )
+
+        #  Set samples, with points as `Point` nodes or an (N,3) array of [lon, lat, elev]
+        self.unix_times = [] if unix_times is None else unix_times
+        self.points     = [] if points is None else points
+        self.alt_mode   = alt_mode
+
+        if len( self.unix_times ) != len( self.points ):
+            raise Exception( 'gx:Track needs one time per point' )
+
+
+    def get_kml_content( self, offset = 0 ):
+        return self.kml_content_string( offset )
+
+    def write_kml_content( self, fout, offset = 0 ):
+
+        #  Create gap
+        gap = ' ' * offset
+
+        #  Add Parent Stuff
+        fout.write( Geometry.get_kml_content( self, offset = offset ) )
+
+        #  Add the altitude mode
+        if self.alt_mode is not None:
+            fout.write( gap + '<altitudeMode>' + Altitude_Mode.to_string( self.alt_mode ) + '</altitudeMode>\n' )
+
+        #  Samples are written unindented, one line per element type, to keep the file compact
+        fout.write( gap )
+        for start in range( 0, len( self.unix_times ), WRITE_CHUNK_SIZE ):
+            fout.write( ''.join( '<when>' + when + '</when>'
+                                 for when in format_when( self.unix_times[start:start+WRITE_CHUNK_SIZE] ) ) )
+        fout.write( '\n' + gap )
+        for start in range( 0, len( self.points ), WRITE_CHUNK_SIZE ):
+            fout.write( ''.join( '<gx:coord>' + coord + '</gx:coord>'
+                                 for coord in format_coordinates( self.points[start:start+WRITE_CHUNK_SIZE], separator = ' ' ) ) )
+        fout.write( '\n' )
+
 
 class Polygon( Geometry ):
 
@@ -795,6 +933,49 @@ class Polygon( Geometry ):
         return output
 
 
+KML_HEADER = ( '<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">\n' )
+KML_FOOTER = '</kml>\n'
+
+
+@contextlib.contextmanager
+def open_document( input_path, kmz = False, compresslevel = 6, files = None, logger = None ):
+    '''
+    Open a text stream for a KML document, either `<base>.kml` or the `doc.kml`
+    entry of a `<base>.kmz` archive.
+
+    Archive entries are streamed without building the document string.  `files`
+    maps paths inside the archive, such as `files/icon.png`, to local files
+    bundled after the document once it is closed.
+    '''
+    if logger is None:
+        logger = logging.getLogger( 'kml.Writer' )
+
+    #  Create output path
+    output_pathname = os.path.splitext(input_path)[0] + ( '.kmz' if kmz else '.kml' )
+
+    #  Open file for output
+    logger.debug( f'Writing to {output_pathname}')
+    if not kmz:
+        with open( output_pathname, 'w', buffering = WRITE_BUFFER_SIZE ) as fout:
+            yield fout
+        return
+
+    with zipfile.ZipFile( output_pathname,
+                          'w',
+                          compression = zipfile.ZIP_DEFLATED,
+                          compresslevel = compresslevel ) as archive:
+
+        #  The document must be the first entry.  Its size is not known while it
+        #  streams, so the entry is written as Zip64 in case it passes 2 GiB.
+        with archive.open( 'doc.kml', 'w', force_zip64 = True ) as entry:
+            with io.TextIOWrapper( io.BufferedWriter( entry, WRITE_BUFFER_SIZE ), encoding = 'utf-8' ) as fout:
+                yield fout
+
+        for archive_name, local_path in ( files or {} ).items():
+            archive.write( local_path, archive_name )
+
+
 class Writer:
 
     #  List of nodes
@@ -821,24 +1002,76 @@ class Writer:
             self.add_node( node )
 
 
+    def write_kml( self, fout ):
+        '''
+        Stream the whole document to a text file, node by node.
+        '''
+        fout.write( KML_HEADER )
+        self.document.write_kml( fout )
+        fout.write( KML_FOOTER )
+
     def to_string( self ):
 
-        output  = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        output += '<kml xmlns="http://www.opengis.net/kml/2.2">\n'
-        output += self.document.as_kml()
-        output += '</kml>\n'
-        return output
+        buffer = io.StringIO()
+        self.write_kml( buffer )
+        return buffer.getvalue()
 
     def write(self, input_path, logger = None ):
 
-        if logger is None:
-            logger = logging.getLogger( 'kml.Writer' )
+        with open_document( input_path, logger = logger ) as fout:
+            self.write_kml( fout )
+
+    def write_kmz( self, input_path, compresslevel = 6, files = None, logger = None ):
+        '''
+        Write a KMZ archive holding the document as `doc.kml`, streamed into the
+        compressed entry without building the document string.
+
+        `files` maps paths inside the archive, such as `files/icon.png`, to local
+        files bundled alongside the document.
+        '''
+        with open_document( input_path,
+                            kmz = True,
+                            compresslevel = compresslevel,
+                            files = files,
+                            logger = logger ) as fout:
+            self.write_kml( fout )
 
-        #  Create output path
-        output_pathname = os.path.splitext(input_path)[0] + '.kml'
 
-        #  Open file for output
-        logger.debug( f'Writing to {output_pathname}')
-        with open(output_pathname, 'w') as fout:
-            fout.write(self.to_string())
+class Stream_Writer:
+    '''
+    Write a document whose last folder is filled while the file is open.
 
+    The document up to the folder's existing features is written on creation,
+    `add_node` writes each further feature into the folder straight away, and
+    `close` ends the folder and the document.  The file matches what `Writer`
+    writes for the same nodes, without holding the folder's features.
+    '''
+
+    def __init__( self, input_path, folder: Folder, nodes = None, kmz = False, compresslevel = 6, files = None, logger = None ):
+
+        self.document = Document()
+        self.folder   = folder
+
+        self.output = open_document( input_path,
+                                     kmz = kmz,
+                                     compresslevel = compresslevel,
+                                     files = files,
+                                     logger = logger )
+        self.fout = self.output.__enter__()
+
+        #  Same offsets as a folder at the end of the document written by `Writer`
+        self.fout.write( KML_HEADER )
+        self.document.write_kml_head( self.fout )
+        for node in nodes or []:
+            node.write_kml( self.fout, 4 )
+        self.folder.write_kml_head( self.fout, 4 )
+
+    def add_node( self, node ):
+        node.write_kml( self.fout, 8 )
+
+    def close( self ):
+
+        self.folder.write_kml_close( self.fout, 4 )
+        self.document.write_kml_close( self.fout )
+        self.fout.write( KML_FOOTER )
+        self.output.__exit__( None, None, None )
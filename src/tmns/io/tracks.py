@@ -0,0 +1,259 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Columnar track files for analysis.
+
+Two layouts hold one row per sample with its time, geographic [lon, lat, elev]
+and ECF [x, y, z] position:
+
+- An `.npy` directory with one folder of uncompressed arrays per missile and an
+  `index.json` naming them.  Arrays are opened with `mmap_mode`, so only the
+  pages of the selected rows are read.
+- A Parquet dataset partitioned by `missile_id`.  This needs pyarrow, which is
+  only imported when Parquet is used.
+
+`load_tracks` reads selected missiles and a time range from either layout.
+Both layouts can also be written a track at a time through `Npy_Track_Stream`
+and `Parquet_Track_Stream`.
+'''
+
+#  Python Standard Libraries
+from collections import namedtuple
+import json
+import os
+import shutil
+
+#  Numerical Python
+import numpy as np
+
+#  One missile's samples, ordered by time
+Track = namedtuple( 'Track', [ 'id', 'unix_time', 'position', 'position_ecf' ] )
+
+NPY_INDEX   = 'index.json'
+NPY_COLUMNS = [ 'unix_time', 'position', 'position_ecf' ]
+
+PARQUET_COLUMNS   = [ 'unix_time', 'lon', 'lat', 'alt', 'x_ecf', 'y_ecf', 'z_ecf' ]
+PARQUET_PARTITION = 'missile_id'
+
+
+def import_pyarrow():
+    '''
+    Import pyarrow's Parquet and dataset modules, which are optional dependencies.
+    '''
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise Exception( 'Parquet track files require pyarrow (pip install pyarrow)' ) from e
+    return pyarrow
+
+
+class Npy_Track_Stream:
+    '''
+    Write `Track` records to an `.npy` directory one at a time, so only the
+    track being written is held.  The index is written on `close`.
+    '''
+
+    def __init__( self, path: str ):
+
+        self.path  = path
+        self.index = { 'missiles': [] }
+        os.makedirs( path, exist_ok = True )
+
+    def write_track( self, track, events = None ):
+        '''
+        Write one track, with its optional (name, unix_time, position_ecf) event records.
+        '''
+        folder = f'missile_{len( self.index["missiles"] ):05d}'
+        os.makedirs( os.path.join( self.path, folder ), exist_ok = True )
+
+        for name in NPY_COLUMNS:
+            np.save( os.path.join( self.path, folder, f'{name}.npy' ),
+                     np.ascontiguousarray( getattr( track, name ), dtype = np.float64 ) )
+
+        self.index['missiles'].append( { 'id':      str( track.id ),
+                                         'folder':  folder,
+                                         'samples': int( len( track.unix_time ) ),
+                                         'events':  [ { 'name':         event[0],
+                                                        'unix_time':    float( event[1] ),
+                                                        'position_ecf': np.asarray( event[2], dtype = np.float64 ).reshape( 3 ).tolist() }
+                                                      for event in events or [] ] } )
+
+    def close( self ):
+
+        with open( os.path.join( self.path, NPY_INDEX ), 'w' ) as fout:
+            json.dump( self.index, fout, indent = 2 )
+
+
+def write_npy_tracks( path: str, tracks, events = None ):
+    '''
+    Write `Track` records to an `.npy` directory.  `events` optionally maps a
+    missile id to a list of (name, unix_time, position_ecf) records.
+    '''
+    stream = Npy_Track_Stream( path )
+    for track in tracks:
+        stream.write_track( track, ( events or {} ).get( track.id ) )
+    stream.close()
+
+
+def clear_partitions( path: str ):
+    '''
+    Remove the missile partitions of an earlier run from a Parquet dataset, so
+    missiles missing from a rerun do not survive in it.  Other files are kept.
+    '''
+    if not os.path.isdir( path ):
+        return
+
+    for name in os.listdir( path ):
+        folder = os.path.join( path, name )
+        if name.startswith( f'{PARQUET_PARTITION}=' ) and os.path.isdir( folder ):
+            shutil.rmtree( folder )
+
+
+class Parquet_Track_Stream:
+    '''
+    Write `Track` records to a Parquet dataset one partition at a time,
+    replacing any partitions already there.
+    '''
+
+    def __init__( self, path: str ):
+
+        self.pa   = import_pyarrow()
+        self.path = path
+        clear_partitions( path )
+
+    def write_track( self, track ):
+
+        pa = self.pa
+
+        position     = np.asarray( track.position, dtype = np.float64 )
+        position_ecf = np.asarray( track.position_ecf, dtype = np.float64 )
+
+        table = pa.table( { 'unix_time': np.asarray( track.unix_time, dtype = np.float64 ),
+                            'lon':       position[:,0],
+                            'lat':       position[:,1],
+                            'alt':       position[:,2],
+                            'x_ecf':     position_ecf[:,0],
+                            'y_ecf':     position_ecf[:,1],
+                            'z_ecf':     position_ecf[:,2] } )
+
+        folder = os.path.join( self.path, f'{PARQUET_PARTITION}={track.id}' )
+        os.makedirs( folder, exist_ok = True )
+        pa.parquet.write_table( table, os.path.join( folder, 'part-0.parquet' ) )
+
+    def close( self ):
+        pass
+
+
+def write_parquet_tracks( path: str, tracks ):
+    '''
+    Write `Track` records to a Parquet dataset with one partition per missile,
+    replacing any partitions already there.
+    '''
+    stream = Parquet_Track_Stream( path )
+    for track in tracks:
+        stream.write_track( track )
+    stream.close()
+
+
+def time_slice( unix_time, t_start = None, t_end = None ):
+    '''
+    Slice of a sorted time column covering [t_start, t_end].
+    '''
+    start = 0 if t_start is None else int( np.searchsorted( unix_time, t_start, side = 'left' ) )
+    end   = len( unix_time ) if t_end is None else int( np.searchsorted( unix_time, t_end, side = 'right' ) )
+    return slice( start, end )
+
+
+def load_npy_tracks( path: str, missiles = None, t_start = None, t_end = None ):
+    '''
+    Memory-map the selected missiles of an `.npy` directory.  Returned arrays
+    are views of the maps, so nothing outside the time range is read.
+    '''
+    with open( os.path.join( path, NPY_INDEX ) ) as fin:
+        index = json.load( fin )
+
+    tracks = {}
+    for entry in index['missiles']:
+        if missiles is not None and entry['id'] not in missiles:
+            continue
+
+        columns = { name: np.load( os.path.join( path, entry['folder'], f'{name}.npy' ), mmap_mode = 'r' )
+                    for name in NPY_COLUMNS }
+
+        rows = time_slice( columns['unix_time'], t_start, t_end )
+        tracks[entry['id']] = Track( entry['id'], *[ columns[name][rows] for name in NPY_COLUMNS ] )
+
+    return tracks
+
+
+def load_npy_events( path: str ):
+    '''
+    Return the phase events of an `.npy` directory by missile id.
+    '''
+    with open( os.path.join( path, NPY_INDEX ) ) as fin:
+        index = json.load( fin )
+
+    return { entry['id']: entry['events'] for entry in index['missiles'] }
+
+
+def load_parquet_tracks( path: str, missiles = None, t_start = None, t_end = None ):
+    '''
+    Read the selected missiles of a Parquet dataset, pushing the missile and
+    time filters down so other partitions and row groups are skipped.
+    '''
+    pa = import_pyarrow()
+    ds = pa.dataset
+
+    #  Ids stay strings rather than being inferred as numbers from the folder names
+    dataset = ds.dataset( path,
+                          format = 'parquet',
+                          partitioning = ds.partitioning( pa.schema( [ ( PARQUET_PARTITION, pa.string() ) ] ),
+                                                          flavor = 'hive' ) )
+
+    condition = None
+    for term in [ None if missiles is None else ds.field( PARQUET_PARTITION ).isin( [ str( m ) for m in missiles ] ),
+                  None if t_start is None else ds.field( 'unix_time' ) >= t_start,
+                  None if t_end is None else ds.field( 'unix_time' ) <= t_end ]:
+        if term is not None:
+            condition = term if condition is None else condition & term
+
+    table = dataset.to_table( columns = PARQUET_COLUMNS + [ PARQUET_PARTITION ], filter = condition )
+
+    ids     = np.asarray( table.column( PARQUET_PARTITION ).to_pylist(), dtype = str )
+    columns = { name: table.column( name ).to_numpy() for name in PARQUET_COLUMNS }
+
+    tracks = {}
+    for midx in dict.fromkeys( ids ):
+        rows  = ids == midx
+        order = np.argsort( columns['unix_time'][rows], kind = 'stable' )
+
+        tracks[midx] = Track( midx,
+                              columns['unix_time'][rows][order],
+                              np.column_stack( [ columns[name][rows][order] for name in [ 'lon', 'lat', 'alt' ] ] ),
+                              np.column_stack( [ columns[name][rows][order] for name in [ 'x_ecf', 'y_ecf', 'z_ecf' ] ] ) )
+    return tracks
+
+
+def load_tracks( path: str, missiles = None, t_start = None, t_end = None ):
+    '''
+    Load tracks from either layout as a dict of `Track` by missile id.
+
+    `missiles` is a collection of ids to keep, and samples are limited to
+    [t_start, t_end] when those are given.
+    '''
+    if missiles is not None:
+        missiles = set( str( midx ) for midx in missiles )
+
+    if os.path.exists( os.path.join( path, NPY_INDEX ) ):
+        return load_npy_tracks( path, missiles, t_start, t_end )
+    return load_parquet_tracks( path, missiles, t_start, t_end )
@@ -0,0 +1,183 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+U.S. Standard Atmosphere 1976, tabulated once on a fine altitude grid.
+
+Below 86 km the layer equations are evaluated exactly on the grid.  From 86 km
+to 1000 km the published reference values are interpolated in log-density.
+Lookups are vectorized linear interpolation over the grid, so they accept
+scalars or arrays of geometric altitudes in metres.
+'''
+
+#  Python Standard Libraries
+from collections import namedtuple
+import functools
+
+#  Numerical Python
+import numpy as np
+
+#  Physical constants used by the 1976 model
+G0         = 9.80665          # m/s^2
+R_STAR     = 8.31432          # J/(mol K)
+M0         = 0.0289644        # kg/mol
+GAMMA      = 1.4
+R_AIR      = R_STAR / M0      # J/(kg K)
+R_EARTH    = 6356766.0        # m, radius used for geopotential altitude
+P_SEA      = 101325.0         # Pa
+
+#  Layer bases below 86 km: geopotential altitude [m], base temperature [K], lapse rate [K/m]
+LAYERS = [ (     0.0, 288.15, -0.0065 ),
+           ( 11000.0, 216.65,  0.0    ),
+           ( 20000.0, 216.65,  0.0010 ),
+           ( 32000.0, 228.65,  0.0028 ),
+           ( 47000.0, 270.65,  0.0    ),
+           ( 51000.0, 270.65, -0.0028 ),
+           ( 71000.0, 214.65, -0.0020 ) ]
+
+#  Reference values above 86 km: geometric altitude [m], temperature [K], density [kg/m^3]
+UPPER_TABLE = [ (   86000.0,  186.87, 6.958e-06 ),
+                (   90000.0,  186.87, 3.416e-06 ),
+                (  100000.0,  195.08, 5.604e-07 ),
+                (  110000.0,  240.00, 9.708e-08 ),
+                (  120000.0,  360.00, 2.222e-08 ),
+                (  150000.0,  634.39, 2.076e-09 ),
+                (  200000.0,  854.56, 2.541e-10 ),
+                (  300000.0,  976.01, 1.916e-11 ),
+                (  400000.0,  995.83, 2.803e-12 ),
+                (  500000.0,  999.24, 5.215e-13 ),
+                (  600000.0,  999.85, 1.137e-13 ),
+                (  700000.0,  999.97, 3.070e-14 ),
+                (  800000.0,  999.99, 1.136e-14 ),
+                (  900000.0, 1000.00, 5.759e-15 ),
+                ( 1000000.0, 1000.00, 3.561e-15 ) ]
+
+#  Grid definition
+GRID_MIN_M  = -1000.0
+GRID_MAX_M  = 1000000.0
+GRID_STEP_M = 10.0
+
+Atmosphere_Table = namedtuple( 'Atmosphere_Table', [ 'altitude_m',
+                                                     'temperature_k',
+                                                     'pressure_pa',
+                                                     'log_density',
+                                                     'speed_of_sound' ] )
+
+
+def _lower_atmosphere( altitude_m ):
+    '''
+    Exact layer equations for geometric altitudes below 86 km.
+    Returns temperature, pressure and density arrays.
+    '''
+    #  Geopotential altitude
+    h = R_EARTH * altitude_m / (R_EARTH + altitude_m)
+
+    temperature = np.empty_like( h )
+    pressure    = np.empty_like( h )
+
+    p_base = P_SEA
+    for idx, ( h_base, t_base, lapse ) in enumerate( LAYERS ):
+
+        h_top = LAYERS[idx+1][0] if idx + 1 < len( LAYERS ) else np.inf
+        mask  = (h < h_top) if idx == 0 else ((h >= h_base) & (h < h_top))
+
+        dh = h[mask] - h_base
+        if lapse == 0.0:
+            temperature[mask] = t_base
+            pressure[mask]    = p_base * np.exp( -G0 * M0 * dh / (R_STAR * t_base) )
+        else:
+            temperature[mask] = t_base + lapse * dh
+            pressure[mask]    = p_base * (t_base / temperature[mask]) ** (G0 * M0 / (R_STAR * lapse))
+
+        #  Pressure at the top of this layer is the base of the next
+        if idx + 1 < len( LAYERS ):
+            dh_top = h_top - h_base
+            if lapse == 0.0:
+                p_base = p_base * np.exp( -G0 * M0 * dh_top / (R_STAR * t_base) )
+            else:
+                p_base = p_base * (t_base / (t_base + lapse * dh_top)) ** (G0 * M0 / (R_STAR * lapse))
+
+    density = pressure / (R_AIR * temperature)
+
+    return temperature, pressure, density
+
+
+@functools.lru_cache( maxsize = None )
+def get_table():
+    '''
+    Build the tabulated atmosphere on first use.
+    '''
+    altitude = np.arange( GRID_MIN_M, GRID_MAX_M + GRID_STEP_M, GRID_STEP_M, dtype = np.float64 )
+    lower    = altitude < UPPER_TABLE[0][0]
+
+    temperature = np.empty_like( altitude )
+    pressure    = np.empty_like( altitude )
+    density     = np.empty_like( altitude )
+
+    temperature[lower], pressure[lower], density[lower] = _lower_atmosphere( altitude[lower] )
+
+    upper = np.array( UPPER_TABLE, dtype = np.float64 )
+    temperature[~lower] = np.interp( altitude[~lower], upper[:,0], upper[:,1] )
+    density[~lower]     = np.exp( np.interp( altitude[~lower], upper[:,0], np.log( upper[:,2] ) ) )
+
+    #  Ideal gas with sea-level molar mass.  Above 86 km this is nominal only.
+    pressure[~lower] = density[~lower] * R_AIR * temperature[~lower]
+
+    table = Atmosphere_Table( altitude,
+                              temperature,
+                              pressure,
+                              np.log( density ),
+                              np.sqrt( GAMMA * R_AIR * temperature ) )
+
+    for array in table:
+        array.flags.writeable = False
+
+    return table
+
+
+def density( altitude_m ):
+    '''
+    Air density [kg/m^3] at geometric altitude(s) in metres.
+    '''
+    table = get_table()
+    return np.exp( np.interp( altitude_m, table.altitude_m, table.log_density ) )
+
+
+def temperature( altitude_m ):
+    '''
+    Kinetic temperature [K] at geometric altitude(s) in metres.
+    '''
+    table = get_table()
+    return np.interp( altitude_m, table.altitude_m, table.temperature_k )
+
+
+def pressure( altitude_m ):
+    '''
+    Pressure [Pa] at geometric altitude(s) in metres.
+    '''
+    table = get_table()
+    return np.interp( altitude_m, table.altitude_m, table.pressure_pa )
+
+
+def speed_of_sound( altitude_m ):
+    '''
+    Speed of sound [m/s] at geometric altitude(s) in metres.
+    '''
+    table = get_table()
+    return np.interp( altitude_m, table.altitude_m, table.speed_of_sound )
+
+
+def altitude_at_density( density_kg_m3 ):
+    '''
+    Geometric altitude(s) [m] at which the air density falls to `density_kg_m3`.
+    Density decreases monotonically, so this inverts the tabulated profile.
+    '''
+    table = get_table()
+    return np.interp( np.log( density_kg_m3 ), table.log_density[::-1], table.altitude_m[::-1] )
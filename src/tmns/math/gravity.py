@@ -0,0 +1,89 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Gravitational accelleration evaluated directly on ECF positions.
+
+Functions accept a (3,) position or an (N,3) array of positions and return
+an (N,3) array of accellerations in m/s^2.  No geodetic conversion is needed.
+Only gravitation is modelled; centrifugal and Coriolis terms are not included.
+'''
+
+#  Numerical Python
+import numpy as np
+
+#  WGS84 / EGM96 constants
+GM       = 3.986004418e14     # m^3/s^2
+R_EQ     = 6378137.0          # m
+J2       = 1.08262668e-3
+
+#  Precomputed J2 coefficient
+J2_COEFF = 1.5 * J2 * R_EQ * R_EQ
+
+#  Model names used in configuration
+GRAVITY_CONSTANT   = 'constant'
+GRAVITY_POINT_MASS = 'point_mass'
+GRAVITY_J2         = 'j2'
+
+
+def point_mass( position_ecf, out = None ):
+    '''
+    Two-body gravitation, -GM r / |r|^3.
+    '''
+    r = np.atleast_2d( np.asarray( position_ecf, dtype = np.float64 ) )
+
+    r2     = np.einsum( 'ij,ij->i', r, r )
+    inv_r3 = 1.0 / (r2 * np.sqrt( r2 ))
+
+    if out is None:
+        out = np.empty( r.shape, dtype = np.float64 )
+
+    np.multiply( r, (-GM * inv_r3)[:,None], out = out )
+    return out
+
+
+def j2( position_ecf, out = None ):
+    '''
+    Two-body gravitation plus the J2 oblateness term.
+    '''
+    r = np.atleast_2d( np.asarray( position_ecf, dtype = np.float64 ) )
+
+    r2     = np.einsum( 'ij,ij->i', r, r )
+    inv_r2 = 1.0 / r2
+    inv_r3 = inv_r2 / np.sqrt( r2 )
+
+    factor = J2_COEFF * inv_r2
+    zr2    = r[:,2] * r[:,2] * inv_r2
+
+    if out is None:
+        out = np.empty( r.shape, dtype = np.float64 )
+
+    scale_xy = -GM * inv_r3 * (1.0 + factor * (1.0 - 5.0 * zr2))
+    scale_z  = -GM * inv_r3 * (1.0 + factor * (3.0 - 5.0 * zr2))
+
+    out[:,0] = r[:,0] * scale_xy
+    out[:,1] = r[:,1] * scale_xy
+    out[:,2] = r[:,2] * scale_z
+    return out
+
+
+def get_gravity_function( name: str ):
+    '''
+    ECF gravity function for a configured model name.  The constant model
+    depends on the local vertical, so it is handled by the motion model.
+    '''
+    if name == GRAVITY_POINT_MASS:
+        return point_mass
+    elif name == GRAVITY_J2:
+        return j2
+    elif name == GRAVITY_CONSTANT:
+        return None
+    else:
+        raise Exception( f'Unsupported gravity model: {name}' )
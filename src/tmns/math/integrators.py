@@ -0,0 +1,182 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Numerical integrators for first-order systems `dy/dt = func( t, y )`.
+
+States are NumPy arrays of any shape.  Motion models lay their state out as
+[position, velocity] along the last axis, which the Euler integrator relies on.
+'''
+
+#  Python Standard Libraries
+import math
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.math.physics import ( position, velocity )
+
+
+class Integrator:
+
+    #  Adaptive integrators choose their own step sizes, and return one worth carrying to the next call
+    adaptive = False
+
+    def step( self, func, t: float, y, dt: float ):
+        '''
+        Advance the state by at most `dt`.
+
+        Returns the new time, the new state, and the suggested size of the next step.
+        '''
+        raise NotImplementedError()
+
+    def integrate( self, func, t0: float, y0, t1: float, dt: float = None ):
+        '''
+        Advance the state from `t0` to exactly `t1`.
+
+        Returns the new state and the suggested size of the next step, which
+        adaptive integrators carry between calls.
+        '''
+        if dt is None or dt <= 0:
+            dt = t1 - t0
+
+        t   = t0
+        y   = y0
+        eps = 1e-12 * max( 1.0, abs( t1 ) )
+        while (t1 - t) > eps:
+
+            #  Clip the step so the last one lands on t1
+            h = min( dt, t1 - t )
+            t_new, y, dt_next = self.step( func, t, y, h )
+
+            #  Do not let the final clipped step shrink the carried step size
+            if h < dt and (t_new - t) >= h:
+                dt_next = max( dt_next, dt )
+
+            t  = t_new
+            dt = dt_next
+
+        return y, dt
+
+    def to_log_string( self, offset: int = 0 ):
+        return ' ' * offset + type( self ).__name__
+
+
+class Euler_Integrator( Integrator ):
+    '''
+    Semi-implicit Euler on a [position, velocity] state, matching `physics.velocity`
+    followed by `physics.position`.
+    '''
+
+    def step( self, func, t: float, y, dt: float ):
+
+        half = y.shape[-1] // 2
+
+        dy = func( t, y )
+
+        y_new = np.empty_like( y )
+        y_new[...,half:] = velocity( dt, y[...,half:], dy[...,half:] )
+        y_new[...,:half] = position( dt, y[...,:half], y_new[...,half:] )
+
+        return t + dt, y_new, dt
+
+
+class RK4_Integrator( Integrator ):
+    '''
+    Classic fixed-step fourth-order Runge-Kutta.
+    '''
+
+    def step( self, func, t: float, y, dt: float ):
+
+        k1 = func( t,             y )
+        k2 = func( t + 0.5 * dt,  y + (0.5 * dt) * k1 )
+        k3 = func( t + 0.5 * dt,  y + (0.5 * dt) * k2 )
+        k4 = func( t + dt,        y + dt * k3 )
+
+        return t + dt, y + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4), dt
+
+
+class RK45_Integrator( Integrator ):
+    '''
+    Adaptive Dormand-Prince 5(4) with embedded error control.
+
+    Steps are accepted when the scaled RMS error is at most one, using
+    `atol + rtol * |y|` per component.  For (N,k) states the RMS is taken per
+    row and the largest one controls the step.  The requested `dt` is an upper bound.
+    '''
+
+    adaptive = True
+
+    #  Dormand-Prince tableau
+    C = [ 0.0, 1.0/5.0, 3.0/10.0, 4.0/5.0, 8.0/9.0, 1.0, 1.0 ]
+
+    A = [ [],
+          [ 1.0/5.0 ],
+          [ 3.0/40.0,        9.0/40.0 ],
+          [ 44.0/45.0,      -56.0/15.0,      32.0/9.0 ],
+          [ 19372.0/6561.0, -25360.0/2187.0, 64448.0/6561.0, -212.0/729.0 ],
+          [ 9017.0/3168.0,  -355.0/33.0,     46732.0/5247.0,  49.0/176.0, -5103.0/18656.0 ],
+          [ 35.0/384.0,      0.0,            500.0/1113.0,    125.0/192.0, -2187.0/6784.0, 11.0/84.0 ] ]
+
+    #  5th order solution weights are the last row of A.  E holds (b5 - b4).
+    E = [ 71.0/57600.0, 0.0, -71.0/16695.0, 71.0/1920.0, -17253.0/339200.0, 22.0/525.0, -1.0/40.0 ]
+
+    SAFETY     = 0.9
+    MIN_FACTOR = 0.2
+    MAX_FACTOR = 10.0
+
+    def __init__( self, rtol: float = 1e-6, atol: float = 1e-3, max_rejects: int = 50 ):
+
+        self.rtol        = rtol
+        self.atol        = atol
+        self.max_rejects = max_rejects
+
+    def step( self, func, t: float, y, dt: float ):
+
+        for _ in range( self.max_rejects ):
+
+            k = [ func( t, y ) ]
+            for stage in range( 1, 7 ):
+                y_stage = y + dt * sum( a * k_i for a, k_i in zip( self.A[stage], k ) if a != 0.0 )
+                k.append( func( t + self.C[stage] * dt, y_stage ) )
+
+            #  The 7th stage is evaluated at the 5th order solution
+            y_new = y_stage
+            error = dt * sum( e * k_i for e, k_i in zip( self.E, k ) if e != 0.0 )
+
+            scale = self.atol + self.rtol * np.maximum( np.abs( y ), np.abs( y_new ) )
+            #  Batched states are controlled by their worst row
+            norm  = math.sqrt( float( np.max( np.mean( (error / scale) ** 2, axis = -1 ) ) ) )
+
+            if norm <= 1.0:
+                factor = self.MAX_FACTOR if norm == 0.0 else min( self.MAX_FACTOR, self.SAFETY * norm ** -0.2 )
+                return t + dt, y_new, dt * factor
+
+            dt *= max( self.MIN_FACTOR, self.SAFETY * norm ** -0.2 )
+
+        raise ArithmeticError( f'RK45 step rejected {self.max_rejects} times at t={t}' )
+
+    def to_log_string( self, offset: int = 0 ):
+        return ' ' * offset + f'RK45_Integrator( rtol: {self.rtol}, atol: {self.atol} )'
+
+
+def get_integrator( name: str, **options ):
+    '''
+    Build an integrator from its configuration name.
+    '''
+    if name == 'euler':
+        return Euler_Integrator()
+    elif name == 'rk4':
+        return RK4_Integrator()
+    elif name == 'rk45':
+        return RK45_Integrator( **options )
+    else:
+        raise Exception( f'Unsupported integrator: {name}' )
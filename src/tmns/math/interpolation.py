@@ -0,0 +1,58 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Interpolation of propagated states between integrator steps.
+'''
+
+#  Numerical Python
+import numpy as np
+
+
+def hermite( t0: float, p0, v0, t1: float, p1, v1, times ):
+    '''
+    Cubic Hermite interpolation of a trajectory from its end-point positions and velocities.
+
+    `p0`, `v0`, `p1` and `v1` share any shape S, and `times` is an (M,) array.
+    Returns positions and velocities of shape (M,)+S.  The interpolant matches
+    both end points exactly and is exact for cubic motion.
+    '''
+    p0 = np.asarray( p0, dtype = np.float64 )
+    v0 = np.asarray( v0, dtype = np.float64 )
+    p1 = np.asarray( p1, dtype = np.float64 )
+    v1 = np.asarray( v1, dtype = np.float64 )
+
+    times = np.atleast_1d( np.asarray( times, dtype = np.float64 ) )
+    shape = (times.shape[0],) + (1,) * p0.ndim
+
+    h = t1 - t0
+    if h == 0:
+        return ( np.broadcast_to( p0, shape[:1] + p0.shape ).copy(),
+                 np.broadcast_to( v0, shape[:1] + v0.shape ).copy() )
+
+    s  = ((times - t0) / h).reshape( shape )
+    s2 = s * s
+    s3 = s2 * s
+
+    #  Basis functions and their derivatives with respect to s
+    h00 =  2.0 * s3 - 3.0 * s2 + 1.0
+    h10 =        s3 - 2.0 * s2 + s
+    h01 = -2.0 * s3 + 3.0 * s2
+    h11 =        s3 -       s2
+
+    d00 =  6.0 * s2 - 6.0 * s
+    d10 =  3.0 * s2 - 4.0 * s + 1.0
+    d01 = -6.0 * s2 + 6.0 * s
+    d11 =  3.0 * s2 - 2.0 * s
+
+    position = h00 * p0 + (h10 * h) * v0 + h01 * p1 + (h11 * h) * v1
+    velocity = (d00 / h) * p0 + d10 * v0 + (d01 / h) * p1 + d11 * v1
+
+    return position, velocity
@@ -0,0 +1,130 @@
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#*                                                                                    *#
+#*                           Copyright (c) 2025 Terminus LLC                          *#
+#*                                                                                    *#
+#*                                All Rights Reserved.                                *#
+#*                                                                                    *#
+#*          Use of this source code is governed by LICENSE in the repo root.          *#
+#*                                                                                    *#
+#**************************** INTELLECTUAL PROPERTY RIGHTS ****************************#
+#
+'''
+Closed-form two-body propagation with the universal-variable Kepler solver.
+
+A single initial state is propagated to any number of time offsets in one
+vectorized call.  The formulation covers elliptic, parabolic and hyperbolic
+conics without branching on the orbit type.
+'''
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.math.gravity import GM
+
+#  Below this |z| the Stumpff functions use their series expansions
+STUMPFF_SERIES_LIMIT = 1e-6
+
+
+def stumpff_c( z ):
+    '''
+    Stumpff function C(z) = (1 - cos sqrt(z)) / z, for arrays of z.
+    '''
+    z = np.asarray( z, dtype = np.float64 )
+
+    pos = z >  STUMPFF_SERIES_LIMIT
+    neg = z < -STUMPFF_SERIES_LIMIT
+
+    sz_pos = np.sqrt( np.where( pos, z, 1.0 ) )
+    sz_neg = np.sqrt( np.where( neg, -z, 1.0 ) )
+
+    return np.where( pos, (1.0 - np.cos( sz_pos )) / np.where( pos, z, 1.0 ),
+           np.where( neg, (np.cosh( sz_neg ) - 1.0) / np.where( neg, -z, 1.0 ),
+                     0.5 - z / 24.0 ) )
+
+
+def stumpff_s( z ):
+    '''
+    Stumpff function S(z) = (sqrt(z) - sin sqrt(z)) / sqrt(z)^3, for arrays of z.
+    '''
+    z = np.asarray( z, dtype = np.float64 )
+
+    pos = z >  STUMPFF_SERIES_LIMIT
+    neg = z < -STUMPFF_SERIES_LIMIT
+
+    sz_pos = np.sqrt( np.where( pos, z, 1.0 ) )
+    sz_neg = np.sqrt( np.where( neg, -z, 1.0 ) )
+
+    return np.where( pos, (sz_pos - np.sin( sz_pos )) / sz_pos ** 3,
+           np.where( neg, (np.sinh( sz_neg ) - sz_neg) / sz_neg ** 3,
+                     1.0 / 6.0 - z / 120.0 ) )
+
+
+def universal_anomaly( r0: float, vr0: float, alpha: float, dt, mu: float = GM,
+                       tol: float = 1e-10, max_iterations: int = 50 ):
+    '''
+    Solve the universal Kepler equation for the anomaly chi at each time offset.
+
+    `alpha` is the reciprocal semi-major axis 2/r0 - v0^2/mu.
+    '''
+    dt      = np.asarray( dt, dtype = np.float64 )
+    sqrt_mu = np.sqrt( mu )
+
+    #  Starting guesses for bound and unbound conics
+    chi = sqrt_mu * abs( alpha ) * dt
+    if alpha <= 0:
+        chi = sqrt_mu * dt / r0
+
+    for _ in range( max_iterations ):
+
+        chi2 = chi * chi
+        z    = alpha * chi2
+        C    = stumpff_c( z )
+        S    = stumpff_s( z )
+
+        F  = (r0 * vr0 / sqrt_mu) * chi2 * C + (1.0 - alpha * r0) * chi2 * chi * S + r0 * chi - sqrt_mu * dt
+        dF = (r0 * vr0 / sqrt_mu) * chi * (1.0 - z * S) + (1.0 - alpha * r0) * chi2 * C + r0
+
+        delta = F / dF
+        chi   = chi - delta
+
+        if np.all( np.abs( delta ) <= tol * np.maximum( 1.0, np.abs( chi ) ) ):
+            break
+
+    return chi
+
+
+def propagate( r0, v0, dt, mu: float = GM ):
+    '''
+    Propagate the position `r0` and velocity `v0` (3,) along their two-body conic.
+
+    `dt` is a scalar or (M,) array of time offsets.  Returns (M,3) positions and velocities.
+    '''
+    r0 = np.asarray( r0, dtype = np.float64 ).reshape(3)
+    v0 = np.asarray( v0, dtype = np.float64 ).reshape(3)
+    dt = np.atleast_1d( np.asarray( dt, dtype = np.float64 ) )
+
+    r0_mag  = np.linalg.norm( r0 )
+    vr0     = np.dot( r0, v0 ) / r0_mag
+    alpha   = 2.0 / r0_mag - np.dot( v0, v0 ) / mu
+    sqrt_mu = np.sqrt( mu )
+
+    chi  = universal_anomaly( r0_mag, vr0, alpha, dt, mu = mu )
+    chi2 = chi * chi
+    z    = alpha * chi2
+    C    = stumpff_c( z )
+    S    = stumpff_s( z )
+
+    #  Lagrange coefficients
+    f = 1.0 - chi2 / r0_mag * C
+    g = dt - chi2 * chi / sqrt_mu * S
+
+    r     = f[:,None] * r0 + g[:,None] * v0
+    r_mag = np.linalg.norm( r, axis = 1 )
+
+    f_dot = sqrt_mu / (r_mag * r0_mag) * (z * chi * S - chi)
+    g_dot = 1.0 - chi2 / r_mag * C
+
+    v = f_dot[:,None] * r0 + g_dot[:,None] * v0
+
+    return r, v
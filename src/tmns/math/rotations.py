@@ -86,12 +86,18 @@ class Quaternion:
 
     def __add__(self, other):
 
+        if isinstance(other, Compact_Quaternion):
+            other = other.to_quaternion()
+
         if isinstance(other, Quaternion):
             return Quaternion(data=self.data + other.data)
         raise TypeError("Other type must be Quaternion")
 
     def __sub__(self, other):
 
+        if isinstance(other, Compact_Quaternion):
+            other = other.to_quaternion()
+
         if isinstance(other, Quaternion):
             return Quaternion(data=self.data - other.data)
         raise TypeError("Other type must be Quaternion")
@@ -102,6 +108,14 @@ class Quaternion:
         if isinstance(other, int) or isinstance(other, float):
             return Quaternion(data=other * self.data)
 
+        #  Quaternion x Quaternion_Array
+        if isinstance(other, Quaternion_Array):
+            return other.__rmul__(self)
+
+        #  Quaternion x Compact_Quaternion
+        if isinstance(other, Compact_Quaternion):
+            other = other.to_quaternion()
+
         #  Quaternion x Quaternion
         if isinstance(other, Quaternion):
 
@@ -322,53 +336,626 @@ class Quaternion:
         return q * (0.5 / math.sqrt(t))
 
 
-def rotation_matrix(axis: Axis, theta_rad: float):
+class Compact_Quaternion:
     """
-    Reference: https://mathworld.wolfram.com/RotationMatrix.html
+    Scalar quaternion stored as four plain floats.
+
+    Arithmetic is written out inline so single-body updates avoid the per-call
+    array allocations of `Quaternion`.  Methods ending in `_` modify in place.
+    The `w()`, `x()`, `y()`, `z()` accessors and `data` match `Quaternion`, so
+    either type works where a quaternion is read.
     """
 
-    if axis == Axis.X:
-        return np.array(
-            [
-                [1.0, 0.0, 0.0],
-                [0.0, math.cos(theta_rad), math.sin(theta_rad)],
-                [0.0, -math.sin(theta_rad), math.cos(theta_rad)],
-            ],
-            dtype=np.float64,
+    __slots__ = ("_w", "_x", "_y", "_z")
+
+    def __init__(self, w: float = 1.0, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self._w = w
+        self._x = x
+        self._y = y
+        self._z = z
+
+    @property
+    def data(self):
+        """
+        The components as a new [w, x, y, z] array.  Writing to it does not
+        change the quaternion; assign to `data` instead.
+        """
+        return np.array((self._w, self._x, self._y, self._z), dtype=np.float64)
+
+    @data.setter
+    def data(self, value):
+        self._w, self._x, self._y, self._z = (float(v) for v in value)
+
+    def get_real(self):
+        return self._w
+
+    def set_real(self, value):
+        self._w = float(value)
+
+    def get_imaginary(self):
+        return np.array((self._x, self._y, self._z), dtype=np.float64)
+
+    def set_imaginary(self, value):
+        self._x, self._y, self._z = (float(v) for v in value)
+
+    def w(self):
+        return self._w
+
+    def x(self):
+        return self._x
+
+    def y(self):
+        return self._y
+
+    def z(self):
+        return self._z
+
+    def to_quaternion(self):
+        return Quaternion(self._w, self._x, self._y, self._z)
+
+    @staticmethod
+    def from_quaternion(q):
+        return Compact_Quaternion(
+            float(q.data[0]), float(q.data[1]), float(q.data[2]), float(q.data[3])
         )
-    elif axis == Axis.Y:
-        return np.array(
-            [
-                [math.cos(theta_rad), 0.0, -math.sin(theta_rad)],
-                [0.0, 1.0, 0.0],
-                [math.sin(theta_rad), 0.0, math.cos(theta_rad)],
-            ],
-            dtype=np.float64,
+
+    def copy(self):
+        return Compact_Quaternion(self._w, self._x, self._y, self._z)
+
+    def conj(self):
+        return Compact_Quaternion(self._w, -self._x, -self._y, -self._z)
+
+    def mag2(self):
+        return self._w * self._w + self._x * self._x + self._y * self._y + self._z * self._z
+
+    def mag(self):
+        return math.sqrt(self.mag2())
+
+    def normalize(self):
+        return self.copy().normalize_()
+
+    def normalize_(self):
+
+        scale = 1.0 / self.mag()
+        self._w *= scale
+        self._x *= scale
+        self._y *= scale
+        self._z *= scale
+        return self
+
+    def is_normalized(self, TOLERANCE: float = 1e-8):
+        return math.fabs(self.mag() - 1.0) <= TOLERANCE
+
+    def inverse(self, TOLERANCE: float = 1e-8):
+
+        mag = self.mag()
+        if mag < TOLERANCE:
+            raise ArithmeticError("Quaternion is not large enough.")
+
+        scale = 1.0 / mag
+        return Compact_Quaternion(
+            self._w * scale, -self._x * scale, -self._y * scale, -self._z * scale
         )
-    elif axis == Axis.Z:
-        return np.array(
-            [
-                [math.cos(theta_rad), math.sin(theta_rad), 0.0],
-                [-math.sin(theta_rad), math.cos(theta_rad), 0.0],
-                [0.0, 0.0, 1.0],
-            ],
-            dtype=np.float64,
+
+    def __add__(self, other):
+
+        if isinstance(other, Quaternion):
+            other = Compact_Quaternion.from_quaternion(other)
+
+        if isinstance(other, Compact_Quaternion):
+            return Compact_Quaternion(
+                self._w + other._w, self._x + other._x, self._y + other._y, self._z + other._z
+            )
+        raise TypeError("Other type must be Compact_Quaternion or Quaternion")
+
+    def __sub__(self, other):
+
+        if isinstance(other, Quaternion):
+            other = Compact_Quaternion.from_quaternion(other)
+
+        if isinstance(other, Compact_Quaternion):
+            return Compact_Quaternion(
+                self._w - other._w, self._x - other._x, self._y - other._y, self._z - other._z
+            )
+        raise TypeError("Other type must be Compact_Quaternion or Quaternion")
+
+    def __mul__(self, other):
+
+        #  Scalar multiplication
+        if isinstance(other, (int, float)):
+            return Compact_Quaternion(
+                self._w * other, self._x * other, self._y * other, self._z * other
+            )
+
+        if isinstance(other, Quaternion):
+            other = Compact_Quaternion.from_quaternion(other)
+
+        if isinstance(other, Compact_Quaternion):
+            aw, ax, ay, az = self._w, self._x, self._y, self._z
+            bw, bx, by, bz = other._w, other._x, other._y, other._z
+            return Compact_Quaternion(
+                aw * bw - ax * bx - ay * by - az * bz,
+                aw * bx + ax * bw + ay * bz - az * by,
+                aw * by + ay * bw - ax * bz + az * bx,
+                aw * bz + az * bw + ax * by - ay * bx,
+            )
+
+        raise NotImplementedError(f"Not supported for other type: {type(other)}")
+
+    def __rmul__(self, other):
+
+        if isinstance(other, (int, float)):
+            return self * other
+
+        raise NotImplementedError(
+            f"__rmul__ Not Implemented for other type: {type(other)}"
         )
-    else:
+
+    def imul(self, other):
+        """
+        In-place Hamilton product, `self = self * other`.
+        """
+        aw, ax, ay, az = self._w, self._x, self._y, self._z
+        bw, bx, by, bz = other._w, other._x, other._y, other._z
+
+        self._w = aw * bw - ax * bx - ay * by - az * bz
+        self._x = aw * bx + ax * bw + ay * bz - az * by
+        self._y = aw * by + ay * bw - ax * bz + az * bx
+        self._z = aw * bz + az * bw + ax * by - ay * bx
+        return self
+
+    def __str__(self):
+
+        return f"Compact_Quaternion( w: {self._w}, x: {self._x}, y: {self._y}, z: {self._z}, len: {self.mag()})"
+
+    #  Reads the components only through the shared accessors
+    to_directional_cosine_matrix = Quaternion.to_directional_cosine_matrix
+
+    def to_rotation_matrix(self, out=None):
+        """
+        Same convention as `Quaternion.to_rotation_matrix`.  Optionally fills `out`.
+        """
+
+        w, x, y, z = self._w, self._x, self._y, self._z
+
+        xx2 = 2 * x * x
+        yy2 = 2 * y * y
+        zz2 = 2 * z * z
+        xy2 = 2 * x * y
+        wz2 = 2 * w * z
+        zx2 = 2 * z * x
+        wy2 = 2 * w * y
+        yz2 = 2 * y * z
+        wx2 = 2 * w * x
+
+        rows = (
+            (1.0 - yy2 - zz2, xy2 + wz2, zx2 - wy2),
+            (xy2 - wz2, 1.0 - xx2 - zz2, yz2 + wx2),
+            (zx2 + wy2, yz2 - wx2, 1.0 - xx2 - yy2),
+        )
+
+        if out is None:
+            return np.array(rows, dtype=np.float64)
+
+        out[:] = rows
+        return out
+
+    @staticmethod
+    def from_angle_axis(angle_rad: float, axis):
+
+        ax, ay, az = float(axis[0]), float(axis[1]), float(axis[2])
+        scale = math.sin(0.5 * angle_rad) / math.sqrt(ax * ax + ay * ay + az * az)
+
+        return Compact_Quaternion(
+            math.cos(0.5 * angle_rad), ax * scale, ay * scale, az * scale
+        )
+
+    @staticmethod
+    def from_euler_angle(axis: Axis, angle_rad: float):
+
+        cos_angle = math.cos(angle_rad / 2.0)
+        sin_angle = math.sin(angle_rad / 2.0)
+
+        if axis == Axis.X:
+            return Compact_Quaternion(cos_angle, sin_angle, 0.0, 0.0)
+        elif axis == Axis.Y:
+            return Compact_Quaternion(cos_angle, 0.0, sin_angle, 0.0)
+        elif axis == Axis.Z:
+            return Compact_Quaternion(cos_angle, 0.0, 0.0, sin_angle)
+        else:
+            return None
+
+    @staticmethod
+    def from_euler_angles(
+        axis1: Axis,
+        angle1_rad: float,
+        axis2: Axis,
+        angle2_rad: float,
+        axis3: Axis,
+        angle3_rad: float,
+    ):
+
+        q = Compact_Quaternion.from_euler_angle(axis1, angle1_rad)
+        q.imul(Compact_Quaternion.from_euler_angle(axis2, angle2_rad))
+        q.imul(Compact_Quaternion.from_euler_angle(axis3, angle3_rad))
+
+        return q
+
+    @staticmethod
+    def from_rotation_matrix(M):
+
+        return Compact_Quaternion.from_quaternion(Quaternion.from_rotation_matrix(M))
+
+
+class Quaternion_Array:
+    """
+    Array of N quaternions backed by an (N,4) float64 array of [w, x, y, z] rows.
+    Operations match the scalar `Quaternion` row by row.
+    """
+
+    def __init__(self, data=None, count: int = 0):
+        if data is None:
+            self.data = np.zeros((count, 4), dtype=np.float64)
+            self.data[:, 0] = 1.0
+        else:
+            self.data = np.asarray(data, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __getitem__(self, index):
+
+        if isinstance(index, (int, np.integer)):
+            return Quaternion(data=np.copy(self.data[index]))
+        return Quaternion_Array(data=self.data[index])
+
+    def get_real(self):
+        return self.data[:, 0]
+
+    def get_imaginary(self):
+        return self.data[:, 1:]
+
+    def w(self):
+        return self.data[:, 0]
+
+    def x(self):
+        return self.data[:, 1]
+
+    def y(self):
+        return self.data[:, 2]
+
+    def z(self):
+        return self.data[:, 3]
+
+    def conj(self):
+        data = np.copy(self.data)
+        data[:, 1:] *= -1
+        return Quaternion_Array(data=data)
+
+    def mag2(self):
+        return np.einsum("ij,ij->i", self.data, self.data)
+
+    def mag(self):
+        return np.sqrt(self.mag2())
+
+    def normalize(self):
+        return Quaternion_Array(data=self.data / self.mag()[:, None])
+
+    def is_normalized(self, TOLERANCE: float = 1e-8):
+        return np.abs(self.mag() - 1.0) <= TOLERANCE
+
+    def inverse(self, TOLERANCE: float = 1e-8):
+
+        mag = self.mag()
+        if np.any(mag < TOLERANCE):
+            raise ArithmeticError("Quaternion is not large enough.")
+
+        return Quaternion_Array(data=self.conj().data / mag[:, None])
+
+    def __add__(self, other):
+
+        if isinstance(other, (Quaternion_Array, Quaternion)):
+            return Quaternion_Array(data=self.data + other.data)
+        raise TypeError("Other type must be Quaternion or Quaternion_Array")
+
+    def __sub__(self, other):
+
+        if isinstance(other, (Quaternion_Array, Quaternion)):
+            return Quaternion_Array(data=self.data - other.data)
+        raise TypeError("Other type must be Quaternion or Quaternion_Array")
+
+    @staticmethod
+    def hamilton_product(a, b, out=None):
+        """
+        Row-wise Hamilton product of two broadcastable (...,4) arrays.
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+
+        aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+        bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+        if out is None:
+            out = np.empty(np.broadcast_shapes(a.shape, b.shape), dtype=np.float64)
+
+        out[..., 0] = aw * bw - ax * bx - ay * by - az * bz
+        out[..., 1] = aw * bx + ax * bw + ay * bz - az * by
+        out[..., 2] = aw * by + ay * bw - ax * bz + az * bx
+        out[..., 3] = aw * bz + az * bw + ax * by - ay * bx
+
+        return out
+
+    def __mul__(self, other):
+
+        #  Scalar or per-row scalar multiplication
+        if isinstance(other, (int, float)):
+            return Quaternion_Array(data=other * self.data)
+
+        if isinstance(other, np.ndarray):
+            return Quaternion_Array(data=self.data * other.reshape(-1, 1))
+
+        #  Quaternion x Quaternion, broadcasting a single Quaternion over the rows
+        if isinstance(other, (Quaternion_Array, Quaternion)):
+            return Quaternion_Array(
+                data=Quaternion_Array.hamilton_product(self.data, other.data)
+            )
+
+        raise NotImplementedError(f"Not supported for other type: {type(other)}")
+
+    def __rmul__(self, other):
+
+        if isinstance(other, (int, float, np.ndarray)):
+            return self * other
+
+        if isinstance(other, Quaternion):
+            return Quaternion_Array(
+                data=Quaternion_Array.hamilton_product(other.data, self.data)
+            )
+
+        raise NotImplementedError(
+            f"__rmul__ Not Implemented for other type: {type(other)}"
+        )
+
+    def __str__(self):
+
+        return f"Quaternion_Array( size: {len(self)} )"
+
+    def to_rotation_matrix(self):
+        """
+        Stacked form of `Quaternion.to_rotation_matrix`.  Returns an (N,3,3) array.
+        """
+
+        w = self.w()
+        x = self.x()
+        y = self.y()
+        z = self.z()
+
+        xx2 = 2 * x * x
+        yy2 = 2 * y * y
+        zz2 = 2 * z * z
+        xy2 = 2 * x * y
+        wz2 = 2 * w * z
+        zx2 = 2 * z * x
+        wy2 = 2 * w * y
+        yz2 = 2 * y * z
+        wx2 = 2 * w * x
+
+        rot_mat = np.empty((len(self), 3, 3), dtype=np.float64)
+        rot_mat[:, 0, 0] = 1.0 - yy2 - zz2
+        rot_mat[:, 0, 1] = xy2 + wz2
+        rot_mat[:, 0, 2] = zx2 - wy2
+
+        rot_mat[:, 1, 0] = xy2 - wz2
+        rot_mat[:, 1, 1] = 1.0 - xx2 - zz2
+        rot_mat[:, 1, 2] = yz2 + wx2
+
+        rot_mat[:, 2, 0] = zx2 + wy2
+        rot_mat[:, 2, 1] = yz2 - wx2
+        rot_mat[:, 2, 2] = 1.0 - xx2 - yy2
+
+        return rot_mat
+
+    def rotate(self, vectors):
+        """
+        Apply each rotation matrix to the matching row of an (N,3) array.
+        """
+        return np.einsum("nij,nj->ni", self.to_rotation_matrix(), vectors)
+
+    @staticmethod
+    def from_quaternions(quaternions):
+
+        return Quaternion_Array(data=np.array([q.data for q in quaternions]))
+
+    @staticmethod
+    def from_angle_axis(angle_rad, axis):
+
+        angle_rad = np.atleast_1d(np.asarray(angle_rad, dtype=np.float64))
+        axis = np.asarray(axis, dtype=np.float64).reshape(-1, 3)
+        axis_norm = axis / np.linalg.norm(axis, axis=1)[:, None]
+
+        count = max(angle_rad.shape[0], axis_norm.shape[0])
+
+        data = np.empty((count, 4), dtype=np.float64)
+        data[:, 0] = np.cos(0.5 * angle_rad)
+        data[:, 1:] = np.sin(0.5 * angle_rad)[:, None] * axis_norm
+
+        return Quaternion_Array(data=data)
+
+    @staticmethod
+    def from_euler_angle(axis: Axis, angle_rad):
+
+        angle_rad = np.atleast_1d(np.asarray(angle_rad, dtype=np.float64))
+
+        if axis == Axis.X:
+            column = 1
+        elif axis == Axis.Y:
+            column = 2
+        elif axis == Axis.Z:
+            column = 3
+        else:
+            return None
+
+        data = np.zeros((angle_rad.shape[0], 4), dtype=np.float64)
+        data[:, 0] = np.cos(angle_rad / 2.0)
+        data[:, column] = np.sin(angle_rad / 2.0)
+
+        return Quaternion_Array(data=data)
+
+    @staticmethod
+    def from_euler_angles(
+        axis1: Axis,
+        angle1_rad,
+        axis2: Axis,
+        angle2_rad,
+        axis3: Axis,
+        angle3_rad,
+    ):
+        """
+        Vectorized `Quaternion.from_euler_angles`.  Angles may be scalars or
+        broadcastable arrays.
+        """
+        angle1_rad, angle2_rad, angle3_rad = np.broadcast_arrays(
+            np.atleast_1d(angle1_rad), np.atleast_1d(angle2_rad), np.atleast_1d(angle3_rad)
+        )
+
+        q1 = Quaternion_Array.from_euler_angle(axis1, angle1_rad)
+        q2 = Quaternion_Array.from_euler_angle(axis2, angle2_rad)
+        q3 = Quaternion_Array.from_euler_angle(axis3, angle3_rad)
+
+        return q1 * q2 * q3
+
+    @staticmethod
+    def from_rotation_matrix(M):
+        """
+        Stacked form of `Quaternion.from_rotation_matrix` over an (N,3,3) array.
+        Each row takes the same branch as the scalar version.
+        """
+        M = np.asarray(M, dtype=np.float64).reshape(-1, 3, 3)
+
+        m00, m01, m02 = M[:, 0, 0], M[:, 0, 1], M[:, 0, 2]
+        m10, m11, m12 = M[:, 1, 0], M[:, 1, 1], M[:, 1, 2]
+        m20, m21, m22 = M[:, 2, 0], M[:, 2, 1], M[:, 2, 2]
+
+        case_a = (m22 < 0) & (m00 > m11)
+        case_b = (m22 < 0) & ~(m00 > m11)
+        case_c = ~(m22 < 0) & (m00 < -m11)
+
+        t = np.select(
+            [case_a, case_b, case_c],
+            [1 + m00 - m11 - m22, 1 - m00 + m11 - m22, 1 - m00 - m11 + m22],
+            default=1 + m00 + m11 + m22,
+        )
+
+        data = np.empty((M.shape[0], 4), dtype=np.float64)
+        data[:, 0] = np.select(
+            [case_a, case_b, case_c], [m12 - m21, m20 - m02, m01 - m10], default=t
+        )
+        data[:, 1] = np.select(
+            [case_a, case_b, case_c], [t, m01 + m10, m20 + m02], default=m12 - m21
+        )
+        data[:, 2] = np.select(
+            [case_a, case_b, case_c], [m01 + m10, t, m12 + m21], default=m20 - m02
+        )
+        data[:, 3] = np.select(
+            [case_a, case_b, case_c], [m20 + m02, m12 + m21, t], default=m01 - m10
+        )
+
+        data *= (0.5 / np.sqrt(t))[:, None]
+
+        return Quaternion_Array(data=data)
+
+
+def rotation_matrix(axis: Axis, theta_rad):
+    """
+    Reference: https://mathworld.wolfram.com/RotationMatrix.html
+
+    `theta_rad` may be a scalar, giving a (3,3) matrix, or an array of shape S,
+    giving stacked matrices of shape S + (3,3).  Scalars skip the array setup,
+    and both paths give identical matrices.
+    """
+
+    #  Python and NumPy floats skip the array setup
+    if isinstance(theta_rad, (int, float)):
+
+        cos_theta = math.cos(theta_rad)
+        sin_theta = math.sin(theta_rad)
+
+        if axis == Axis.X:
+            return np.array(
+                [
+                    [1.0, 0.0, 0.0],
+                    [0.0, cos_theta, sin_theta],
+                    [0.0, -sin_theta, cos_theta],
+                ],
+                dtype=np.float64,
+            )
+        elif axis == Axis.Y:
+            return np.array(
+                [
+                    [cos_theta, 0.0, -sin_theta],
+                    [0.0, 1.0, 0.0],
+                    [sin_theta, 0.0, cos_theta],
+                ],
+                dtype=np.float64,
+            )
+        elif axis == Axis.Z:
+            return np.array(
+                [
+                    [cos_theta, sin_theta, 0.0],
+                    [-sin_theta, cos_theta, 0.0],
+                    [0.0, 0.0, 1.0],
+                ],
+                dtype=np.float64,
+            )
+        else:
+            return None
+
+    if not axis in (Axis.X, Axis.Y, Axis.Z):
         return None
 
+    theta_rad = np.asarray(theta_rad, dtype=np.float64)
+
+    cos_theta = np.cos(theta_rad)
+    sin_theta = np.sin(theta_rad)
+
+    M = np.zeros(theta_rad.shape + (3, 3), dtype=np.float64)
+
+    if axis == Axis.X:
+        M[..., 0, 0] = 1.0
+        M[..., 1, 1] = cos_theta
+        M[..., 1, 2] = sin_theta
+        M[..., 2, 1] = -sin_theta
+        M[..., 2, 2] = cos_theta
+    elif axis == Axis.Y:
+        M[..., 0, 0] = cos_theta
+        M[..., 0, 2] = -sin_theta
+        M[..., 1, 1] = 1.0
+        M[..., 2, 0] = sin_theta
+        M[..., 2, 2] = cos_theta
+    else:
+        M[..., 0, 0] = cos_theta
+        M[..., 0, 1] = sin_theta
+        M[..., 1, 0] = -sin_theta
+        M[..., 1, 1] = cos_theta
+        M[..., 2, 2] = 1.0
+
+    return M
+
 
 def euler_angles_to_rotation_matrix(
     axis1: Axis,
-    psi_rad: float,
+    psi_rad,
     axis2: Axis,
-    theta_rad: float,
+    theta_rad,
     axis3: Axis,
-    phi_rad: float,
+    phi_rad,
 ):
+    """
+    Angles may be scalars or broadcastable arrays.  Array inputs return stacked
+    (...,3,3) matrices.
+    """
     M_a = rotation_matrix(axis1, psi_rad)
     M_b = rotation_matrix(axis2, theta_rad)
     M_c = rotation_matrix(axis3, phi_rad)
 
     return M_c @ M_b @ M_a
-
@@ -0,0 +1,367 @@
+#  Python Standard Libraries
+import logging
+import math
+
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.geo.coordinate  import ecf_to_geographic_many
+from tmns.geo.local_frame import up_vectors
+from tmns.math             import atmosphere
+from tmns.math.gravity     import ( get_gravity_function,
+                                    GRAVITY_CONSTANT )
+from tmns.math.integrators import Integrator
+from tmns.sim.events       import ( EVENT_BURNOUT,
+                                    EVENT_IMPACT,
+                                    EVENT_LAUNCH,
+                                    Event_Record,
+                                    locate_event )
+from tmns.sim.motion       import ( ATMOSPHERE_US1976,
+                                    Motion_Model,
+                                    Straight_Model )
+
+#  Engines selectable from the [general] section
+ENGINE_OBJECT = 'object'
+ENGINE_BATCH  = 'batch'
+
+
+class Batch_Engine:
+    '''
+    Struct-of-arrays propagator for many `Straight_Model` missiles.
+
+    Every missile's state and parameters live in contiguous (N,...) arrays, and
+    all missiles in the same flight phase are advanced with one integrator call
+    on an (N,6) [P, V] state.  Missiles whose launch or burnout falls inside a
+    step are integrated separately so the phase boundaries stay exact.
+    '''
+
+    def __init__( self, models: list[Straight_Model], integrator: Integrator = None ):
+
+        if len( models ) == 0:
+            raise Exception( 'Batch engine requires at least one motion model' )
+
+        if any( model.coast_altitude_m is not None for model in models ):
+            raise Exception( 'Coast mode is not supported by the batch engine' )
+
+        #  One integrator advances the whole batch
+        self.integrator = integrator if integrator is not None else models[0].integrator
+        if integrator is None:
+            for model in models[1:]:
+                if model.integrator.to_log_string() != self.integrator.to_log_string():
+                    raise Exception( 'Batch engine requires every missile to use the same integrator' )
+
+        self.size    = len( models )
+        self.t_cur   = 0.0
+        self.dt_hint = None
+        self.g_e     = models[0].g_e
+
+        def column( name ):
+            return np.array( [ float( getattr( model, name ) ) for model in models ], dtype = np.float64 )
+
+        #  Live state
+        self.P = np.array( [ model.P_cur.reshape(3) for model in models ], dtype = np.float64 )
+        self.V = np.array( [ model.V_cur.reshape(3) for model in models ], dtype = np.float64 )
+
+        #  Vehicle parameters
+        self.mass_kg           = column( 'mass_kg' )
+        self.thrust_kN         = column( 'thrust_kN' )
+        self.radius_m          = column( 'radius_m' )
+        self.drag_coefficient  = column( 'drag_coefficient' )
+        self.air_mass_density  = column( 'air_mass_density' )
+        self.ground_altitude_m = column( 'ground_altitude_m' )
+        self.start_time_sec    = column( 'start_time_offset_sec' )
+        self.burnout_time_sec  = self.start_time_sec + column( 'burn_time_sec' )
+        self.forward_enu       = np.array( [ model.forward_enu.reshape(3) for model in models ], dtype = np.float64 )
+        self.forward_ecf       = np.array( [ model.forward_ecf_t0.reshape(3) for model in models ], dtype = np.float64 )
+
+        #  Drag scale 0.5 * C_d * A / m, so drag is rho * |V| * V * drag_scale
+        self.drag_scale = 0.5 * self.drag_coefficient * (math.pi * self.radius_m ** 2) / self.mass_kg
+
+        #  Model selections as row masks
+        self.use_us1976     = np.array( [ model.atmosphere_model == ATMOSPHERE_US1976 for model in models ] )
+        self.gravity_models = np.array( [ model.gravity_model for model in models ] )
+        self.gravity_masks  = { name: self.gravity_models == name for name in np.unique( self.gravity_models ) }
+
+        #  Missiles sharing a thrust-direction configuration share one strategy
+        self.thrust_directions = {}
+        for idx, model in enumerate( models ):
+            key = model.thrust_direction.to_log_string()
+            if not key in self.thrust_directions:
+                self.thrust_directions[key] = ( model.thrust_direction, np.zeros( self.size, dtype = bool ) )
+            self.thrust_directions[key][1][idx] = True
+
+        #  Phase flags
+        self.launched = np.zeros( self.size, dtype = bool )
+        self.impacted = np.zeros( self.size, dtype = bool )
+
+        self.events = [ [] for _ in range( self.size ) ]
+
+    def update( self, t_delta: float ):
+        '''
+        Advance every missile by `t_delta` seconds.
+        '''
+        self.advance_to( self.t_cur + t_delta )
+
+    def advance_to( self, t_cur: float ):
+        '''
+        Advance every missile to the absolute time `t_cur`.
+        '''
+        t_prev     = self.t_cur
+        self.t_cur = t_cur
+
+        #  Missiles that are on the pad or on the ground do nothing
+        live = ~self.impacted & (self.start_time_sec <= t_cur)
+
+        for idx in np.flatnonzero( live & ~self.launched ):
+            self.record_event( idx, EVENT_LAUNCH, self.start_time_sec[idx], self.P[idx], self.V[idx] )
+        self.launched |= live
+
+        #  Rows already in flight with no phase change inside the step share one call
+        boundary = (self.burnout_time_sec > t_prev) & (self.burnout_time_sec < t_cur)
+        regular  = live & (self.start_time_sec <= t_prev) & ~boundary
+
+        rows = np.flatnonzero( regular )
+        if rows.size > 0:
+            burning = t_prev < self.burnout_time_sec[rows]
+            y, dt_next = self.advance_rows( rows, t_prev, t_cur, burning, self.dt_hint )
+            if self.integrator.adaptive:
+                self.dt_hint = dt_next
+            self.store_rows( rows, y, t_cur )
+
+        #  Launches and burnouts inside the step, one missile at a time
+        for idx in np.flatnonzero( live & ~regular ):
+            self.advance_segments( idx, max( t_prev, self.start_time_sec[idx] ), t_cur )
+
+    def advance_segments( self, idx: int, t_begin: float, t_end: float ):
+        '''
+        Advance one missile, splitting the step at its burnout time.
+        '''
+        rows      = np.array( [ idx ] )
+        t_burnout = self.burnout_time_sec[idx]
+
+        for t_start, t_stop in Straight_Model.phase_segments( t_begin, t_end, [ t_burnout ] ):
+
+            burning = np.array( [ t_start < t_burnout ] )
+            y, _ = self.advance_rows( rows, t_start, t_stop, burning, self.dt_hint )
+            self.store_rows( rows, y, t_stop )
+
+            if self.impacted[idx]:
+                break
+
+    def advance_rows( self, rows, t_start: float, t_end: float, burning, dt: float ):
+        '''
+        Integrate a subset of rows over one phase segment, resolving ground impacts.
+
+        Returns the (k,6) end states and the suggested next step size.
+        '''
+        y_start = np.concatenate( [ self.P[rows], self.V[rows] ], axis = 1 )
+
+        y, dt_next = self.integrator.integrate( self.derivative_func( rows, burning ),
+                                                t_start,
+                                                y_start,
+                                                t_end,
+                                                dt = dt )
+
+        #  Ground impacts, located per missile by re-propagating from the segment start
+        h_start = self.height_above_ground( rows, y_start )
+        h_end   = self.height_above_ground( rows, y )
+
+        for k in np.flatnonzero( (h_start > 0) & (h_end <= 0) ):
+
+            row_k   = rows[k:k+1]
+            func_k  = self.derivative_func( row_k, burning[k:k+1] )
+            y_start_k = y_start[k:k+1]
+
+            def impact_func( t ):
+                y_t, _ = self.integrator.integrate( func_k, t_start, y_start_k, t, dt = dt )
+                return self.height_above_ground( row_k, y_t )[0]
+
+            #  Adaptive steps on a single row may end just above the batched result
+            if impact_func( t_end ) > 0:
+                t_impact = t_end
+            else:
+                t_impact = locate_event( impact_func, t_start, t_end )
+                y[k], _  = self.integrator.integrate( func_k, t_start, y_start_k, t_impact, dt = dt )
+
+            self.impacted[row_k[0]] = True
+            self.record_event( row_k[0], EVENT_IMPACT, t_impact, y[k,:3], y[k,3:] )
+
+        return y, dt_next
+
+    def store_rows( self, rows, y, t_end: float ):
+        '''
+        Write integrated states back and record burnouts reached at the segment end.
+        '''
+        self.P[rows] = y[:,:3]
+        self.V[rows] = y[:,3:]
+
+        for idx in rows[ (self.burnout_time_sec[rows] == t_end) & ~self.impacted[rows] ]:
+            self.record_event( idx, EVENT_BURNOUT, t_end, self.P[idx], self.V[idx] )
+
+    def height_above_ground( self, rows, y ):
+        '''
+        Geodetic height of each row's position above its ground altitude.
+        '''
+        return ecf_to_geographic_many( y[:,:3] )[:,2] - self.ground_altitude_m[rows]
+
+    def derivative_func( self, rows, burning ):
+        '''
+        Time derivative of the (k,6) state of `rows`, with thrust on for `burning` rows.
+        '''
+        burn_rows = np.flatnonzero( burning )
+
+        def derivative( t: float, y ):
+            dy = np.empty_like( y )
+            dy[:,:3] = y[:,3:]
+            dy[:,3:] = self.accelleration( t, rows, burn_rows, y[:,:3], y[:,3:] )
+            return dy
+
+        return derivative
+
+    def accelleration( self, t: float, rows, burn_rows, P, V ):
+        '''
+        Total accelleration at time t for the (k,3) ECF positions and velocities of `rows`.
+        '''
+
+        #  Geodetic positions are shared by the terms that need them
+        pos_lla = None
+        def position_geog():
+            nonlocal pos_lla
+            if pos_lla is None:
+                pos_lla = ecf_to_geographic_many( P )
+            return pos_lla
+
+        #  Thrust from each row's direction strategy
+        A_thrust = np.zeros_like( P )
+        if burn_rows.size > 0:
+            burn_idx = rows[burn_rows]
+            for strategy, mask in self.thrust_directions.values():
+                sel = burn_rows[ mask[burn_idx] ]
+                if sel.size == 0:
+                    continue
+                idx = rows[sel]
+                direction = strategy.directions( t - self.start_time_sec[idx],
+                                                 V[sel],
+                                                 self.forward_enu[idx],
+                                                 self.forward_ecf[idx],
+                                                 pos_lla = position_geog()[sel] if strategy.needs_position_geog else None )
+                boost_thrust_acc = self.thrust_kN[idx] / self.mass_kg[idx]
+                A_thrust[sel] = direction * boost_thrust_acc[:,None]
+
+        #  Drag opposing the velocity
+        rho = self.air_mass_density[rows]
+        us1976 = self.use_us1976[rows]
+        if us1976.any():
+            rho = np.where( us1976, atmosphere.density( position_geog()[:,2] ), rho )
+        speed  = np.sqrt( np.einsum( 'ij,ij->i', V, V ) )
+        A_drag = (rho * speed * self.drag_scale[rows])[:,None] * V
+
+        #  Gravity, per configured model
+        A_g = np.empty_like( P )
+        for name, mask in self.gravity_masks.items():
+            sel = np.flatnonzero( mask[rows] )
+            if sel.size == 0:
+                continue
+            if name == GRAVITY_CONSTANT:
+                A_g[sel] = -up_vectors( position_geog()[sel,0], position_geog()[sel,1] ) * self.g_e
+            else:
+                A_g[sel] = get_gravity_function( name )( P[sel] )
+
+        return A_g + A_thrust - A_drag
+
+    def thrust_direction_of( self, idx: int ):
+        for strategy, mask in self.thrust_directions.values():
+            if mask[idx]:
+                return strategy
+
+    def record_event( self, idx: int, name: str, t: float, position_ecf, velocity_ecf ):
+
+        self.events[idx].append( Event_Record( name,
+                                               float( t ),
+                                               np.copy( position_ecf ).reshape(3),
+                                               np.copy( velocity_ecf ).reshape(3) ) )
+        logging.debug( 'Missile %s: event %s at t=%s', idx, name, t )
+
+    def to_log_string( self, offset: int = 0 ):
+
+        gap = ' ' * offset
+        output  = f'{gap}Batch_Engine:\n'
+        output += f'{gap} - missiles: {self.size}\n'
+        output += f'{gap} - integrator: {self.integrator.to_log_string()}\n'
+        return output
+
+    @staticmethod
+    def from_missiles( missiles ):
+        '''
+        Move a list of missiles onto one engine.  Each missile's motion model is
+        replaced by a `Batch_Model` view of its row.
+        '''
+        engine = Batch_Engine( [ missile.motion_model for missile in missiles ] )
+
+        for idx, missile in enumerate( missiles ):
+            missile.motion_model = Batch_Model( engine, idx )
+
+        return engine
+
+
+class Batch_Model(Motion_Model):
+    '''
+    Motion model view of one row of a `Batch_Engine`.
+
+    Updating any view advances the whole engine once per time step; the other
+    views then see their missile already at the new time.
+    '''
+
+    def __init__( self, engine: Batch_Engine, index: int ):
+        self.engine = engine
+        self.index  = index
+        self.t_cur  = engine.t_cur
+
+    @property
+    def P_cur( self ):
+        return self.engine.P[self.index].reshape((3,1))
+
+    @property
+    def V_cur( self ):
+        return self.engine.V[self.index].reshape((3,1))
+
+    @property
+    def events( self ):
+        return self.engine.events[self.index]
+
+    def info( self ):
+        return { 'position_ecf': np.copy( self.engine.P[self.index] ),
+                 'velocity_ecf': np.copy( self.engine.V[self.index] ) }
+
+    def update( self, t_delta: float ):
+
+        self.t_cur += t_delta
+        if self.engine.t_cur < self.t_cur:
+            self.engine.advance_to( self.t_cur )
+
+    def is_finished( self ):
+        return bool( self.engine.impacted[self.index] )
+
+    def launch_time( self ):
+        return float( self.engine.start_time_sec[self.index] )
+
+    def skip_to( self, t: float ):
+
+        if t > self.launch_time():
+            raise Exception( f'Cannot skip past the launch time {self.launch_time()}' )
+        self.t_cur = t
+
+    def to_log_string( self, offset: int ):
+
+        gap = ' ' * offset
+        output  = f'{gap}Batch_Model:\n'
+        output += f'{gap} - index: {self.index}\n'
+        output += f'{gap} - mass_kg: {self.engine.mass_kg[self.index]}\n'
+        output += f'{gap} - thrust_kN: {self.engine.thrust_kN[self.index]}\n'
+        output += f'{gap} - start_time_offset_sec: {self.engine.start_time_sec[self.index]}\n'
+        output += f'{gap} - burnout_time_sec: {self.engine.burnout_time_sec[self.index]}\n'
+        output += f'{gap} - gravity_model: {self.engine.gravity_models[self.index]}\n'
+        output += f'{gap} - thrust_direction: {self.engine.thrust_direction_of( self.index ).to_log_string()}\n'
+        output += f'{gap} - integrator: {self.engine.integrator.to_log_string()}\n'
+        return output
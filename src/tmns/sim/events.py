@@ -0,0 +1,31 @@
+#  Python Standard Libraries
+from collections import namedtuple
+
+#  SciPy
+from scipy.optimize import brentq
+
+#  Phase events recorded by the motion models
+EVENT_LAUNCH   = 'launch'
+EVENT_BURNOUT  = 'burnout'
+EVENT_IMPACT   = 'impact'
+EVENT_COAST    = 'coast'
+EVENT_REENTRY  = 'reentry'
+
+Event_Record = namedtuple( 'Event_Record', [ 'name', 'time', 'position_ecf', 'velocity_ecf' ], defaults = [ None ] )
+
+
+def is_descending_crossing( g0: float, g1: float ):
+    '''
+    True if an event function crosses zero from above across a step.
+    '''
+    return g0 > 0 and g1 <= 0
+
+
+def locate_event( event_func, t0: float, t1: float, xtol: float = 1e-6 ):
+    '''
+    Find the time in [t0, t1] where `event_func` crosses zero.
+
+    `event_func( t )` is expected to re-propagate the state from t0, so the root is
+    located on the integrator's own trajectory rather than an interpolant.
+    '''
+    return brentq( event_func, t0, t1, xtol = xtol )
@@ -3,6 +3,9 @@
 
 
 #  Project Libraries
+from tmns.sim.engine import ( Batch_Engine,
+                              ENGINE_BATCH,
+                              ENGINE_OBJECT )
 from tmns.sim.motion import get_motion_model
 
 class Missile:
@@ -23,6 +26,21 @@ class Missile:
 
         self.motion_model.update( t_delta )
 
+    def is_active(self):
+        '''
+        False once the missile has impacted and stopped propagating.
+        '''
+        return not self.motion_model.is_finished()
+
+    def events(self):
+        return self.motion_model.events
+
+    def launch_time(self):
+        return self.motion_model.launch_time()
+
+    def skip_to(self, t ):
+        self.motion_model.skip_to( t )
+
     def to_log_string(self):
 
         output  =  'Missile:\n'
@@ -33,19 +51,31 @@ class Missile:
         return output
 
     @staticmethod
-    def load_configs( cfg_args ):
+    def load_configs( cfg_args, indices = None ):
+        '''
+        Load every missile, or only the zero-based `indices` of the missile sections.
+        '''
 
         #  Get the number of missiles
         num_missiles = cfg_args.getint( 'general', 'number_missiles' )
+        if indices is None:
+            indices = range( num_missiles )
         
         #  Missile array
         missiles = []
 
-        for idx in range( num_missiles ):
+        for idx in indices:
 
             tag = f'missile_{idx+1}'
             missiles.append( Missile.load_config( cfg_args, tag ) )
 
+        #  Optionally move every missile onto one struct-of-arrays engine
+        engine = cfg_args.get( 'general', 'engine', fallback = ENGINE_OBJECT )
+        if engine == ENGINE_BATCH:
+            Batch_Engine.from_missiles( missiles )
+        elif engine != ENGINE_OBJECT:
+            raise Exception( f'Unsupported engine: {engine}' )
+
         return missiles
 
     @staticmethod
@@ -7,17 +7,60 @@ import math
 import numpy as np
 
 #  Project Libraries
-from tmns.geo.coordinate import ( ecf_to_geographic,
-                                  geographic_to_ecf,
-                                  get_ecf_forward_vector,
-                                  utm_grid_zone )
-from tmns.math.rotations import ( Axis, Quaternion )
-from tmns.math.physics   import ( position, velocity )
+from tmns.geo.coordinate  import ( ecf_to_geographic,
+                                   ecf_to_geographic_many,
+                                   geographic_to_ecf )
+from tmns.geo.local_frame import ( ecf_to_enu_matrix,
+                                   site_frame,
+                                   up_vectors )
+from tmns.math             import ( atmosphere,
+                                    kepler )
+from tmns.math.gravity     import ( get_gravity_function,
+                                    GM,
+                                    GRAVITY_CONSTANT,
+                                    GRAVITY_POINT_MASS )
+from tmns.math.integrators import ( Euler_Integrator,
+                                    get_integrator,
+                                    Integrator )
+from tmns.math.rotations   import ( Axis, Quaternion )
+from tmns.sim.events       import ( EVENT_BURNOUT,
+                                    EVENT_COAST,
+                                    EVENT_IMPACT,
+                                    EVENT_LAUNCH,
+                                    EVENT_REENTRY,
+                                    Event_Record,
+                                    is_descending_crossing,
+                                    locate_event )
+from tmns.sim.thrust       import ( get_thrust_direction,
+                                    Local_Frame_Direction,
+                                    THRUST_GRAVITY_TURN,
+                                    THRUST_LOCAL_FRAME,
+                                    Thrust_Direction )
+
+#  Atmosphere models used for drag
+ATMOSPHERE_CONSTANT = 'constant'
+ATMOSPHERE_US1976   = 'us1976'
+
+#  Conic samples used to bracket the coast re-entry time
+COAST_EXIT_SAMPLES = 512
+
 
 class Motion_Model:
 
     def to_log_string():
         raise NotImplementedError()
+
+    def is_finished( self ):
+        return False
+
+    def launch_time( self ):
+        return 0.0
+
+    def skip_to( self, t: float ):
+        '''
+        Move the clock of an idle model forward without stepping it.
+        '''
+        raise NotImplementedError()
     
 
 class Straight_Model(Motion_Model):
@@ -31,7 +74,13 @@ class Straight_Model(Motion_Model):
                        pitch_rad: float,
                        yaw_rad: float,
                        start_time_offset_sec: float,
-                       burn_time_sec: float ):
+                       burn_time_sec: float,
+                       integrator: Integrator = None,
+                       ground_altitude_m: float = None,
+                       atmosphere_model: str = ATMOSPHERE_CONSTANT,
+                       gravity_model: str = GRAVITY_CONSTANT,
+                       thrust_direction: Thrust_Direction = None,
+                       coast_density_kg_m3: float = None ):
         
         #  Set input parameters
         self.position_geog         = position_geog
@@ -44,15 +93,63 @@ class Straight_Model(Motion_Model):
         self.yaw_rad               = yaw_rad
         self.start_time_offset_sec = start_time_offset_sec
         self.burn_time_sec         = burn_time_sec
+        self.integrator            = integrator if integrator is not None else Euler_Integrator()
+        self.atmosphere_model      = atmosphere_model
+        self.gravity_model         = gravity_model
+        self.gravity_func          = get_gravity_function( gravity_model )
+        self.thrust_direction      = thrust_direction if thrust_direction is not None else Local_Frame_Direction()
+
+        if not self.atmosphere_model in ( ATMOSPHERE_CONSTANT, ATMOSPHERE_US1976 ):
+            raise Exception( f'Unsupported atmosphere model: {self.atmosphere_model}' )
+
+        #  Kepler coast above the altitude where the air density falls below the
+        #  threshold.  The conic ignores drag, so it needs the us1976 profile, and
+        #  it is a two-body orbit, so it needs point-mass gravity.
+        self.coast_density_kg_m3 = coast_density_kg_m3
+        self.coast_altitude_m    = None
+        self.coasting            = False
+        self.coast_epoch         = None
+        self.coast_exit_time     = None
+        if coast_density_kg_m3:
+            if self.atmosphere_model != ATMOSPHERE_US1976:
+                raise Exception( f'Coast mode requires the {ATMOSPHERE_US1976} atmosphere model' )
+            if self.gravity_model != GRAVITY_POINT_MASS:
+                raise Exception( f'Coast mode requires the {GRAVITY_POINT_MASS} gravity model' )
+            self.coast_altitude_m = float( atmosphere.altitude_at_density( coast_density_kg_m3 ) )
+
+        #  Step size carried between updates by adaptive integrators
+        self.dt_hint = None
+
+        #  Thrust phase of the segment being integrated
+        self.burning = True
+
+        #  Impact is detected against a flat ground at the launch elevation by default
+        self.ground_altitude_m = ground_altitude_m if ground_altitude_m is not None else float( position_geog[2] )
+        self.impacted          = False
+        self.events            = []
 
         #  Clock always starts at zero
         self.t_cur = 0
 
+        #  Body orientation relative to the local ENU frame
+        body_quat = Quaternion.from_euler_angles( Axis.Y, self.pitch_rad,
+                                                  Axis.X, 0,
+                                                  Axis.Z, self.yaw_rad )
+        self.forward_enu = body_quat.to_rotation_matrix() @ np.array( [[1],[0],[0]], dtype = np.float64 )
+
         #  Vehicle initial state position information
         self.position_geog_t0 = np.copy( self.position_geog )
         self.position_ecf_t0  = geographic_to_ecf( coord = self.position_geog_t0 )
-        self.forward_ecf_t0   = self.get_ecf_forward( self.position_ecf_t0 )
-        self.down_ecf_t0      = self.get_ecf_down( self.position_geog_t0 )
+
+        #  Launch-site frame is computed once and shared through the site cache
+        self.site_frame_t0  = site_frame( float( self.position_geog_t0[0] ),
+                                          float( self.position_geog_t0[1] ) )
+        self.forward_ecf_t0 = self.site_frame_t0.ecf_to_enu.T @ self.forward_enu
+
+        #  Row forms handed to the thrust-direction strategy on every evaluation
+        self.forward_enu_row = self.forward_enu.reshape((1,3))
+        self.forward_ecf_row = self.forward_ecf_t0.reshape((1,3))
+        self.down_ecf_t0    = self.site_frame_t0.ecf_to_ned[2].reshape((3,1))
         
         #  Physics variables
         self.g_e = 9.807
@@ -68,52 +165,40 @@ class Straight_Model(Motion_Model):
     def current_position_geog(self):
         return ecf_to_geographic( self.P_cur )
 
-    def get_ecf_forward( self, position_ecf = None ):
+    def get_ecf_forward( self, position_ecf = None, pos_lla = None ):
         '''
         Create a forward vector but in ECF space.
-        This is needed to handle the forward in a non-trivial coordinate system.
+        The body forward axis is rotated out of the local ENU frame at the position.
         '''
 
-        if position_ecf is None:
+        if position_ecf is None and pos_lla is None:
             raise Exception( f'Position must be provided in ECF or LLA' )
         
         #  Convert the position from ECF to LLA
-        print( 'ecf: ', position_ecf.T )
-        pos_lla = ecf_to_geographic( position_ecf )
-        print( 'lla: ', pos_lla.T )
-
-        #  Convert the position to UTM
-        utm_grid_zone( pos_lla )
-        #pos_utm = 
-
-        #  update the body quaternion
-        body_quat = Quaternion.from_euler_angles( Axis.Y, self.pitch_rad,
-                                                  Axis.X, 0,
-                                                  Axis.Z, self.yaw_rad )
-        
-        forward_lla = np.array( [[1],[0],[0]], dtype = np.float64 )
+        if pos_lla is None:
+            pos_lla = ecf_to_geographic( position_ecf )
 
-        forward_rot_lla = body_quat.to_rotation_matrix() @ forward_lla
+        #  Rotate the body forward axis from ENU into ECF
+        ecf_to_enu = ecf_to_enu_matrix( pos_lla[0,0], pos_lla[1,0] )
 
-        return get_ecf_forward_vector( position_lla, forward_rot_lla )
+        return ecf_to_enu.T @ self.forward_enu
     
-    def get_ecf_down( self, position_lla ):
-
-        position1_ecf = geographic_to_ecf( position_lla )
-
-        position_lla_minus1 = np.copy( position_lla )
-        position_lla_minus1[2] -= 1
-        position2_ecf = geographic_to_ecf( position_lla_minus1 )
+    def get_ecf_down( self, position_ecf = None, pos_lla = None ):
+        '''
+        Unit vector along the ellipsoid normal, pointing down, at an ECF position.
+        '''
+        if pos_lla is None:
+            pos_lla = ecf_to_geographic( position_ecf )
 
-        delta = position2_ecf - position1_ecf
-        
-        return delta / np.linalg.norm( delta )
+        return -up_vectors( pos_lla[0,0], pos_lla[1,0] ).reshape((3,1))
 
 
     def info(self):
 
-        #  Populate dictionary
-        output = { 'position': self.current_position_geog().flatten() }
+        #  Populate dictionary.  Geographic conversion is deferred to the writer
+        #  so a whole track can be converted in one batch.
+        output = { 'position_ecf': self.P_cur.flatten(),
+                   'velocity_ecf': self.V_cur.flatten() }
 
         return output
     
@@ -121,65 +206,235 @@ class Straight_Model(Motion_Model):
         '''
         Increment the time and update the position/velocity info
         '''
+        t_prev = self.t_cur
         self.t_cur += t_delta
 
-        #  if before the start time, do nothing
-        if self.t_cur < self.start_time_offset_sec:
+        #  if before the start time, or already on the ground, do nothing
+        if self.t_cur < self.start_time_offset_sec or self.impacted:
             return
 
+        #  Physics only runs from the launch time onwards
+        t_begin = max( t_prev, self.start_time_offset_sec )
+        if len( self.events ) == 0:
+            self.record_event( EVENT_LAUNCH, self.start_time_offset_sec, self.P_cur, self.V_cur )
+
+        #  Integrate the [P, V] state across the step, splitting it at burnout so
+        #  no integrator stage straddles the thrust discontinuity
+        y = np.concatenate( [ self.P_cur.reshape(3), self.V_cur.reshape(3) ] )
+
+        t_burnout = self.start_time_offset_sec + self.burn_time_sec
+        segments  = self.phase_segments( t_begin, self.t_cur, [ t_burnout ] )
+
+        #  On the coast conic the state is closed form up to the re-entry time
+        if self.coasting:
+            t_exit = min( self.t_cur, self.coast_exit_time )
+            r, v   = self.coast_states( [ t_exit ] )
+            y      = np.concatenate( [ r[0], v[0] ] )
+
+            segments = []
+            if self.t_cur > self.coast_exit_time:
+                self.coasting = False
+                self.record_event( EVENT_REENTRY, t_exit, y[:3], y[3:] )
+                segments = self.phase_segments( t_exit, self.t_cur, [ t_burnout ] )
+
+        for t_start, t_end in segments:
+
+            self.burning = t_start < t_burnout
+
+            #  Fixed-step integrators take one step per segment, so a step clipped at
+            #  launch or burnout never carries into later updates
+            y_start  = y
+            dt_start = self.dt_hint if self.integrator.adaptive else None
+            y, dt_next = self.integrator.integrate( self.derivative,
+                                                    t_start,
+                                                    y_start,
+                                                    t_end,
+                                                    dt = dt_start )
+            if self.integrator.adaptive:
+                self.dt_hint = dt_next
+
+            #  Ground impact.  The root is found by re-propagating from the segment
+            #  start, so only the segment containing the impact is refined.
+            if is_descending_crossing( self.height_above_ground( y_start ),
+                                       self.height_above_ground( y ) ):
+
+                def impact_func( t ):
+                    y_t, _ = self.integrator.integrate( self.derivative, t_start, y_start, t, dt = dt_start )
+                    return self.height_above_ground( y_t )
+
+                t_impact = locate_event( impact_func, t_start, t_end )
+                y, _ = self.integrator.integrate( self.derivative, t_start, y_start, t_impact, dt = dt_start )
+
+                self.impacted = True
+                self.record_event( EVENT_IMPACT, t_impact, y[:3], y[3:] )
+                break
+
+            if self.burning and t_end >= t_burnout:
+                self.record_event( EVENT_BURNOUT, t_burnout, y[:3], y[3:] )
+
+        #  Switch to the conic once past burnout and above the sensible atmosphere
+        if ( self.coast_altitude_m is not None and
+             not ( self.coasting or self.impacted ) and
+             self.t_cur > t_burnout and
+             self.height_above_ground( y ) + self.ground_altitude_m > self.coast_altitude_m ):
+            self.start_coast( self.t_cur, y )
+
+        self.P_init = self.P_cur
+        self.V_init = self.V_cur
+        self.P_cur  = y[:3].reshape((3,1))
+        self.V_cur  = y[3:].reshape((3,1))
+
+    def height_above_ground( self, y ):
+        '''
+        Geodetic height of the state's position above the ground altitude.
+        '''
+        return ecf_to_geographic( y[:3] )[2,0] - self.ground_altitude_m
+
+    def start_coast( self, t: float, y ):
+        '''
+        Continue from the state y at time t on its two-body conic.
+        '''
+        self.coasting        = True
+        self.coast_epoch     = ( t, np.copy( y[:3] ), np.copy( y[3:] ) )
+        self.coast_exit_time = self.find_coast_exit()
+        self.record_event( EVENT_COAST, t, y[:3], y[3:] )
+
+    def coast_states( self, times ):
+        '''
+        ECF positions and velocities on the coast conic at absolute times, as (M,3) arrays.
+        '''
+        t0, r0, v0 = self.coast_epoch
+        return kepler.propagate( r0, v0, np.asarray( times, dtype = np.float64 ) - t0 )
+
+    def find_coast_exit( self ):
+        '''
+        Time at which the coast conic first descends through the coast altitude.
+
+        One orbit is sampled in a single vectorized call to bracket the crossing,
+        which is then refined on the closed-form solution.
+        '''
+        t0, r0, v0 = self.coast_epoch
+
+        #  Unbound conics never come back down
+        alpha = 2.0 / np.linalg.norm( r0 ) - np.dot( v0, v0 ) / GM
+        if alpha <= 0:
+            return math.inf
+
+        period = 2.0 * math.pi / math.sqrt( GM * alpha ** 3 )
+        times  = t0 + np.linspace( 0, period, COAST_EXIT_SAMPLES )[1:]
+
+        r, _  = self.coast_states( times )
+        below = np.flatnonzero( ecf_to_geographic_many( r )[:,2] <= self.coast_altitude_m )
+        if below.size == 0:
+            return math.inf
+
+        k = below[0]
+        def exit_func( t ):
+            r_t, _ = self.coast_states( [ t ] )
+            return ecf_to_geographic( r_t[0] )[2,0] - self.coast_altitude_m
+
+        return locate_event( exit_func, t0 if k == 0 else times[k-1], times[k] )
+
+    def record_event( self, name: str, t: float, position_ecf, velocity_ecf ):
+
+        self.events.append( Event_Record( name,
+                                          t,
+                                          np.copy( position_ecf ).reshape(3),
+                                          np.copy( velocity_ecf ).reshape(3) ) )
+        logging.debug( 'Event %s at t=%s', name, t )
+
+    def is_finished( self ):
+        return self.impacted
+
+    def launch_time( self ):
+        return self.start_time_offset_sec
+
+    def skip_to( self, t: float ):
+
+        if t > self.start_time_offset_sec:
+            raise Exception( f'Cannot skip past the launch time {self.start_time_offset_sec}' )
+        self.t_cur = t
+
+    @staticmethod
+    def phase_segments( t_start: float, t_end: float, boundaries ):
+        '''
+        Split [t_start, t_end] at any phase boundaries falling strictly inside it.
+        '''
+        if t_end <= t_start:
+            return []
+
+        times = [ t_start ] + sorted( t for t in boundaries if t_start < t < t_end ) + [ t_end ]
+
+        return list( zip( times[:-1], times[1:] ) )
+
+    def derivative( self, t: float, y ):
+        '''
+        Time derivative of the ECF state y = [P, V].
+        '''
+        dy = np.empty( 6, dtype = np.float64 )
+        dy[:3] = y[3:]
+        dy[3:] = self.accelleration( t, y[:3].reshape((3,1)), y[3:].reshape((3,1)) ).reshape(3)
+        return dy
+
+    def accelleration( self, t: float, P, V ):
+        '''
+        Total accelleration at time t for ECF position P and velocity V.
+        '''
+
+        #  Geodetic position is shared by the terms that need it, and skipped otherwise
+        pos_lla = None
+        if ( self.gravity_func is None or
+             self.atmosphere_model == ATMOSPHERE_US1976 or
+             (self.burning and self.thrust_direction.needs_position_geog) ):
+            pos_lla = ecf_to_geographic( P )
+
         #  Default thrust is no accelleration
         A_thrust = np.zeros( (3,1), dtype = np.float64 )
 
-        logging.info( 'CCCCCCCCCCCCCCC' )
-
         #  if thruster is actively running 
-        if self.t_cur < (self.start_time_offset_sec + self.burn_time_sec):
+        if self.burning:
             
             #  Accelleration due to thrust
             boost_thrust_acc = self.thrust_kN / self.mass_kg
-            A_thrust = self.get_ecf_forward( position_ecf = self.P_cur ) * boost_thrust_acc
-
-            logging.info( f'A_thrust: {A_thrust.T}' )
-
-        #  if we have run out of fuel
-        else:  pass
-
-        logging.info( 'DDDDDDDDDDDDD' )
+            direction = self.thrust_direction.directions( np.array( [ t - self.start_time_offset_sec ] ),
+                                                          V.reshape((1,3)),
+                                                          self.forward_enu_row,
+                                                          self.forward_ecf_row,
+                                                          pos_lla = None if pos_lla is None else pos_lla.reshape((1,3)) )
+            A_thrust = direction.reshape((3,1)) * boost_thrust_acc
 
         # Accelleration due to drag
-        A_drag = self.accelleration_from_drag( self.V_init )
-        logging.info( f'A_drag: {A_drag.T}' )
-
-        logging.info( 'EEEEEEEEEEEEE' )
+        A_drag = self.accelleration_from_drag( V, altitude_m = None if pos_lla is None else pos_lla[2,0] )
 
         # Accelleration due to gravity
-        A_g = self.get_ecf_down(self.P_init) * self.g_e
-
-        logging.info( 'FFFFFFFFFFFFF' )
+        if self.gravity_func is None:
+            A_g = self.get_ecf_down( pos_lla = pos_lla ) * self.g_e
+        else:
+            A_g = self.gravity_func( P.reshape(3) ).reshape((3,1))
 
         #  Full Accelleration
         self.A_cur = A_g + A_thrust - A_drag
 
-        logging.info( 'GGGGGGGGGGGGGG' )
-
-        #  Compute velocity
-        self.V_init = np.copy( self.V_cur )
-        self.V_cur = velocity( t_delta, self.V_init, self.A_cur )
+        logging.debug( 'A_thrust: %s, A_drag: %s, A_g: %s', A_thrust.T, A_drag.T, A_g.T )
 
-        #  Compute position
-        self.P_init = np.copy( self.P_cur )
-        self.P_cur = position( t_delta, self.P_init, self.V_cur )
+        return self.A_cur
 
-        logging.info( 'IIIIIIIIIIIIII' )
+    def air_density( self, altitude_m: float = None ):
+        '''
+        Air density from the configured atmosphere model.
+        '''
+        if self.atmosphere_model == ATMOSPHERE_US1976 and altitude_m is not None:
+            return float( atmosphere.density( altitude_m ) )
+        return self.air_mass_density
 
-    def accelleration_from_drag( self, V ):
+    def accelleration_from_drag( self, V, altitude_m: float = None ):
         '''
-        F_d = 0.5 * rho * v^2 * C_d
+        F_d = 0.5 * rho * v^2 * C_d, directed along the velocity
         '''
 
         # Surface area
         A = math.pi * (self.radius_m ** 2)
-        return 0.5 * self.air_mass_density * V * V * self.drag_coefficient * A / self.mass_kg
+        return 0.5 * self.air_density( altitude_m ) * np.linalg.norm( V ) * V * self.drag_coefficient * A / self.mass_kg
 
     def to_log_string(self, offset: int ):
 
@@ -190,11 +445,17 @@ class Straight_Model(Motion_Model):
         output += f'{gap} - radius_m: {self.radius_m}\n'
         output += f'{gap} - thrust_kN: {self.thrust_kN}\n'
         output += f'{gap} - air_mass_density: {self.air_mass_density}\n'
+        output += f'{gap} - atmosphere_model: {self.atmosphere_model}\n'
+        output += f'{gap} - gravity_model: {self.gravity_model}\n'
+        output += f'{gap} - thrust_direction: {self.thrust_direction.to_log_string()}\n'
         output += f'{gap} - drag_coefficient: {self.drag_coefficient}\n'
         output += f'{gap} - pitch_rad: {self.pitch_rad}\n'
         output += f'{gap} - yaw_rad: {self.yaw_rad}\n'
         output += f'{gap} - start_time_offset_sec: {self.start_time_offset_sec}\n'
         output += f'{gap} - burn_time_sec: {self.burn_time_sec}\n'
+        output += f'{gap} - integrator: {self.integrator.to_log_string()}\n'
+        output += f'{gap} - ground_altitude_m: {self.ground_altitude_m}\n'
+        output += f'{gap} - coast_density_kg_m3: {self.coast_density_kg_m3}\n'
         return output
     
     @staticmethod
@@ -216,18 +477,47 @@ class Straight_Model(Motion_Model):
         burn_time_sec = cfg_args.getfloat( section, 'burn_time_sec' )
 
         air_density   = cfg_args.getfloat( section, 'air_mass_density' )
+        atmos_model   = cfg_args.get( section, 'atmosphere_model', fallback = ATMOSPHERE_CONSTANT )
+
+        #  Gravity model
+        gravity_model = cfg_args.get( section, 'gravity_model', fallback = GRAVITY_CONSTANT )
         drag_coeff    = cfg_args.getfloat( section, 'missile_drag_coefficient' )
 
+        #  Thrust direction strategy
+        thrust_name = cfg_args.get( section, 'thrust_direction', fallback = THRUST_LOCAL_FRAME )
+        thrust_opts = {}
+        if thrust_name == THRUST_GRAVITY_TURN:
+            thrust_opts = { 'turn_start_sec': cfg_args.getfloat( section, 'gravity_turn_start_sec', fallback = 5.0 ) }
+
+        #  Impact altitude, defaulting to the launch elevation
+        ground_alt = cfg_args.getfloat( section, 'ground_altitude_m', fallback = None )
+
+        #  Kepler coast threshold, zero disables coasting
+        coast_density = cfg_args.getfloat( section, 'coast_density_kg_m3', fallback = 0 ) or None
+
+        #  Numerical integrator
+        integrator_name = cfg_args.get( section, 'integrator', fallback = 'euler' )
+        integrator_opts = {}
+        if integrator_name == 'rk45':
+            integrator_opts = { 'rtol': cfg_args.getfloat( section, 'integrator_rtol', fallback = 1e-6 ),
+                                'atol': cfg_args.getfloat( section, 'integrator_atol', fallback = 1e-3 ) }
+
         return Straight_Model( position_geog = np.array( launch_pos, dtype = np.float64 ),
                                mass_kg = mass_kg,
                                radius_m = radius_m,
                                thrust_kN = thrust_kN,
                                air_mass_density=air_density,
+                               atmosphere_model = atmos_model,
+                               gravity_model = gravity_model,
+                               thrust_direction = get_thrust_direction( thrust_name, **thrust_opts ),
                                drag_coefficient=drag_coeff,
                                pitch_rad = pitch_rad,
                                yaw_rad = yaw_rad,
                                start_time_offset_sec = start_time_offset_sec,
-                               burn_time_sec = burn_time_sec )
+                               burn_time_sec = burn_time_sec,
+                               integrator = get_integrator( integrator_name, **integrator_opts ),
+                               ground_altitude_m = ground_alt,
+                               coast_density_kg_m3 = coast_density )
 
 
 def get_motion_model( section, model_type, cfg_args ):
@@ -0,0 +1,56 @@
+#  Python Standard Libraries
+import heapq
+
+
+class Scheduler:
+    '''
+    Active-set bookkeeping for a tick-based simulation.
+
+    Missiles wait in a heap ordered by launch time, become live on the tick
+    whose step contains their launch, and are retired once they have finished.
+    Only live missiles are stepped, so the cost follows live missile-seconds.
+    '''
+
+    def __init__( self, missiles ):
+
+        self.pending = [ ( missile.launch_time(), idx, missile ) for idx, missile in enumerate( missiles ) ]
+        heapq.heapify( self.pending )
+
+        self.live    = []
+        self.retired = []
+
+    def activate( self, t_cur: float, t_next: float ):
+        '''
+        Make live every missile launching by `t_next`, with its clock moved to `t_cur`.
+
+        Returns the newly activated missiles.
+        '''
+        activated = []
+        while self.pending and self.pending[0][0] <= t_next:
+            _, _, missile = heapq.heappop( self.pending )
+            missile.skip_to( t_cur )
+            activated.append( missile )
+
+        self.live.extend( activated )
+        return activated
+
+    def retire( self ):
+        '''
+        Move finished missiles from the live set to the retirement list.
+
+        Returns the newly retired missiles.
+        '''
+        retired   = [ missile for missile in self.live if not missile.is_active() ]
+        self.live = [ missile for missile in self.live if missile.is_active() ]
+
+        self.retired.extend( retired )
+        return retired
+
+    def next_launch_time( self ):
+        '''
+        Launch time of the next pending missile, or None when none remain.
+        '''
+        return self.pending[0][0] if self.pending else None
+
+    def is_done( self ):
+        return not self.pending and not self.live
@@ -0,0 +1,105 @@
+#  Numerical Python
+import numpy as np
+
+#  Project Libraries
+from tmns.geo.local_frame import ecf_to_enu_matrices
+
+#  Strategies selectable per missile
+THRUST_LOCAL_FRAME   = 'local_frame'
+THRUST_LAUNCH_FRAME  = 'launch_frame'
+THRUST_GRAVITY_TURN  = 'gravity_turn'
+THRUST_VELOCITY      = 'velocity_aligned'
+
+
+class Thrust_Direction:
+    '''
+    Unit thrust direction in ECF for a batch of missiles.
+
+    Inputs are per-row arrays: time since launch (k,), ECF velocity (k,3), the
+    body forward axis in launch ENU (k,3) and in ECF at the launch site (k,3).
+    Geodetic positions (k,3) are only passed when `needs_position_geog` is set.
+    '''
+
+    needs_position_geog = False
+
+    def directions( self, t_flight, V, forward_enu, forward_ecf, pos_lla = None ):
+        raise NotImplementedError()
+
+    def to_log_string( self, offset: int = 0 ):
+        return ' ' * offset + type( self ).__name__
+
+
+class Local_Frame_Direction( Thrust_Direction ):
+    '''
+    Body forward axis held fixed in the local ENU frame under the missile.
+    '''
+
+    needs_position_geog = True
+
+    def directions( self, t_flight, V, forward_enu, forward_ecf, pos_lla = None ):
+
+        ecf_to_enu = ecf_to_enu_matrices( pos_lla[:,0], pos_lla[:,1] )
+        return np.einsum( 'nji,nj->ni', ecf_to_enu, forward_enu )
+
+
+class Launch_Frame_Direction( Thrust_Direction ):
+    '''
+    Body forward axis held fixed in ECF, as set up at the launch site.
+    '''
+
+    def directions( self, t_flight, V, forward_enu, forward_ecf, pos_lla = None ):
+        return forward_ecf
+
+
+class Velocity_Aligned_Direction( Thrust_Direction ):
+    '''
+    Thrust along the velocity, falling back to the launch direction at low speed.
+    '''
+
+    def __init__( self, min_speed_mps: float = 1.0 ):
+        self.min_speed_mps = min_speed_mps
+
+    def directions( self, t_flight, V, forward_enu, forward_ecf, pos_lla = None ):
+
+        speed  = np.sqrt( np.einsum( 'ij,ij->i', V, V ) )
+        moving = speed >= self.min_speed_mps
+
+        return np.where( moving[:,None], V / np.where( moving, speed, 1.0 )[:,None], forward_ecf )
+
+    def to_log_string( self, offset: int = 0 ):
+        return ' ' * offset + f'Velocity_Aligned_Direction( min_speed_mps: {self.min_speed_mps} )'
+
+
+class Gravity_Turn_Direction( Velocity_Aligned_Direction ):
+    '''
+    Launch direction for a short kick, then thrust along the velocity so gravity
+    bends the trajectory over.
+    '''
+
+    def __init__( self, turn_start_sec: float = 5.0, min_speed_mps: float = 1.0 ):
+        super().__init__( min_speed_mps = min_speed_mps )
+        self.turn_start_sec = turn_start_sec
+
+    def directions( self, t_flight, V, forward_enu, forward_ecf, pos_lla = None ):
+
+        aligned = super().directions( t_flight, V, forward_enu, forward_ecf )
+        return np.where( (np.asarray( t_flight ) < self.turn_start_sec)[:,None], forward_ecf, aligned )
+
+    def to_log_string( self, offset: int = 0 ):
+        return ' ' * offset + f'Gravity_Turn_Direction( turn_start_sec: {self.turn_start_sec}, min_speed_mps: {self.min_speed_mps} )'
+
+
+def get_thrust_direction( name: str, **options ):
+    '''
+    Build a thrust-direction strategy from its configuration name.
+    '''
+    if name == THRUST_LOCAL_FRAME:
+        return Local_Frame_Direction()
+    elif name == THRUST_LAUNCH_FRAME:
+        return Launch_Frame_Direction()
+    elif name == THRUST_VELOCITY:
+        return Velocity_Aligned_Direction( **options )
+    elif name == THRUST_GRAVITY_TURN:
+        return Gravity_Turn_Direction( **options )
+    else:
+        raise Exception( f'Unsupported thrust direction: {name}' )
@@ -0,0 +1,86 @@
+#  Python Standard Libraries
+import copy
+import filecmp
+import logging
+import os
+import tempfile
+import types
+import unittest
+
+#  Terminus Libraries
+from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.parallel import ( run_parallel_simulation,
+                                         shard_indices )
+from tmns.app.trackgen.sim      import run_simulation
+from tmns.sim.missile           import Missile
+
+class parallel_tests(unittest.TestCase):
+
+    def load_options( self, cfg_args, output_base ):
+
+        cfg_args = copy.deepcopy( cfg_args )
+        cfg_args['general']['output_base'] = output_base
+        return types.SimpleNamespace( cfg_args = cfg_args )
+
+    def test_shards(self):
+
+        self.assertEqual( shard_indices( 5, 2 ), [ [ 0, 2, 4 ], [ 1, 3 ] ] )
+        self.assertEqual( shard_indices( 1, 3 ), [ [ 0 ], [], [] ] )
+
+    def run_both( self, tmp, starts, simulation_time_secs, step_time_ms, output_formats = 'kml' ):
+        '''
+        Run the same scenario serially and across two workers, writing `serial.*` and `parallel.*`.
+        '''
+        logger = logging.getLogger( 'test' )
+
+        config_path = os.path.join( tmp, 'scenario.cfg' )
+        Options.generate_config( config_path )
+
+        #  The changes are only made in memory, so workers must receive the
+        #  parsed configuration rather than re-read the file.
+        cfg_args = Options.parse_config_file( config_path )
+        cfg_args['general']['number_missiles']      = str( len( starts ) )
+        cfg_args['general']['simulation_time_secs'] = str( simulation_time_secs )
+        cfg_args['general']['step_time_ms']         = str( step_time_ms )
+        cfg_args['general']['output_formats']       = output_formats
+        for idx, start in enumerate( starts ):
+            section = dict( cfg_args['missile_1'] )
+            section['id'] = str( idx + 1 )
+            section['integrator'] = 'rk4'
+            section['start_time_offset_sec'] = str( start )
+            cfg_args[f'missile_{idx+1}'] = section
+
+        options = self.load_options( cfg_args, os.path.join( tmp, 'serial.kml' ) )
+        run_simulation( options, Missile.load_configs( options.cfg_args ), logger )
+
+        options = self.load_options( cfg_args, os.path.join( tmp, 'parallel.kml' ) )
+        run_parallel_simulation( options, 2, logger )
+
+    def assert_same_files( self, tmp, *suffixes ):
+
+        for suffix in suffixes:
+            self.assertTrue( filecmp.cmp( os.path.join( tmp, 'serial' + suffix ),
+                                          os.path.join( tmp, 'parallel' + suffix ),
+                                          shallow = False ), suffix )
+
+    def test_matches_serial(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            #  Staggered launches so missiles enter the output in a different order than configured
+            self.run_both( tmp, [ 40, 0, 12 ], 150, 5000 )
+            self.assert_same_files( tmp, '.kml' )
+
+    def test_matches_serial_with_impacts(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            #  Two missiles impact and are written as they finish, while the
+            #  last is still in flight when the clock runs out
+            self.run_both( tmp, [ 40, 0, 2900 ], 3000, 10000, 'kml, csv, npy' )
+            self.assert_same_files( tmp, '.kml', '.events.csv', '.tracks/index.json' )
+
+            with open( os.path.join( tmp, 'serial.kml' ) ) as fin:
+                content = fin.read()
+            self.assertEqual( content.count( '<name>impact: ' ), 2 )
+            self.assertLess( content.index( '<name>Missile: 2</name>' ), content.index( '<name>Missile: 1</name>' ) )
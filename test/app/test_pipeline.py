@@ -0,0 +1,137 @@
+#  Python Standard Libraries
+import asyncio
+import configparser
+import logging
+import math
+import os
+import tempfile
+import time
+import types
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.app.trackgen.Options  import Options
+from tmns.app.trackgen.pipeline import ( run_pipeline,
+                                         Sample_Batch,
+                                         Track_Sink )
+from tmns.app.trackgen.sim      import ( run_simulation,
+                                         sample_times,
+                                         step_missiles,
+                                         write_samples )
+from tmns.app.trackgen.writer   import Track_Writer
+from tmns.math.integrators      import get_integrator
+from tmns.sim.events            import ( EVENT_COAST,
+                                         EVENT_REENTRY )
+from tmns.sim.missile           import Missile
+from tmns.sim.motion            import Straight_Model
+
+
+class Slow_Sink( Track_Sink ):
+
+    def __init__( self, produced ):
+        self.produced = produced
+        self.lag      = []
+
+    def write_batch( self, batch ):
+        self.lag.append( self.produced[0] - batch.unix_times[0] )
+        time.sleep( 0.002 )
+
+
+class pipeline_tests(unittest.TestCase):
+
+    def test_backpressure(self):
+
+        produced = [ 0 ]
+
+        def ticks():
+            for tick in range( 50 ):
+                produced[0] = tick
+                batch = Sample_Batch()
+                batch.add_missile_entry( midx = 1, unix_time = tick, position_ecf = [ 0, 0, 0 ] )
+                yield batch
+
+        sink = Slow_Sink( produced )
+        asyncio.run( run_pipeline( ticks(), [ sink ], queue_size = 2 ) )
+
+        #  The simulation never runs further ahead than the queue, one batch
+        #  being written and one waiting to be queued
+        self.assertEqual( len( sink.lag ), 50 )
+        self.assertLessEqual( max( sink.lag ), 2 + 2 )
+
+    def test_csv_matches_writer(self):
+
+        logger = logging.getLogger( 'test' )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            config_path = os.path.join( tmp, 'scenario.cfg' )
+            Options.generate_config( config_path )
+
+            cfg_args = configparser.ConfigParser()
+            cfg_args.read( config_path )
+            cfg_args['general']['simulation_time_secs'] = '100'
+            cfg_args['general']['step_time_ms']         = '2000'
+            cfg_args['general']['output_formats']       = 'kml, csv'
+            cfg_args['general']['pipeline_queue_size']  = '1'
+            with open( config_path, 'w' ) as fout:
+                cfg_args.write( fout )
+
+            cfg_args['general']['output_base'] = os.path.join( tmp, 'run.kml' )
+            options = types.SimpleNamespace( cfg_args = cfg_args )
+            run_simulation( options, Missile.load_configs( options.cfg_args ), logger )
+
+            self.assertTrue( os.path.exists( os.path.join( tmp, 'run.kml' ) ) )
+
+            rows = np.loadtxt( os.path.join( tmp, 'run.csv' ), delimiter = ',', skiprows = 1 )
+            with open( os.path.join( tmp, 'run.events.csv' ) ) as fin:
+                events = fin.read().splitlines()[1:]
+
+            #  The same samples a writer collects directly
+            writer = Track_Writer( os.path.join( tmp, 'direct' ) )
+            missiles = Missile.load_configs( options.cfg_args )
+            step_missiles( options.cfg_args, missiles, writer, logger )
+
+            times, ecf = writer.missile_block( missiles[0].id )
+            self.assertTrue( np.allclose( rows[:,0], times, atol = 1e-6 ) )
+            self.assertTrue( np.allclose( rows[:,5:8], ecf, atol = 1e-3 ) )
+            self.assertTrue( np.allclose( rows[:,2:5], writer.missile_positions( missiles[0].id ), atol = 1e-3 ) )
+
+            self.assertEqual( [ event.split( ',' )[2] for event in events ], [ event.name for event in missiles[0].events() ] )
+
+    def test_coast_samples(self):
+
+        model = Straight_Model( position_geog = np.array( [-104.844892, 39.545218, 1806.0] ),
+                                mass_kg = 900,
+                                radius_m = 0.25,
+                                thrust_kN = 107873.15,
+                                air_mass_density = 1.2,
+                                drag_coefficient = 0.05,
+                                pitch_rad = math.radians( 60 ),
+                                yaw_rad = math.radians( -45 ),
+                                start_time_offset_sec = 10,
+                                burn_time_sec = 60,
+                                integrator = get_integrator( 'rk45' ),
+                                atmosphere_model = 'us1976',
+                                gravity_model = 'point_mass',
+                                coast_density_kg_m3 = 1e-7 )
+        missile = Missile( '1', model )
+
+        batch = Sample_Batch()
+        t_cur = 0.0
+        while missile.is_active() and t_cur < 3000:
+            start = missile.info()
+            missile.update( t_delta = 10.0 )
+            write_samples( batch, missile, start, t_cur, t_cur + 10.0, sample_times( t_cur, t_cur + 10.0, 1.0 ), 0.0 )
+            t_cur += 10.0
+
+        events = { event.name: event for event in missile.events() }
+        times  = np.asarray( batch.unix_times )
+        coast  = (times >= events[EVENT_COAST].time) & (times < events[EVENT_REENTRY].time)
+        self.assertGreater( coast.sum(), 100 )
+
+        #  Samples on the conic match its closed form rather than a cubic between ticks
+        expected, _ = model.coast_states( times[coast] )
+        np.testing.assert_allclose( batch.positions()[coast], expected, rtol = 0, atol = 1e-6 )
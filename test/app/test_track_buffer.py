@@ -0,0 +1,72 @@
+#  Python Standard Libraries
+from concurrent.futures import ProcessPoolExecutor
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.app.trackgen.pipeline     import Sample_Batch
+from tmns.app.trackgen.track_buffer import ( Shared_Track_Buffer,
+                                             Track_Buffer_Writer )
+
+def fill_row( spec, index ):
+
+    buffer = Shared_Track_Buffer.attach( spec )
+    times  = np.arange( index + 1, dtype = np.float64 )
+    buffer.write_track( index, times, np.column_stack( [ times, -times, times * 2 ] ) )
+    buffer.close()
+
+
+class track_buffer_tests(unittest.TestCase):
+
+    def test_workers_write_rows(self):
+
+        buffer = Shared_Track_Buffer.create( 3, 8 )
+        try:
+            with ProcessPoolExecutor( max_workers = 2 ) as pool:
+                list( pool.map( fill_row, [ buffer.spec() ] * 3, range( 3 ) ) )
+
+            for index in range( 3 ):
+                times, ecf = buffer.track( index )
+                self.assertEqual( times.shape, (index + 1,) )
+                np.testing.assert_array_equal( ecf[:,1], -times )
+
+            #  Tracks are views of the shared block
+            self.assertFalse( buffer.track( 2 )[1].flags.owndata )
+            del times, ecf
+
+            with self.assertRaises( Exception ):
+                buffer.write_track( 0, np.zeros( 9 ), np.zeros( (9,3) ) )
+        finally:
+            buffer.close()
+
+        with self.assertRaises( FileNotFoundError ):
+            Shared_Track_Buffer.attach( buffer.spec() )
+
+    def test_batches_append_to_rows(self):
+
+        buffer = Shared_Track_Buffer.create( 2, 4 )
+        try:
+            writer = Track_Buffer_Writer( buffer, { 'a': 1, 'b': 0 } )
+            for tick in range( 3 ):
+                batch = Sample_Batch()
+                batch.add_missile_entry( midx = 'a', unix_time = float( tick ), position_ecf = [ tick, 0, 0 ] )
+                batch.write_to( writer )
+
+            #  An impact sample at the time of the last tick replaces it
+            batch = Sample_Batch()
+            batch.add_missile_entry( midx = 'a', unix_time = 2.0, position_ecf = [ 9, 9, 9 ] )
+            batch.add_missile_entry( midx = 'b', unix_time = 5.0, position_ecf = [ 1, 2, 3 ] )
+            batch.write_to( writer )
+
+            times, ecf = buffer.track( 1 )
+            np.testing.assert_array_equal( times, [ 0.0, 1.0, 2.0 ] )
+            np.testing.assert_array_equal( ecf[2], [ 9, 9, 9 ] )
+            np.testing.assert_array_equal( buffer.track( 0 )[0], [ 5.0 ] )
+            del times, ecf
+
+            with self.assertRaises( Exception ):
+                buffer.append( 0, np.arange( 6, 10, dtype = np.float64 ), np.zeros( (4,3) ) )
+        finally:
+            buffer.close()
@@ -0,0 +1,123 @@
+#  Python Standard Libraries
+import json
+import os
+import tempfile
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.app.trackgen.writer import ( Track_Columns,
+                                       Track_Writer )
+from tmns.geo.coordinate      import ( geographic_to_ecf,
+                                       geographic_to_ecf_many )
+
+class writer_tests(unittest.TestCase):
+
+    def test_columns_grow(self):
+
+        track = Track_Columns( capacity = 2 )
+        times = np.arange( 10, dtype = np.float64 )
+        ecf   = np.column_stack( [ times, times * 2, times * 3 ] )
+
+        track.append( times[:3], position_ecf = ecf[:3] )
+        for t, row in zip( times[3:], ecf[3:] ):
+            track.append_sample( float( t ), position_ecf = row )
+
+        self.assertEqual( len( track ), 10 )
+        self.assertEqual( track.capacity(), 16 )
+        np.testing.assert_array_equal( track.unix_times(), times )
+        np.testing.assert_array_equal( track.positions_ecf(), ecf )
+        self.assertTrue( track.positions_ecf().flags['C_CONTIGUOUS'] )
+
+        #  Velocities were never given
+        self.assertTrue( np.isnan( track.velocities_ecf() ).all() )
+
+    def test_repeated_time_replaces(self):
+
+        writer = Track_Writer( 'unused' )
+        writer.add_missile_entry( midx = 1, unix_time = 0.0, position_ecf = [ 1, 2, 3 ] )
+        writer.add_missile_entry( midx = 1, unix_time = 1.0, position_ecf = [ 4, 5, 6 ] )
+        writer.add_missile_block( midx = 1,
+                                  unix_times = [ 1.0, 2.0 ],
+                                  position_ecf = [ [ 7, 8, 9 ], [ 10, 11, 12 ] ] )
+
+        times, ecf = writer.missile_block( 1 )
+        np.testing.assert_array_equal( times, [ 0.0, 1.0, 2.0 ] )
+        np.testing.assert_array_equal( ecf[1], [ 7, 8, 9 ] )
+
+    def test_mixed_positions(self):
+
+        geog = np.array( [ [ -104.8, 39.5, 1806.0 ], [ -104.7, 39.6, 2500.0 ] ] )
+        ecf  = geographic_to_ecf( geog[1] ).reshape( 3 )
+
+        writer = Track_Writer( 'unused' )
+        writer.add_missile_entry( midx = 'a', unix_time = 0.0, position = geog[0] )
+        writer.add_missile_entry( midx = 'a', unix_time = 1.0, position_ecf = ecf )
+
+        np.testing.assert_allclose( writer.missile_positions( 'a' ), geog, atol = 1e-6 )
+
+        #  The first sample has no ECF position to hand out
+        with self.assertRaises( Exception ):
+            writer.missile_block( 'a' )
+
+        with self.assertRaises( Exception ):
+            writer.add_missile_entry( midx = 'a', unix_time = 2.0 )
+
+    def test_views_are_not_copied(self):
+
+        block = np.arange( 20, dtype = np.float64 ).reshape( 5, 4 )
+
+        writer = Track_Writer( 'unused' )
+        writer.add_missile_view( midx = 'a', unix_times = block[:,0], position_ecf = block[:,1:] )
+
+        times, ecf = writer.missile_block( 'a' )
+        self.assertTrue( np.shares_memory( times, block ) )
+        self.assertTrue( np.shares_memory( ecf, block ) )
+
+        #  Growing the track copies it into the writer's own columns
+        writer.add_missile_entry( midx = 'a', unix_time = 100.0, position_ecf = [ 1, 2, 3 ] )
+        times, ecf = writer.missile_block( 'a' )
+        self.assertFalse( np.shares_memory( times, block ) )
+        np.testing.assert_array_equal( times, np.append( block[:,0], 100.0 ) )
+        np.testing.assert_array_equal( ecf[:5], block[:,1:] )
+
+    def test_finished_missiles_are_released(self):
+
+        times = np.arange( 4, dtype = np.float64 )
+        ecf   = geographic_to_ecf_many( np.column_stack( [ np.full( 4, -104.8 ), np.full( 4, 39.5 ), 1806.0 + times ] ) )
+
+        def fill( writer ):
+            for midx in [ 'a', 'b', 'c' ]:
+                writer.add_missile_block( midx = midx, unix_times = times, position_ecf = ecf )
+                writer.add_missile_event( midx = midx, name = 'launch', unix_time = 0.0, position_ecf = ecf[0] )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            whole = Track_Writer( os.path.join( tmp, 'whole.kml' ) )
+            fill( whole )
+            whole.missiles = { midx: whole.missiles[midx] for midx in [ 'b', 'a', 'c' ] }
+            whole.write_all( [ 'kml' ] )
+
+            streamed = Track_Writer( os.path.join( tmp, 'streamed.kml' ) )
+            streamed.open_streams( [ 'kml', 'npy' ] )
+            fill( streamed )
+
+            #  A finished missile is written straight away and released
+            streamed.finish_missile( 'b' )
+            self.assertEqual( list( streamed.missiles.keys() ), [ 'a', 'c' ] )
+            self.assertNotIn( 'b', streamed.events )
+
+            streamed.write_all( [ 'kml', 'npy' ] )
+            self.assertEqual( streamed.missiles, {} )
+
+            with open( os.path.join( tmp, 'whole.kml' ) ) as fin:
+                expected = fin.read()
+            with open( os.path.join( tmp, 'streamed.kml' ) ) as fin:
+                self.assertEqual( fin.read(), expected )
+
+            with open( os.path.join( tmp, 'streamed.tracks', 'index.json' ) ) as fin:
+                index = json.load( fin )
+            self.assertEqual( [ missile['id'] for missile in index['missiles'] ], [ 'b', 'a', 'c' ] )
+            self.assertEqual( [ len( missile['events'] ) for missile in index['missiles'] ], [ 1, 1, 1 ] )
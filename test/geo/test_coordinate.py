@@ -18,6 +18,64 @@ class geographic_tests(unittest.TestCase):
 
         lla_out = crd.ecf_to_geographic( ecf_coord ).flatten()
 
-        self.assertAlmostEqual( lla_coord[0], lla_out[0], 0.001 )
-        self.assertAlmostEqual( lla_coord[1], lla_out[1], 0.001 )
-        self.assertAlmostEqual( lla_coord[2], lla_out[2], 0.001 )
+        self.assertAlmostEqual( lla_coord[0,0], lla_out[0], delta = 0.001 )
+        self.assertAlmostEqual( lla_coord[1,0], lla_out[1], delta = 0.001 )
+        self.assertAlmostEqual( lla_coord[2,0], lla_out[2], delta = 0.001 )
+
+    def test_transformer_cache(self):
+
+        t1 = crd.get_transformer( crd.WGS84_GEOGRAPHIC, crd.WGS84_GEOCENTRIC, always_xy = True )
+        t2 = crd.get_transformer( dict( crd.WGS84_GEOGRAPHIC ), dict( crd.WGS84_GEOCENTRIC ), always_xy = True )
+        t3 = crd.get_transformer( crd.WGS84_GEOGRAPHIC, crd.WGS84_GEOCENTRIC )
+
+        self.assertIs( t1, t2 )
+        self.assertIsNot( t1, t3 )
+
+    def test_ecf_geographic_many(self):
+
+        lla_coords = np.array( [[-104,  39,   1800],
+                                [   0,   0,      0],
+                                [ 170, -80, 100000]], dtype = np.float64 )
+
+        out = np.zeros( lla_coords.shape, dtype = np.float64 )
+        ecf_coords = crd.geographic_to_ecf_many( lla_coords, out = out )
+        self.assertIs( ecf_coords, out )
+
+        for lla_coord, ecf_coord in zip( lla_coords, ecf_coords ):
+            np.testing.assert_allclose( crd.geographic_to_ecf( lla_coord ).flatten(), ecf_coord )
+
+        lla_out = crd.ecf_to_geographic_many( ecf_coords )
+        np.testing.assert_allclose( lla_out, lla_coords, atol = 1e-6 )
+
+    def test_utm_grid_zone(self):
+
+        zone = crd.utm_grid_zone( np.array( [[-104.844892], [39.545218], [1806]], dtype = np.float64 ) )
+        self.assertEqual( zone, crd.UTM_Zone( 13, True, 32613 ) )
+
+        zone = crd.utm_grid_zone( np.array( [151.2, -33.9, 0] ) )
+        self.assertEqual( zone, crd.UTM_Zone( 56, False, 32756 ) )
+
+        self.assertEqual( crd.utm_grid_zone( np.array( [179.99, 0.0] ) ).zone, 60 )
+        self.assertEqual( crd.utm_grid_zone( np.array( [180.0, 0.0] ) ).zone, 1 )
+
+    def test_utm_grid_zones_exceptions(self):
+
+        lla_coords = np.array( [[  5, 60],    # Norway, widened zone 32
+                                [  2, 60],    # West of the Norway exception
+                                [  5, 75],    # Svalbard
+                                [ 15, 78],
+                                [ 25, 80],
+                                [ 40, 80],
+                                [ 40, 70]],   # South of Svalbard
+                               dtype = np.float64 )
+
+        zones, north, epsg = crd.utm_grid_zones( lla_coords )
+
+        np.testing.assert_array_equal( zones, [32, 31, 31, 33, 35, 37, 37] )
+        self.assertTrue( np.all( north ) )
+        np.testing.assert_array_equal( epsg, 32600 + zones )
+
+    def test_utm_crs_cache(self):
+
+        self.assertIs( crd.utm_crs( 32613 ), crd.utm_crs( 32613 ) )
+        self.assertIs( crd.utm_transformer( 32613 ), crd.utm_transformer( 32613 ) )
@@ -0,0 +1,42 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+import tmns.geo.coordinate  as crd
+import tmns.geo.local_frame as lf
+
+class local_frame_tests(unittest.TestCase):
+
+    def test_batch_matches_scalar(self):
+
+        lon = np.array( [ -104.8, 0.0, 170.0, 45.0 ] )
+        lat = np.array( [   39.5, 0.0, -80.0, 89.0 ] )
+
+        enu = lf.ecf_to_enu_matrices( lon, lat )
+        ned = lf.ecf_to_ned_matrices( lon, lat )
+
+        for idx in range( lon.shape[0] ):
+            np.testing.assert_allclose( enu[idx], lf.ecf_to_enu_matrix( lon[idx], lat[idx] ), atol = 1e-15 )
+            np.testing.assert_allclose( ned[idx], lf.ecf_to_ned_matrix( lon[idx], lat[idx] ), atol = 1e-15 )
+            np.testing.assert_allclose( enu[idx] @ enu[idx].T, np.eye(3), atol = 1e-15 )
+
+        np.testing.assert_allclose( lf.up_vectors( lon, lat ), enu[:,2,:], atol = 1e-15 )
+
+    def test_up_matches_geodetic_normal(self):
+
+        lla = np.array( [ -104.844892, 39.545218, 1806.0 ] )
+
+        #  Finite difference along the geodetic height
+        points = np.array( [ lla, lla + [0, 0, 1] ] )
+        ecf    = crd.geographic_to_ecf_many( points )
+        up     = ecf[1] - ecf[0]
+
+        frame = lf.site_frame( lla[0], lla[1] )
+        np.testing.assert_allclose( frame.ecf_to_enu[2], up / np.linalg.norm( up ), atol = 1e-9 )
+        np.testing.assert_allclose( frame.ecf_to_ned[2], -frame.ecf_to_enu[2] )
+
+        self.assertIs( frame, lf.site_frame( lla[0], lla[1] ) )
+        self.assertFalse( frame.ecf_to_enu.flags.writeable )
@@ -0,0 +1,217 @@
+#  Python Standard Libraries
+import os
+import tempfile
+import unittest
+from unittest import mock
+import xml.etree.ElementTree as ET
+import zipfile
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.app.trackgen.writer import Track_Writer
+import tmns.io.kml as kml
+
+KML_NS = '{http://www.opengis.net/kml/2.2}'
+GX_NS  = '{http://www.google.com/kml/ext/2.2}'
+
+class kml_tests(unittest.TestCase):
+
+    def test_line_string(self):
+
+        points = np.array( [ [ -104.8, 39.5, 1806.0 ], [ -104.7, 39.6, 2000.5 ] ] )
+        line   = kml.Line_String( points = points, alt_mode = kml.Altitude_Mode.ABSOLUTE, tessellate = True )
+
+        content = line.as_kml()
+        self.assertIn( '<altitudeMode>absolute</altitudeMode>', content )
+        self.assertIn( '<tessellate>1</tessellate>', content )
+        self.assertIn( '-104.8000000,39.5000000,1806.00 -104.7000000,39.6000000,2000.50', content )
+
+        #  Point nodes are accepted as well
+        nodes = [ kml.Point( lon = -104.8, lat = 39.5, elev = 1806.0 ) ]
+        self.assertIn( '-104.8,39.5,1806.0', kml.Line_String( points = nodes ).as_kml() )
+
+    def test_gx_track(self):
+
+        track = kml.Gx_Track( unix_times = [ 0.0, 1.5 ],
+                              points     = np.array( [ [ 1.0, 2.0, 3.0 ], [ 4.0, 5.0, 6.0 ] ] ) )
+
+        writer = kml.Writer()
+        writer.add_node( kml.Placemark( name = 'track', geometry = track ) )
+
+        root  = ET.fromstring( writer.to_string() )
+        found = root.find( f'.//{GX_NS}Track' )
+
+        self.assertEqual( [ when.text for when in found.findall( f'{KML_NS}when' ) ],
+                          [ '1970-01-01T00:00:00.000Z', '1970-01-01T00:00:01.500Z' ] )
+        self.assertEqual( [ coord.text for coord in found.findall( f'{GX_NS}coord' ) ],
+                          [ '1.0000000 2.0000000 3.00', '4.0000000 5.0000000 6.00' ] )
+
+        with self.assertRaises( Exception ):
+            kml.Gx_Track( unix_times = [ 0.0 ], points = np.zeros( (2,3) ) )
+
+    def test_streaming(self):
+
+        count  = 2 * kml.WRITE_CHUNK_SIZE + 7
+        times  = np.arange( count, dtype = np.float64 )
+        points = np.column_stack( [ times * 1e-4, times * 1e-4, times ] )
+
+        writer = kml.Writer()
+        writer.add_node( kml.Placemark( name = 'track', geometry = kml.Gx_Track( unix_times = times, points = points ) ) )
+        writer.add_node( kml.Placemark( name = 'line', geometry = kml.Line_String( points = points ) ) )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            writer.write( os.path.join( tmp, 'doc.kml' ) )
+            with open( os.path.join( tmp, 'doc.kml' ) ) as fin:
+                streamed = fin.read()
+
+        #  Writing to a file and to a string give the same document
+        self.assertEqual( streamed, writer.to_string() )
+
+        root = ET.fromstring( streamed )
+        self.assertEqual( len( root.findall( f'.//{KML_NS}when' ) ), count )
+        self.assertEqual( len( root.findall( f'.//{GX_NS}coord' ) ), count )
+
+        coordinates = root.find( f'.//{KML_NS}coordinates' ).text.split()
+        self.assertEqual( len( coordinates ), count )
+        self.assertEqual( coordinates[-1], kml.format_coordinates( points[-1:] )[0] )
+
+    def test_stream_writer(self):
+
+        times  = np.arange( 5, dtype = np.float64 )
+        points = np.column_stack( [ times * 1e-4, times * 1e-4, times ] )
+
+        style  = kml.Style( id = 'missile', icon_style = kml.Icon_Style( icon = 'files/missile.png' ) )
+        tracks = [ kml.Placemark( name = f'track {idx}', geometry = kml.Gx_Track( unix_times = times + idx, points = points ) )
+                   for idx in range( 3 ) ]
+
+        #  The whole document held in memory
+        writer = kml.Writer()
+        writer.add_node( style )
+        folder = kml.Folder( 'missiles' )
+        for track in tracks:
+            folder.append_node( track )
+        writer.add_node( folder )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            for kmz in ( False, True ):
+                stream = kml.Stream_Writer( os.path.join( tmp, 'doc' ),
+                                            kml.Folder( 'missiles' ),
+                                            nodes = [ style ],
+                                            kmz = kmz )
+                for track in tracks:
+                    stream.add_node( track )
+                stream.close()
+
+            with open( os.path.join( tmp, 'doc.kml' ) ) as fin:
+                self.assertEqual( fin.read(), writer.to_string() )
+            with zipfile.ZipFile( os.path.join( tmp, 'doc.kmz' ) ) as archive:
+                self.assertEqual( archive.read( 'doc.kml' ).decode( 'utf-8' ), writer.to_string() )
+
+    def test_label_style(self):
+
+        style = kml.Style( id = 'labels', label_style = kml.Label_Style( scale = 0.5 ) )
+        self.assertIn( '<scale>0.5</scale>', style.as_kml() )
+
+    def test_writer_geometry(self):
+
+        times = np.arange( 21, dtype = np.float64 )
+        geog  = np.column_stack( [ np.full( 21, -104.8 ), np.full( 21, 39.5 ), 1806.0 + times ] )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            counts = {}
+            for geometry in [ 'track', 'line', 'points' ]:
+                writer = Track_Writer( os.path.join( tmp, f'{geometry}.kml' ),
+                                       kml_geometry = geometry,
+                                       kml_label_interval_sec = 5 )
+                writer.add_missile_block( midx = '1', unix_times = times, position = geog )
+                writer.write_all()
+
+                root = ET.parse( os.path.join( tmp, f'{geometry}.kml' ) ).getroot()
+                counts[geometry] = len( root.findall( f'.//{KML_NS}Placemark' ) )
+
+                #  Altitude modes are written by name, which is all Google Earth reads
+                modes = { node.text for node in root.iter( f'{KML_NS}altitudeMode' ) }
+                self.assertEqual( modes, { 'absolute' } )
+
+            #  One track plus labels at 0, 5, 10, 15 and 20 s, or one placemark per sample
+            self.assertEqual( counts, { 'track': 6, 'line': 6, 'points': 21 } )
+
+    def test_kmz(self):
+
+        times  = np.arange( 5000, dtype = np.float64 )
+        points = np.column_stack( [ times * 1e-4, times * 1e-4, times ] )
+
+        writer = kml.Writer()
+        writer.add_node( kml.Style( id = 'missile', icon_style = kml.Icon_Style( scale = 0.8, icon = 'files/icon.png' ) ) )
+        writer.add_node( kml.Placemark( name = 'track', geometry = kml.Gx_Track( unix_times = times, points = points ) ) )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            icon_path = os.path.join( tmp, 'icon.png' )
+            with open( icon_path, 'wb' ) as fout:
+                fout.write( b'not really a png' )
+
+            sizes = {}
+            for level in [ 0, 9 ]:
+                writer.write_kmz( os.path.join( tmp, f'level_{level}.kml' ),
+                                  compresslevel = level,
+                                  files = { 'files/icon.png': icon_path } )
+                sizes[level] = os.path.getsize( os.path.join( tmp, f'level_{level}.kmz' ) )
+
+            with zipfile.ZipFile( os.path.join( tmp, 'level_9.kmz' ) ) as archive:
+                self.assertEqual( archive.namelist(), [ 'doc.kml', 'files/icon.png' ] )
+                document = archive.read( 'doc.kml' ).decode( 'utf-8' )
+                self.assertEqual( archive.read( 'files/icon.png' ), b'not really a png' )
+
+        self.assertEqual( document, writer.to_string() )
+        self.assertIn( '<IconStyle>', document )
+        self.assertIn( '<href>files/icon.png</href>', document )
+        self.assertLess( sizes[9], sizes[0] / 3 )
+
+    def test_kmz_zip64(self):
+
+        times  = np.arange( 2000, dtype = np.float64 )
+        points = np.column_stack( [ times * 1e-4, times * 1e-4, times ] )
+
+        writer = kml.Writer()
+        writer.add_node( kml.Placemark( name = 'track', geometry = kml.Gx_Track( unix_times = times, points = points ) ) )
+
+        #  A small Zip64 limit stands in for a document larger than 2 GiB
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch( 'zipfile.ZIP64_LIMIT', 4096 ):
+                writer.write_kmz( os.path.join( tmp, 'large.kml' ) )
+
+            with zipfile.ZipFile( os.path.join( tmp, 'large.kmz' ) ) as archive:
+                self.assertEqual( archive.read( 'doc.kml' ).decode( 'utf-8' ), writer.to_string() )
+
+    def test_writer_kmz(self):
+
+        times = np.arange( 21, dtype = np.float64 )
+        geog  = np.column_stack( [ np.full( 21, -104.8 ), np.full( 21, 39.5 ), 1806.0 + times ] )
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            icon_path = os.path.join( tmp, 'missile.png' )
+            with open( icon_path, 'wb' ) as fout:
+                fout.write( b'icon' )
+
+            writer = Track_Writer( os.path.join( tmp, 'run.kml' ),
+                                   kml_label_interval_sec = 10,
+                                   kml_icon = icon_path )
+            writer.add_missile_block( midx = '1', unix_times = times, position = geog )
+            writer.write_all( [ 'kml', 'kmz' ] )
+
+            with zipfile.ZipFile( os.path.join( tmp, 'run.kmz' ) ) as archive:
+                self.assertIn( 'files/missile.png', archive.namelist() )
+                root = ET.fromstring( archive.read( 'doc.kml' ) )
+
+            #  Plain KML refers to the icon where it lies
+            with open( os.path.join( tmp, 'run.kml' ) ) as fin:
+                self.assertIn( f'<href>{icon_path}</href>', fin.read() )
+
+        self.assertEqual( root.find( f'.//{KML_NS}IconStyle/{KML_NS}Icon/{KML_NS}href' ).text, 'files/missile.png' )
+        self.assertEqual( len( root.findall( f'.//{KML_NS}Placemark[{KML_NS}styleUrl="#missile"]' ) ), 3 )
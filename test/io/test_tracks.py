@@ -0,0 +1,100 @@
+#  Python Standard Libraries
+import importlib.util
+import os
+import tempfile
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.app.trackgen.writer import Track_Writer
+from tmns.geo.coordinate      import geographic_to_ecf_many
+import tmns.io.tracks as tracks_io
+
+def build_writer( output_base ):
+
+    writer = Track_Writer( output_base )
+    for midx, count in [ ( '1', 50 ), ( '2', 30 ) ]:
+        times = 1000.0 + np.arange( count ) * 0.5
+        geog  = np.column_stack( [ np.full( count, -104.8 ), np.full( count, 39.5 ), 1806.0 + times - 1000.0 ] )
+        writer.add_missile_block( midx = midx,
+                                  unix_times = times,
+                                  position = geog,
+                                  position_ecf = geographic_to_ecf_many( geog ) )
+        writer.add_missile_event( midx = midx, name = 'launch', unix_time = 1000.0, position_ecf = [ 1.0, 2.0, 3.0 ] )
+    return writer
+
+
+class tracks_tests(unittest.TestCase):
+
+    def check_tracks( self, writer, path ):
+
+        tracks = tracks_io.load_tracks( path, missiles = [ 2 ], t_start = 1002.0, t_end = 1004.0 )
+        self.assertEqual( list( tracks.keys() ), [ '2' ] )
+
+        track = tracks['2']
+        np.testing.assert_array_equal( track.unix_time, [ 1002.0, 1002.5, 1003.0, 1003.5, 1004.0 ] )
+        np.testing.assert_allclose( track.position, writer.missile_positions( '2' )[4:9] )
+        np.testing.assert_allclose( track.position_ecf, writer.missile_block( '2' )[1][4:9] )
+
+        everything = tracks_io.load_tracks( path )
+        self.assertEqual( sorted( everything.keys() ), [ '1', '2' ] )
+        self.assertEqual( everything['1'].unix_time.shape, (50,) )
+
+    def test_npy(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            writer = build_writer( os.path.join( tmp, 'run.kml' ) )
+            writer.write_all( [ 'npy' ] )
+
+            path = os.path.join( tmp, 'run.tracks' )
+            self.check_tracks( writer, path )
+
+            #  Selected rows are views of the memory maps
+            track = tracks_io.load_tracks( path, missiles = [ '1' ] )['1']
+            self.assertIsInstance( track.unix_time.base, np.memmap )
+
+            events = tracks_io.load_npy_events( path )
+            self.assertEqual( events['1'][0]['name'], 'launch' )
+
+    @unittest.skipUnless( importlib.util.find_spec( 'pyarrow' ), 'pyarrow is not installed' )
+    def test_parquet(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            writer = build_writer( os.path.join( tmp, 'run.kml' ) )
+            writer.write_all( [ 'parquet' ] )
+
+            self.assertTrue( os.path.isdir( os.path.join( tmp, 'run.parquet', 'missile_id=1' ) ) )
+            self.check_tracks( writer, os.path.join( tmp, 'run.parquet' ) )
+
+            #  Missiles missing from a rerun do not survive in the dataset
+            rerun = Track_Writer( os.path.join( tmp, 'run.kml' ) )
+            rerun.add_missile_block( midx = '2', unix_times = [ 0.0 ], position_ecf = [ [ 6378137.0, 0.0, 0.0 ] ] )
+            rerun.write_all( [ 'parquet' ] )
+            self.assertEqual( list( tracks_io.load_tracks( os.path.join( tmp, 'run.parquet' ) ).keys() ), [ '2' ] )
+
+    def test_clear_partitions(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            path = os.path.join( tmp, 'run.parquet' )
+            for name in [ 'missile_id=1', 'missile_id=7', 'notes' ]:
+                os.makedirs( os.path.join( path, name ) )
+                with open( os.path.join( path, name, 'part-0.parquet' ), 'w' ) as fout:
+                    fout.write( 'stale' )
+
+            tracks_io.clear_partitions( path )
+            self.assertEqual( os.listdir( path ), [ 'notes' ] )
+
+            #  A dataset that does not exist yet is fine
+            tracks_io.clear_partitions( os.path.join( tmp, 'missing.parquet' ) )
+
+    @unittest.skipIf( importlib.util.find_spec( 'pyarrow' ), 'pyarrow is installed' )
+    def test_parquet_missing(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaisesRegex( Exception, 'pyarrow' ):
+                build_writer( os.path.join( tmp, 'run.kml' ) ).write_all( [ 'parquet' ] )
@@ -0,0 +1,38 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math import atmosphere
+
+class atmosphere_tests(unittest.TestCase):
+
+    def test_reference_values(self):
+
+        #  Geometric altitude [m], temperature [K], density [kg/m^3] from the 1976 tables
+        reference = np.array( [ [      0, 288.150, 1.2250e+00 ],
+                                [   5000, 255.676, 7.3643e-01 ],
+                                [  11000, 216.774, 3.6480e-01 ],
+                                [  20000, 216.650, 8.8910e-02 ],
+                                [  32000, 228.490, 1.3555e-02 ],
+                                [  50000, 270.650, 1.0269e-03 ],
+                                [  80000, 198.639, 1.8458e-05 ],
+                                [ 100000, 195.080, 5.6040e-07 ],
+                                [ 300000, 976.010, 1.9160e-11 ] ] )
+
+        np.testing.assert_allclose( atmosphere.temperature( reference[:,0] ), reference[:,1], rtol = 1e-4 )
+        np.testing.assert_allclose( atmosphere.density( reference[:,0] ), reference[:,2], rtol = 1e-3 )
+
+        self.assertAlmostEqual( float( atmosphere.pressure( 0.0 ) ), 101325.0, delta = 1e-6 )
+        self.assertAlmostEqual( float( atmosphere.speed_of_sound( 0.0 ) ), 340.294, delta = 1e-3 )
+
+    def test_vectorized_lookup(self):
+
+        altitudes = np.linspace( -500, 150000, 1001 )
+        densities = atmosphere.density( altitudes )
+
+        self.assertEqual( densities.shape, altitudes.shape )
+        self.assertTrue( np.all( np.diff( densities ) < 0 ) )
+        self.assertEqual( float( atmosphere.density( altitudes[10] ) ), densities[10] )
@@ -0,0 +1,41 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math import gravity
+
+class gravity_tests(unittest.TestCase):
+
+    def test_surface_magnitudes(self):
+
+        positions = np.array( [ [ gravity.R_EQ, 0, 0 ],
+                                [ 0, 0, 6356752.3142 ] ] )
+
+        g_point = np.linalg.norm( gravity.point_mass( positions ), axis = 1 )
+        g_j2    = np.linalg.norm( gravity.j2( positions ), axis = 1 )
+
+        #  Gravitation without the centrifugal term
+        self.assertAlmostEqual( g_j2[0], 9.8144, delta = 1e-3 )
+        self.assertAlmostEqual( g_j2[1], 9.8322, delta = 1e-3 )
+
+        #  J2 strengthens gravity at the equator and weakens it at the poles
+        self.assertGreater( g_j2[0], g_point[0] )
+        self.assertLess( g_j2[1], g_point[1] )
+
+    def test_batch_matches_single(self):
+
+        rng = np.random.default_rng( 5 )
+        positions = rng.normal( size = (100, 3) )
+        positions *= (gravity.R_EQ + rng.uniform( 0, 2.0e6, 100 ))[:,None] / np.linalg.norm( positions, axis = 1 )[:,None]
+
+        for func in ( gravity.point_mass, gravity.j2 ):
+            batch = func( positions )
+            self.assertEqual( batch.shape, (100, 3) )
+            for idx in range( 100 ):
+                np.testing.assert_allclose( func( positions[idx] )[0], batch[idx] )
+
+            #  Accelleration points towards the Earth
+            self.assertTrue( np.all( np.einsum( 'ij,ij->i', batch, positions ) < 0 ) )
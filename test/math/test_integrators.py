@@ -0,0 +1,45 @@
+#  Python Standard Libraries
+import math
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math.integrators import ( get_integrator,
+                                    RK45_Integrator )
+
+def oscillator( t, y ):
+    '''
+    Unit harmonic oscillator with state [position, velocity].
+    '''
+    return np.array( [ y[1], -y[0] ] )
+
+
+class integrator_tests(unittest.TestCase):
+
+    def error( self, name, dt, t1 = 10.0 ):
+
+        y, _ = get_integrator( name ).integrate( oscillator, 0.0, np.array( [1.0, 0.0] ), t1, dt = dt )
+        return abs( y[0] - math.cos( t1 ) )
+
+    def test_convergence_order(self):
+
+        #  Halving the step should cut the error by roughly 2^order
+        for name, order in ( ( 'euler', 1 ), ( 'rk4', 4 ) ):
+            ratio = self.error( name, 0.02 ) / self.error( name, 0.01 )
+            self.assertAlmostEqual( math.log2( ratio ), order, delta = 0.3 )
+
+    def test_adaptive_accuracy(self):
+
+        integrator = RK45_Integrator( rtol = 1e-10, atol = 1e-12 )
+
+        y, dt_next = integrator.integrate( oscillator, 0.0, np.array( [1.0, 0.0] ), 10.0, dt = 5.0 )
+
+        self.assertLess( abs( y[0] - math.cos( 10.0 ) ), 1e-8 )
+        self.assertLessEqual( dt_next, 5.0 * RK45_Integrator.MAX_FACTOR )
+
+    def test_unknown_integrator(self):
+
+        with self.assertRaises( Exception ):
+            get_integrator( 'leapfrog' )
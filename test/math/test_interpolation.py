@@ -0,0 +1,45 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math.interpolation import hermite
+
+class hermite_tests(unittest.TestCase):
+
+    def test_exact_for_cubic(self):
+
+        coeffs = np.array( [ [ 1.0, -2.0, 0.5, 0.25 ],
+                             [ 3.0,  0.0, -1.0, 0.1 ],
+                             [ -4.0, 5.0, 2.0, -0.3 ] ] )
+
+        def position( t ):
+            return coeffs @ np.array( [ 1.0, t, t * t, t ** 3 ] )
+
+        def velocity( t ):
+            return coeffs @ np.array( [ 0.0, 1.0, 2.0 * t, 3.0 * t * t ] )
+
+        times = np.linspace( 2.0, 7.0, 11 )
+        pos, vel = hermite( 2.0, position( 2.0 ), velocity( 2.0 ),
+                            7.0, position( 7.0 ), velocity( 7.0 ),
+                            times )
+
+        self.assertEqual( pos.shape, (11, 3) )
+        for idx, t in enumerate( times ):
+            np.testing.assert_allclose( pos[idx], position( t ), atol = 1e-9 )
+            np.testing.assert_allclose( vel[idx], velocity( t ), atol = 1e-9 )
+
+    def test_batched_states(self):
+
+        p0 = np.zeros( (4, 3) )
+        v0 = np.ones( (4, 3) )
+        p1 = np.full( (4, 3), 10.0 )
+
+        pos, vel = hermite( 0.0, p0, v0, 10.0, p1, v0, [ 0.0, 5.0, 10.0 ] )
+
+        self.assertEqual( pos.shape, (3, 4, 3) )
+        np.testing.assert_allclose( pos[1], 5.0 )
+        np.testing.assert_allclose( pos[2], p1 )
+        np.testing.assert_allclose( vel, 1.0 )
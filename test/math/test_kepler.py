@@ -0,0 +1,61 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math             import ( gravity,
+                                    kepler )
+from tmns.math.integrators import RK45_Integrator
+
+def two_body( t, y ):
+    dy = np.empty( 6 )
+    dy[:3] = y[3:]
+    dy[3:] = gravity.point_mass( y[:3] )[0]
+    return dy
+
+
+class kepler_tests(unittest.TestCase):
+
+    def check_against_integration( self, r0, v0, times ):
+
+        r, v = kepler.propagate( r0, v0, times )
+        self.assertEqual( r.shape, (len( times ), 3) )
+
+        integrator = RK45_Integrator( rtol = 1e-12, atol = 1e-6 )
+        for idx, t in enumerate( times ):
+            y, _ = integrator.integrate( two_body, 0.0, np.concatenate( [ r0, v0 ] ), t, dt = 10.0 )
+            np.testing.assert_allclose( r[idx], y[:3], atol = 1e-2 )
+            np.testing.assert_allclose( v[idx], y[3:], atol = 1e-5 )
+
+    def test_ballistic_arc(self):
+
+        r0 = np.array( [ -1275000.0, -4797000.0, 4076000.0 ] )
+        v0 = np.array( [ 1500.0, -800.0, 2500.0 ] )
+        self.check_against_integration( r0, v0, np.array( [ 0.0, 1.0, 60.0, 300.0, 900.0 ] ) )
+
+    def test_hyperbolic(self):
+
+        r0 = np.array( [ 7000000.0, 0.0, 0.0 ] )
+        v0 = np.array( [ 0.0, 12000.0, 1000.0 ] )
+        self.check_against_integration( r0, v0, np.array( [ 10.0, 500.0, 2000.0 ] ) )
+
+    def test_conserves_energy(self):
+
+        r0 = np.array( [ 6578137.0, 0.0, 0.0 ] )
+        v0 = np.array( [ 0.0, 7000.0, 3000.0 ] )
+
+        r, v = kepler.propagate( r0, v0, np.linspace( 0, 20000, 2001 ) )
+
+        energy = 0.5 * np.einsum( 'ij,ij->i', v, v ) - gravity.GM / np.linalg.norm( r, axis = 1 )
+        angular = np.cross( r, v )
+
+        np.testing.assert_allclose( energy, energy[0], rtol = 1e-9 )
+        np.testing.assert_allclose( angular, np.broadcast_to( angular[0], angular.shape ), atol = 1e-9 * np.linalg.norm( angular[0] ) )
+
+    def test_stumpff_series(self):
+
+        z = np.array( [ -2e-6, -1e-7, 0.0, 1e-7, 2e-6 ] )
+        np.testing.assert_allclose( kepler.stumpff_c( z ), 0.5 - z / 24.0, rtol = 1e-9 )
+        np.testing.assert_allclose( kepler.stumpff_s( z ), 1.0 / 6.0 - z / 120.0, rtol = 1e-9 )
@@ -0,0 +1,218 @@
+#  Python Standard Libraries
+import math
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math.rotations import ( Axis,
+                                  Compact_Quaternion,
+                                  euler_angles_to_rotation_matrix,
+                                  Quaternion,
+                                  Quaternion_Array,
+                                  rotation_matrix )
+
+#  Number of random samples per property
+SAMPLES = 500
+
+AXES = [ Axis.X, Axis.Y, Axis.Z ]
+
+def random_quaternion_array( rng, count = SAMPLES ):
+    return Quaternion_Array( data = rng.normal( size = (count, 4) ) )
+
+
+class quaternion_array_tests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng( 42 )
+
+    def assert_matches_scalar( self, q_array, q_scalars, atol = 1e-12 ):
+
+        self.assertEqual( len(q_array), len(q_scalars) )
+        for idx, q in enumerate( q_scalars ):
+            np.testing.assert_allclose( q_array.data[idx], q.data, rtol = 0, atol = atol )
+
+    def test_multiply(self):
+
+        qa = random_quaternion_array( self.rng )
+        qb = random_quaternion_array( self.rng )
+
+        self.assert_matches_scalar( qa * qb, [ qa[i] * qb[i] for i in range( SAMPLES ) ] )
+
+        #  Broadcast a single quaternion from either side
+        q = qa[0]
+        self.assert_matches_scalar( qb * q, [ qb[i] * q for i in range( SAMPLES ) ] )
+        self.assert_matches_scalar( q * qb, [ q * qb[i] for i in range( SAMPLES ) ] )
+        self.assert_matches_scalar( qa * 2.5, [ qa[i] * 2.5 for i in range( SAMPLES ) ] )
+
+    def test_conj_normalize_inverse(self):
+
+        qa = random_quaternion_array( self.rng )
+
+        self.assert_matches_scalar( qa.conj(), [ qa[i].conj() for i in range( SAMPLES ) ] )
+        self.assert_matches_scalar( qa.normalize(), [ qa[i].normalize() for i in range( SAMPLES ) ] )
+        self.assert_matches_scalar( qa.inverse(), [ qa[i].inverse() for i in range( SAMPLES ) ] )
+        np.testing.assert_allclose( qa.mag(), [ qa[i].mag() for i in range( SAMPLES ) ] )
+        self.assertTrue( np.all( qa.normalize().is_normalized() ) )
+
+        with self.assertRaises( ArithmeticError ):
+            Quaternion_Array( data = np.zeros( (2,4) ) ).inverse()
+
+    def test_rotation_matrix_round_trip(self):
+
+        qa = random_quaternion_array( self.rng ).normalize()
+
+        matrices = qa.to_rotation_matrix()
+        self.assertEqual( matrices.shape, (SAMPLES, 3, 3) )
+
+        for idx in range( SAMPLES ):
+            np.testing.assert_allclose( matrices[idx], qa[idx].to_rotation_matrix(), rtol = 0, atol = 1e-12 )
+
+        #  Each row must take the same branch as the scalar conversion
+        q_back = Quaternion_Array.from_rotation_matrix( matrices )
+        self.assert_matches_scalar( q_back, [ Quaternion.from_rotation_matrix( M ) for M in matrices ], atol = 1e-9 )
+        np.testing.assert_allclose( q_back.to_rotation_matrix(), matrices, rtol = 0, atol = 1e-9 )
+
+    def test_from_euler_angles(self):
+
+        angles = self.rng.uniform( -math.pi, math.pi, size = (SAMPLES, 3) )
+
+        for _ in range( 5 ):
+            axes = [ AXES[i] for i in self.rng.integers( 0, 3, size = 3 ) ]
+
+            qa = Quaternion_Array.from_euler_angles( axes[0], angles[:,0],
+                                                     axes[1], angles[:,1],
+                                                     axes[2], angles[:,2] )
+
+            expected = [ Quaternion.from_euler_angles( axes[0], a[0], axes[1], a[1], axes[2], a[2] ) for a in angles ]
+            self.assert_matches_scalar( qa, expected )
+
+        #  Scalars broadcast against arrays
+        qa = Quaternion_Array.from_euler_angles( Axis.Y, angles[:,0], Axis.X, 0.0, Axis.Z, 0.25 )
+        self.assertEqual( len(qa), SAMPLES )
+
+    def test_from_angle_axis(self):
+
+        angles = self.rng.uniform( -math.pi, math.pi, size = SAMPLES )
+        axes   = self.rng.normal( size = (SAMPLES, 3) )
+
+        qa = Quaternion_Array.from_angle_axis( angles, axes )
+        self.assert_matches_scalar( qa, [ Quaternion.from_angle_axis( a, v ) for a, v in zip( angles, axes ) ] )
+
+
+class compact_quaternion_tests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng( 7 )
+
+    def assert_same( self, qc, q, atol = 1e-12 ):
+        np.testing.assert_allclose( qc.data, q.data, rtol = 0, atol = atol )
+
+    def test_matches_quaternion(self):
+
+        for _ in range( SAMPLES ):
+            a = Quaternion( *self.rng.normal( size = 4 ) )
+            b = Quaternion( *self.rng.normal( size = 4 ) )
+
+            ca = Compact_Quaternion.from_quaternion( a )
+            cb = Compact_Quaternion.from_quaternion( b )
+
+            self.assert_same( ca * cb, a * b )
+            self.assert_same( ca * b, a * b )
+            self.assert_same( ca.conj(), a.conj() )
+            self.assert_same( ca.normalize(), a.normalize() )
+            self.assert_same( ca.inverse(), a.inverse() )
+            np.testing.assert_allclose( ca.to_rotation_matrix(), a.to_rotation_matrix(), rtol = 0, atol = 1e-12 )
+
+            #  Mixed products return the left-hand type
+            self.assertIsInstance( a * cb, Quaternion )
+            self.assertIsInstance( ca * b, Compact_Quaternion )
+
+            #  Mixed sums and differences too
+            self.assert_same( ca + b, a + b )
+            self.assert_same( ca - b, a - b )
+            self.assertIsInstance( ca + b, Compact_Quaternion )
+            np.testing.assert_allclose( ( a - cb ).data, ( a - b ).data, rtol = 0, atol = 1e-12 )
+            self.assertIsInstance( a + cb, Quaternion )
+
+    def test_in_place(self):
+
+        a = Compact_Quaternion( *self.rng.normal( size = 4 ) )
+        b = Compact_Quaternion( *self.rng.normal( size = 4 ) )
+
+        expected = a * b
+        result   = a.imul( b )
+        self.assertIs( result, a )
+        self.assert_same( a, expected.to_quaternion() )
+
+        a.normalize_()
+        self.assertTrue( a.is_normalized() )
+
+    def test_quaternion_interface(self):
+
+        q  = Quaternion( *self.rng.normal( size = 4 ) )
+        qc = Compact_Quaternion.from_quaternion( q )
+
+        #  Accessors and data read the same as the array-backed type
+        for name in [ 'w', 'x', 'y', 'z', 'get_real' ]:
+            self.assertEqual( getattr( qc, name )(), getattr( q, name )() )
+        np.testing.assert_array_equal( qc.get_imaginary(), q.get_imaginary() )
+        np.testing.assert_array_equal( qc.data, q.data )
+        np.testing.assert_allclose( qc.to_directional_cosine_matrix(), q.to_directional_cosine_matrix(), rtol = 0, atol = 1e-12 )
+
+        #  Call sites that take quaternions accept either type
+        qa = Quaternion_Array.from_quaternions( [ q, qc ] )
+        np.testing.assert_array_equal( qa.data[0], qa.data[1] )
+        self.assert_same( q * qc, q * q )
+
+        qc.set_real( 2.0 )
+        qc.set_imaginary( [ 3.0, 4.0, 5.0 ] )
+        np.testing.assert_array_equal( qc.data, [ 2.0, 3.0, 4.0, 5.0 ] )
+
+        qc.data = q.data
+        self.assertEqual( qc.z(), q.z() )
+
+    def test_from_euler_angles(self):
+
+        for angles in self.rng.uniform( -math.pi, math.pi, size = (SAMPLES, 3) ):
+            qc = Compact_Quaternion.from_euler_angles( Axis.Y, angles[0], Axis.X, angles[1], Axis.Z, angles[2] )
+            q  = Quaternion.from_euler_angles( Axis.Y, angles[0], Axis.X, angles[1], Axis.Z, angles[2] )
+            self.assert_same( qc, q )
+
+
+class rotation_matrix_tests(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng( 11 )
+
+    def test_batch_matches_scalar(self):
+
+        angles = self.rng.uniform( -math.pi, math.pi, size = (SAMPLES, 3) )
+
+        for axis in AXES:
+            stacked = rotation_matrix( axis, angles[:,0] )
+            self.assertEqual( stacked.shape, (SAMPLES, 3, 3) )
+            for idx in range( SAMPLES ):
+                np.testing.assert_array_equal( stacked[idx], rotation_matrix( axis, angles[idx,0] ) )
+
+        stacked = euler_angles_to_rotation_matrix( Axis.Z, angles[:,0],
+                                                   Axis.Y, angles[:,1],
+                                                   Axis.X, angles[:,2] )
+        for idx in range( SAMPLES ):
+            single = euler_angles_to_rotation_matrix( Axis.Z, angles[idx,0],
+                                                      Axis.Y, angles[idx,1],
+                                                      Axis.X, angles[idx,2] )
+            np.testing.assert_array_equal( stacked[idx], single )
+            np.testing.assert_allclose( single, rotation_matrix( Axis.X, angles[idx,2] )
+                                              @ rotation_matrix( Axis.Y, angles[idx,1] )
+                                              @ rotation_matrix( Axis.Z, angles[idx,0] ), rtol = 0, atol = 1e-15 )
+
+    def test_broadcast_grid(self):
+
+        pitch = np.linspace( 0, math.pi / 2, 7 )[:,None]
+        yaw   = np.linspace( -math.pi, math.pi, 5 )[None,:]
+
+        grid = euler_angles_to_rotation_matrix( Axis.Y, pitch, Axis.X, 0.0, Axis.Z, yaw )
+        self.assertEqual( grid.shape, (7, 5, 3, 3) )
+        np.testing.assert_array_equal( grid[3,2], euler_angles_to_rotation_matrix( Axis.Y, pitch[3,0], Axis.X, 0.0, Axis.Z, yaw[0,2] ) )
@@ -0,0 +1,49 @@
+'''
+Motion models shared by the simulation tests.
+'''
+
+#  Python Standard Libraries
+import math
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.math.integrators import get_integrator
+from tmns.sim.motion       import Straight_Model
+
+def build_model( integrator = 'rk4', **kwargs ):
+
+    options = dict( position_geog = np.array( [-104.844892, 39.545218, 1806.0] ),
+                    mass_kg = 900,
+                    radius_m = 0.25,
+                    thrust_kN = 107873.15,
+                    air_mass_density = 1.2,
+                    drag_coefficient = 0.05,
+                    pitch_rad = math.radians( 60 ),
+                    yaw_rad = math.radians( -45 ),
+                    start_time_offset_sec = 10,
+                    burn_time_sec = 60,
+                    integrator = get_integrator( integrator ) )
+    options.update( kwargs )
+
+    return Straight_Model( **options )
+
+
+def build_models( integrator = 'rk4' ):
+    '''
+    Missiles with launches and burnouts that do not line up with the time step.
+    '''
+    models = []
+    for idx, (start, burn, pitch, gravity, atmos) in enumerate( [ ( 0.0,  60.0, 60, 'constant',   'constant' ),
+                                                                   ( 3.5,  45.0, 70, 'j2',         'us1976' ),
+                                                                   ( 12.0, 30.0, 45, 'point_mass', 'constant' ),
+                                                                   ( 40.0, 20.0, 80, 'constant',   'us1976' ) ] ):
+        models.append( build_model( integrator,
+                                    position_geog = np.array( [-104.844892 + idx, 39.545218, 1806.0] ),
+                                    pitch_rad = math.radians( pitch ),
+                                    start_time_offset_sec = start,
+                                    burn_time_sec = burn,
+                                    atmosphere_model = atmos,
+                                    gravity_model = gravity ) )
+    return models
@@ -0,0 +1,72 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.sim.engine       import ( Batch_Engine,
+                                    Batch_Model )
+from tmns.sim.events       import EVENT_IMPACT
+from tmns.sim.missile      import Missile
+
+from sim_models import build_models
+
+class batch_engine_tests(unittest.TestCase):
+
+    def run_both( self, integrator, t_step, t_max = 2000 ):
+
+        objects = build_models( integrator )
+        engine  = Batch_Engine( build_models( integrator ) )
+
+        t = 0.0
+        while t < t_max and not (engine.impacted.all() and all( model.is_finished() for model in objects )):
+            for model in objects:
+                if not model.is_finished():
+                    model.update( t_step )
+            engine.update( t_step )
+            t += t_step
+
+        return objects, engine
+
+    def test_matches_object_models(self):
+
+        objects, engine = self.run_both( 'rk4', 5.0 )
+
+        self.assertTrue( engine.impacted.all() )
+        for idx, model in enumerate( objects ):
+
+            self.assertEqual( [ e.name for e in model.events ], [ e.name for e in engine.events[idx] ] )
+
+            for expected, actual in zip( model.events, engine.events[idx] ):
+                self.assertAlmostEqual( expected.time, actual.time, delta = 1e-6 )
+                np.testing.assert_allclose( expected.position_ecf, actual.position_ecf, atol = 1e-3 )
+
+    def test_adaptive_integrator(self):
+
+        objects, engine = self.run_both( 'rk45', 10.0 )
+
+        for idx, model in enumerate( objects ):
+            expected = model.events[-1]
+            actual   = engine.events[idx][-1]
+            self.assertEqual( actual.name, EVENT_IMPACT )
+            self.assertAlmostEqual( expected.time, actual.time, delta = 0.05 )
+
+    def test_missiles_become_views(self):
+
+        missiles = [ Missile( idx, model ) for idx, model in enumerate( build_models() ) ]
+        engine   = Batch_Engine.from_missiles( missiles )
+
+        for missile in missiles:
+            self.assertIsInstance( missile.motion_model, Batch_Model )
+
+        #  The first view to update advances every missile
+        missiles[0].update( 5.0 )
+        self.assertEqual( engine.t_cur, 5.0 )
+        for missile in missiles[1:]:
+            missile.update( 5.0 )
+        self.assertEqual( engine.t_cur, 5.0 )
+
+        np.testing.assert_array_equal( missiles[2].info()['position_ecf'], engine.P[2] )
+        self.assertEqual( len( missiles[0].events() ), 1 )
+        self.assertEqual( len( missiles[3].events() ), 0 )
@@ -0,0 +1,96 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.geo.coordinate   import ecf_to_geographic
+from tmns.sim.events       import ( EVENT_BURNOUT,
+                                    EVENT_COAST,
+                                    EVENT_IMPACT,
+                                    EVENT_LAUNCH,
+                                    EVENT_REENTRY )
+
+from sim_models import build_model
+
+class straight_model_event_tests(unittest.TestCase):
+
+    def run_until_impact( self, model, t_step, t_max = 2000 ):
+
+        while model.t_cur < t_max and not model.is_finished():
+            model.update( t_step )
+        return { event.name: event for event in model.events }
+
+    def test_events_hit_exact_times(self):
+
+        #  Steps that do not line up with launch or burnout
+        model  = build_model()
+        events = self.run_until_impact( model, 7.0 )
+
+        self.assertEqual( events[EVENT_LAUNCH].time, 10.0 )
+        self.assertEqual( events[EVENT_BURNOUT].time, 70.0 )
+        self.assertIn( EVENT_IMPACT, events )
+
+        impact_alt = ecf_to_geographic( events[EVENT_IMPACT].position_ecf )[2,0]
+        self.assertAlmostEqual( impact_alt, model.ground_altitude_m, delta = 0.01 )
+        np.testing.assert_allclose( model.P_cur.reshape(3), events[EVENT_IMPACT].position_ecf )
+
+    def test_impact_time_independent_of_step(self):
+
+        small = self.run_until_impact( build_model(), 1.0 )
+        large = self.run_until_impact( build_model( 'rk45' ), 25.0 )
+
+        self.assertAlmostEqual( small[EVENT_IMPACT].time, large[EVENT_IMPACT].time, delta = 0.05 )
+
+    def test_evaluations_independent_of_launch_alignment(self):
+
+        #  A step clipped at launch or burnout must not shrink the fixed steps that follow
+        counts = []
+        for start in [ 10.0, 14.99 ]:
+            model = build_model( start_time_offset_sec = start )
+
+            calls = [ 0 ]
+            derivative = model.derivative
+            def counted( t, y ):
+                calls[0] += 1
+                return derivative( t, y )
+            model.derivative = counted
+
+            self.run_until_impact( model, 5.0 )
+            counts.append( calls[0] )
+
+        self.assertLess( abs( counts[0] - counts[1] ), 0.1 * counts[0] )
+
+    def test_stops_after_impact(self):
+
+        model = build_model()
+        self.run_until_impact( model, 10.0 )
+        self.assertTrue( model.is_finished() )
+
+        position = np.copy( model.P_cur )
+        model.update( 10.0 )
+        np.testing.assert_array_equal( model.P_cur, position )
+
+    def test_coast_matches_integration(self):
+
+        options = dict( atmosphere_model = 'us1976', gravity_model = 'point_mass' )
+
+        integrated = self.run_until_impact( build_model( 'rk45', **options ), 10.0, t_max = 3000 )
+
+        model  = build_model( 'rk45', coast_density_kg_m3 = 1e-7, **options )
+        coast  = self.run_until_impact( model, 10.0, t_max = 3000 )
+
+        self.assertIn( EVENT_COAST, coast )
+        self.assertIn( EVENT_REENTRY, coast )
+
+        #  Re-entry is at the altitude where the threshold density is reached
+        reentry_alt = ecf_to_geographic( coast[EVENT_REENTRY].position_ecf )[2,0]
+        self.assertAlmostEqual( reentry_alt, model.coast_altitude_m, delta = 0.01 )
+
+        self.assertAlmostEqual( integrated[EVENT_IMPACT].time, coast[EVENT_IMPACT].time, delta = 0.05 )
+
+        #  The conic is a two-body orbit, so other gravity models are rejected
+        for gravity in [ 'constant', 'j2' ]:
+            with self.assertRaises( Exception ):
+                build_model( coast_density_kg_m3 = 1e-7, atmosphere_model = 'us1976', gravity_model = gravity )
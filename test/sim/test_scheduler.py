@@ -0,0 +1,55 @@
+#  Python Standard Libraries
+import configparser
+import logging
+import math
+import unittest
+
+#  Terminus Libraries
+from tmns.app.trackgen.sim import simulate_ticks
+from tmns.sim.missile      import Missile
+from tmns.sim.scheduler    import Scheduler
+
+from sim_models import build_model
+
+class scheduler_tests(unittest.TestCase):
+
+    def test_steps_only_live_missiles(self):
+
+        starts   = [ 3000.0, 12.5, 600.0 ]
+        missiles = [ Missile( idx, build_model( 'rk45', start_time_offset_sec = start ) ) for idx, start in enumerate( starts ) ]
+
+        #  Count updates per missile
+        updates = { missile.id: 0 for missile in missiles }
+        for missile in missiles:
+            def counted( t_delta, missile = missile, update = missile.update ):
+                updates[missile.id] += 1
+                update( t_delta )
+            missile.update = counted
+
+        self.assertEqual( Scheduler( missiles ).next_launch_time(), 12.5 )
+
+        t_step   = 10.0
+        cfg_args = configparser.ConfigParser()
+        cfg_args.read_dict( { 'general': { 'simulation_time_secs': '100000',
+                                           'step_time_ms':         str( t_step * 1000 ),
+                                           'start_time_unix':      '0' } } )
+
+        batches = list( simulate_ticks( cfg_args, missiles, logging.getLogger( 'test' ) ) )
+
+        #  Missiles enter the output as they launch and leave it at impact
+        samples = [ ( t, midx ) for batch in batches for t, midx in zip( batch.unix_times, batch.midx ) ]
+        first   = { midx: t for t, midx in reversed( samples ) }
+        last    = { midx: t for t, midx in samples }
+        self.assertEqual( sorted( first, key = first.get ), [ 1, 2, 0 ] )
+        self.assertEqual( sorted( last, key = last.get ), [ 1, 2, 0 ] )
+
+        #  Each missile is stepped from the tick before launch to the tick of impact
+        for missile, start in zip( missiles, starts ):
+            events = { event.name: event.time for event in missile.events() }
+            self.assertEqual( events['launch'], start )
+            self.assertEqual( last[missile.id], events['impact'] )
+            first_tick = math.ceil( start / t_step ) - 1
+            self.assertEqual( updates[missile.id], math.floor( events['impact'] / t_step ) - first_tick + 1 )
+
+        #  Ticks with nothing in flight are skipped rather than visited
+        self.assertLess( len( batches ), max( last.values() ) / t_step / 2 )
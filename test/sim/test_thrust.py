@@ -0,0 +1,57 @@
+#  Python Standard Libraries
+import unittest
+
+#  Numerical Python
+import numpy as np
+
+#  Terminus Libraries
+from tmns.sim.engine import Batch_Engine
+from tmns.sim.thrust import ( get_thrust_direction,
+                              THRUST_GRAVITY_TURN,
+                              THRUST_LAUNCH_FRAME,
+                              THRUST_LOCAL_FRAME,
+                              THRUST_VELOCITY )
+
+from sim_models import build_models
+
+class thrust_direction_tests(unittest.TestCase):
+
+    def test_directions(self):
+
+        forward_ecf = np.array( [ [ 0.0, 0.6, 0.8 ], [ 0.0, 0.6, 0.8 ] ] )
+        V           = np.array( [ [ 0.1, 0.0, 0.0 ], [ 0.0, 300.0, 400.0 ] ] )
+        t_flight    = np.array( [ 1.0, 20.0 ] )
+
+        launch = get_thrust_direction( THRUST_LAUNCH_FRAME ).directions( t_flight, V, None, forward_ecf )
+        np.testing.assert_array_equal( launch, forward_ecf )
+
+        #  Slow rows keep the launch direction
+        aligned = get_thrust_direction( THRUST_VELOCITY ).directions( t_flight, V, None, forward_ecf )
+        np.testing.assert_allclose( aligned, [ [ 0.0, 0.6, 0.8 ], [ 0.0, 0.6, 0.8 ] ] )
+
+        #  Before the turn the launch direction is held even when moving
+        V[1] = [ 500.0, 0.0, 0.0 ]
+        turn = get_thrust_direction( THRUST_GRAVITY_TURN, turn_start_sec = 30.0 ).directions( t_flight, V, None, forward_ecf )
+        np.testing.assert_allclose( turn, forward_ecf )
+
+        turn = get_thrust_direction( THRUST_GRAVITY_TURN, turn_start_sec = 10.0 ).directions( t_flight, V, None, forward_ecf )
+        np.testing.assert_allclose( turn[1], [ 1.0, 0.0, 0.0 ] )
+
+    def test_engine_matches_models(self):
+
+        names   = [ THRUST_LOCAL_FRAME, THRUST_LAUNCH_FRAME, THRUST_VELOCITY, THRUST_GRAVITY_TURN ]
+        objects = build_models()
+        batch   = build_models()
+        for idx, name in enumerate( names ):
+            objects[idx].thrust_direction = get_thrust_direction( name )
+            batch[idx].thrust_direction   = get_thrust_direction( name )
+            objects[idx].start_time_offset_sec = batch[idx].start_time_offset_sec = 0.0
+
+        engine = Batch_Engine( batch )
+        for _ in range( 30 ):
+            for model in objects:
+                model.update( 5.0 )
+            engine.update( 5.0 )
+
+        for idx, model in enumerate( objects ):
+            np.testing.assert_allclose( model.P_cur.reshape(3), engine.P[idx], atol = 1e-3 )